@@ -1,36 +1,200 @@
 # Bu araç @keyiflerolsun tarafından | @KekikAkademi için yazılmıştır.
 
-from Libs import global_request
+from CLI         import konsol
+from Libs        import global_request
+from Settings    import GEOIP_DB_PATH, GEOIP_CACHE_SIZE, GEOIP_CACHE_TTL, GEOIP_NEGATIVE_TTL
+from collections import OrderedDict
+from time        import monotonic
+import asyncio
 
-_ip_cache: dict[str, dict[str, str]] = {}
+# ip-api toplu sorgu (tek POST'ta en fazla 100 IP)
+IP_API_BATCH_URL  = "http://ip-api.com/batch?fields=status,country,regionName,city,isp,org,as,query"
+IP_API_BATCH_SIZE = 100
 
-async def ip_log(hedef_ip: str) -> dict[str, str]:
-    # Manuel cache - lru_cache async ile çalışmaz
-    if hedef_ip in _ip_cache:
-        return _ip_cache[hedef_ip]
+VERI_YOK = {"hata": "Veri Bulunamadı.."}
+
+class IpApiBackend:
+    """ip-api.com toplu POST (ağ üzerinden)"""
+    name = "ip-api"
+
+    @staticmethod
+    def _sonuc(veri: dict) -> dict[str, str]:
+        if veri.get("status") == "fail":
+            return VERI_YOK
+
+        return {
+            "ulke"   : veri.get("country") or "",
+            "il"     : veri.get("regionName") or "",
+            "ilce"   : veri.get("city") or "",
+            "isp"    : veri.get("isp") or "",
+            "sirket" : veri.get("org") or "",
+            "host"   : veri.get("as") or ""
+        }
+
+    async def lookup(self, hedef_ipler: list[str]) -> dict[str, dict[str, str]]:
+        sonuclar = {}
+        for i in range(0, len(hedef_ipler), IP_API_BATCH_SIZE):
+            grup = hedef_ipler[i:i + IP_API_BATCH_SIZE]
+            try:
+                # POST idempotent değil - tekrar denenmez, hata grubun tamamına yazılır
+                response = await global_request.fetch(IP_API_BATCH_URL, method="POST", json=grup, timeout=5, deadline=monotonic() + 5)
+                cevaplar = {veri.get("query"): self._sonuc(veri) for veri in response.json()}
+            except Exception as hata:
+                cevaplar   = {}
+                hata_sonuc = {"hata": f"{type(hata).__name__} » {hata}"}
+            else:
+                hata_sonuc = VERI_YOK
+
+            for ip in grup:
+                sonuclar[ip] = cevaplar.get(ip, hata_sonuc)
+
+        return sonuclar
+
+class MaxMindBackend:
+    """
+    Yerel MaxMind / DB-IP `.mmdb` dosyası (ağ isteği yok, `pip install maxminddb` gerekir)
+    - City veritabanından ülke / il / ilçe, ASN veritabanından ya da ikisini içeren dosyadan sağlayıcı okunur
+    """
+    name = "mmdb"
+
+    def __init__(self, path: str):
+        import maxminddb
+
+        self.reader = maxminddb.open_database(path)
+
+    @staticmethod
+    def _isim(kayit: dict | None) -> str:
+        return ((kayit or {}).get("names") or {}).get("en") or ""
+
+    def _sonuc(self, ip: str) -> dict[str, str]:
+        try:
+            kayit = self.reader.get(ip)
+        except ValueError:
+            kayit = None
+
+        if not kayit:
+            return VERI_YOK
+
+        asn_no  = kayit.get("autonomous_system_number")
+        asn_org = kayit.get("autonomous_system_organization") or ""
+        return {
+            "ulke"   : self._isim(kayit.get("country")),
+            "il"     : self._isim((kayit.get("subdivisions") or [None])[0]),
+            "ilce"   : self._isim(kayit.get("city")),
+            "isp"    : asn_org,
+            "sirket" : asn_org,
+            "host"   : f"AS{asn_no} {asn_org}" if asn_no else ""
+        }
+
+    async def lookup(self, hedef_ipler: list[str]) -> dict[str, dict[str, str]]:
+        # mmap üzerinden okuma mikrosaniyeler sürer, thread'e gerek yok
+        return {ip: self._sonuc(ip) for ip in hedef_ipler}
+
+class GeoIPResolver:
+    """
+    IP konum çözücü
+    - LRU + TTL cache; hata / veri yok sonuçları daha kısa `negative_ttl` ile saklanır
+    - Aynı IP için eşzamanlı sorgular tek backend çağrısında birleştirilir
+    - Backend değiştirilebilir: ip-api (varsayılan) ya da yerel `.mmdb` dosyası (GEOIP_DB_PATH)
+    """
+
+    def __init__(self, backend, max_items: int = 50000, ttl: int = 86400, negative_ttl: int = 300):
+        self.backend      = backend
+        self.max_items    = max_items
+        self.ttl          = ttl
+        self.negative_ttl = negative_ttl
+
+        self.hits    = 0
+        self.misses  = 0
+        self.lookups = 0
+
+        self._cache    : OrderedDict[str, tuple[float, dict]] = OrderedDict()
+        self._inflight : dict[str, asyncio.Future]            = {}
+
+    def _get(self, hedef_ip: str) -> dict | None:
+        kayit = self._cache.get(hedef_ip)
+        if kayit is None:
+            return None
+
+        if kayit[0] <= monotonic():
+            del self._cache[hedef_ip]
+            return None
+
+        self._cache.move_to_end(hedef_ip)
+        return kayit[1]
+
+    def _store(self, hedef_ip: str, sonuc: dict):
+        ttl = self.negative_ttl if "hata" in sonuc else self.ttl
+        self._cache[hedef_ip] = (monotonic() + ttl, sonuc)
+        self._cache.move_to_end(hedef_ip)
+        while len(self._cache) > self.max_items:
+            self._cache.popitem(last=False)
+
+    async def resolve(self, hedef_ip: str) -> dict[str, str]:
+        return (await self.resolve_many([hedef_ip]))[hedef_ip]
+
+    async def resolve_many(self, hedef_ipler: list[str]) -> dict[str, dict[str, str]]:
+        """IP'leri cache'ten, devam eden sorgulardan ya da tek backend çağrısıyla çöz"""
+        sonuclar  = {}
+        bekleyen  = {}
+        eksikler  = []
+        for ip in dict.fromkeys(hedef_ipler):
+            if (sonuc := self._get(ip)) is not None:
+                self.hits   += 1
+                sonuclar[ip] = sonuc
+            elif ip in self._inflight:
+                self.hits   += 1
+                bekleyen[ip] = self._inflight[ip]
+            else:
+                self.misses  += 1
+                eksikler.append(ip)
+
+        if eksikler:
+            loop = asyncio.get_running_loop()
+            for ip in eksikler:
+                self._inflight[ip] = loop.create_future()
+
+            cevaplar = {}
+            try:
+                self.lookups += 1
+                cevaplar      = await self.backend.lookup(eksikler)
+            except Exception as hata:
+                cevaplar = {ip: {"hata": f"{type(hata).__name__} » {hata}"} for ip in eksikler}
+            finally:
+                for ip in eksikler:
+                    future = self._inflight.pop(ip)
+                    # İptal edilen sorgunun sonucu saklanmaz, bekleyenlere hata döner
+                    sonuc  = cevaplar.get(ip) or {"hata": "Sorgu iptal edildi.."}
+                    if ip in cevaplar:
+                        self._store(ip, sonuc)
+                    future.set_result(sonuc)
+                    sonuclar[ip] = sonuc
+
+        for ip, future in bekleyen.items():
+            sonuclar[ip] = await asyncio.shield(future)
+
+        return sonuclar
+
+    def get_stats(self) -> dict:
+        return {
+            "backend" : self.backend.name,
+            "items"   : len(self._cache),
+            "hits"    : self.hits,
+            "misses"  : self.misses,
+            "lookups" : self.lookups,
+        }
+
+def _backend():
+    if not GEOIP_DB_PATH:
+        return IpApiBackend()
 
     try:
-        # Paylaşımlı GlobalClient üzerinden istek at
-        response = await global_request.fetch(f"http://ip-api.com/json/{hedef_ip}", timeout=3)
-        veri = response.json()
-
-        if veri.get("status") != "fail":
-            sonuc = {
-                "ulke"   : veri.get("country") or "",
-                "il"     : veri.get("regionName") or "",
-                "ilce"   : veri.get("city") or "",
-                "isp"    : veri.get("isp") or "",
-                "sirket" : veri.get("org") or "",
-                "host"   : veri.get("as") or ""
-            }
-        else:
-            sonuc = {"hata": "Veri Bulunamadı.."}
+        return MaxMindBackend(GEOIP_DB_PATH)
     except Exception as hata:
-        sonuc = {"hata": f"{type(hata).__name__} » {hata}"}
+        konsol.log(f"[yellow]GeoIP veritabanı açılamadı, ip-api kullanılacak : {type(hata).__name__}: {hata}")
+        return IpApiBackend()
 
-    # Cache'e ekle (max 128)
-    if len(_ip_cache) >= 128:
-        _ip_cache.pop(next(iter(_ip_cache)))
-    _ip_cache[hedef_ip] = sonuc
+geoip = GeoIPResolver(_backend(), max_items=GEOIP_CACHE_SIZE, ttl=GEOIP_CACHE_TTL, negative_ttl=GEOIP_NEGATIVE_TTL)
 
-    return sonuc
+async def ip_log_toplu(hedef_ipler: list[str]) -> dict[str, dict[str, str]]:
+    return await geoip.resolve_many(hedef_ipler)
@@ -1,72 +1,47 @@
 # Bu araç @keyiflerolsun tarafından | @KekikAkademi için yazılmıştır.
 
-from CLI        import konsol
-from fastapi    import FastAPI
-from contextlib import asynccontextmanager
-from Libs       import global_request
-from Settings   import AVAILABILITY_CHECK
-from Public.API.v1.Libs import plugin_manager
-import asyncio
-
-# Maksimum eş zamanlı kontrol sayısı
-MAX_CONCURRENT_CHECKS = 10
-
-async def _check_plugin(name: str, sem: asyncio.Semaphore, lock: asyncio.Lock) -> None:
-    """Her eklenti için ayrı bir AsyncSession açıp ana sayfayı kontrol eder.
-
-    Erişim sağlanamazsa eklentiyi kapatır ve yöneticiden kaldırır. Sem ve lock
-    kullanılarak eşzamanlı bağlantı sayısı sınırlandırılır ve plugin listesi güvenli
-    şekilde güncellenir.
-    """
-    try:
-        plugin = plugin_manager.select_plugin(name)
-    except Exception:
-        # Eklenti listeden kaldırılmış veya seçilemiyorsa artık kontrol gerekmez
-        return
-
-    # Kapasite sınırı: aynı anda en fazla `MAX_CONCURRENT_CHECKS` oturum açılacak
-    async with sem:
-        try:
-            istek = await global_request.fetch(plugin.main_url)
-            if istek.status_code != 200:
-                try:
-                    await plugin.close()
-                except Exception:
-                    pass
-                async with lock:
-                    plugin_manager.plugins.pop(name, None)
-                konsol.log(f"[red]Eklentiye erişilemiyor : {plugin.name} | {plugin.main_url}")
-        except Exception:
-            # Hata durumunda eklentiyi kapat ve kaldır
-            try:
-                await plugin.close()
-            except Exception:
-                pass
-            async with lock:
-                plugin_manager.plugins.pop(name, None)
-            konsol.log(f"[red]Eklentiye erişilemiyor : {plugin.name} | {plugin.main_url}")
+from CLI          import konsol
+from fastapi      import FastAPI
+from contextlib   import asynccontextmanager
+from Libs         import global_request, proxy_request
+from Settings     import AVAILABILITY_CHECK
+from ._erisim_log import erisim_logu
+from Public.API.v1.Libs import plugin_health, plugin_cache, main_page_prewarmer
+from Public.Proxy.Libs.segment_cache import segment_cache
+from Public.Proxy.Libs.block_cache   import block_cache
+from Public.Proxy.Libs.disk_cache    import disk_segment_cache
+from Public.Proxy.Libs.prefetch      import segment_prefetcher
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """FastAPI lifespan events - startup ve shutdown"""
     await global_request.start()
-
-    # ! Eğer eklenti ana sayfası erişilemiyorsa atla
+    await proxy_request.start()
+    erisim_logu.start()
+    segment_cache.start()
+    block_cache.start()
+    await disk_segment_cache.start()
+    segment_prefetcher.start()
+
+    # ! Eklenti ana sayfası erişilemiyorsa circuit'i açılır (listeden kaldırılmaz, düzelince geri gelir)
     if AVAILABILITY_CHECK:
-        sem  = asyncio.Semaphore(MAX_CONCURRENT_CHECKS)
-        lock = asyncio.Lock()
-
-        plugin_names = list(plugin_manager.get_plugin_names())
-
-        async with asyncio.TaskGroup() as tg:
-            for name in plugin_names:
-                if name in ("RecTV", "BıdıkTV"):
-                    continue
+        await plugin_health.check_all()
+        plugin_health.start()
 
-                tg.create_task(_check_plugin(name, sem, lock))
+        konsol.log(f"[green]Eklenti erişim kontrolleri tamamlandı. (maks {plugin_health.max_concurrent} eşzamanlı)")
 
-        konsol.log(f"[green]Eklenti erişim kontrolleri tamamlandı. (maks {MAX_CONCURRENT_CHECKS} eşzamanlı)")
+    # Erişilebilir eklentilerin ana sayfaları arka planda ısıtılır
+    main_page_prewarmer.start()
 
     yield
 
+    await main_page_prewarmer.stop()
+    await plugin_health.stop()
+    await plugin_cache.stop()
+    await segment_prefetcher.stop()
+    await block_cache.stop()
+    await disk_segment_cache.stop()
+    await segment_cache.stop()
+    await proxy_request.stop()
+    await erisim_logu.stop()
     await global_request.stop()
@@ -0,0 +1,171 @@
+# Bu araç @keyiflerolsun tarafından | @KekikAkademi için yazılmıştır.
+
+from CLI      import konsol
+from time     import monotonic
+from ._IP_Log import ip_log_toplu
+import asyncio
+
+LABEL_WIDTH  = 5
+durum_label  = f"[green]{'durum':<{LABEL_WIDTH}}:[/]"
+ip_label     = f"[green]{'ip':<{LABEL_WIDTH}}:[/]"
+konum_label  = f"[green]{'konum':<{LABEL_WIDTH}}:[/]"
+cihaz_label  = f"[green]{'cihaz':<{LABEL_WIDTH}}:[/]"
+
+def log_formatla(log_veri: dict, ip_detay: dict) -> str:
+    log_lines = []
+
+    log_lines.append(f"[bold blue]»[/] [bold turquoise2]{log_veri['url']}[/]")
+
+    if log_veri["veri"]:
+        log_lines.append(f"[bold magenta]»[/] [bold cyan]{log_veri['veri']}[/]")
+
+    durum_line = (
+        f"  {durum_label} [bold green]{log_veri['method']}[/]"
+        f" [blue]-[/] [bold bright_yellow]{log_veri['kod']}[/]"
+        f" [blue]-[/] [bold yellow2]{log_veri['sure']} sn[/]"
+    )
+    log_lines.append(durum_line)
+
+    if log_veri["id"]:
+        ip_line = (
+            f"  {ip_label} [bold bright_blue]{log_veri['id']}[/]"
+            f"[bold green]@[/][bold red]{log_veri['ip']}[/]"
+        )
+    else:
+        ip_line = f"  {ip_label} [bold red]{log_veri['ip']}[/]"
+    log_lines.append(ip_line)
+
+    if ("hata" not in ip_detay) and ip_detay.get("ulke"):
+        il   = ip_detay["il"].replace(" Province", "")
+        ilce = ip_detay["ilce"]
+
+        host_str = " ".join(ip_detay["host"].split()[1:4])
+
+        if il != ilce:
+            konum_line = (
+                f"  {konum_label} [bold chartreuse3]{ip_detay['ulke']}[/]"
+                f" [blue]|[/] [bold chartreuse3]{il}[/]"
+                f" [blue]|[/] [bold chartreuse3]{ilce}[/]"
+                f" [blue]|[/] [bold chartreuse3]{host_str}[/]"
+            )
+        else:
+            konum_line = (
+                f"  {konum_label} [bold chartreuse3]{ip_detay['ulke']}[/]"
+                f" [blue]|[/] [bold chartreuse3]{il}[/]"
+                f" [blue]|[/] [bold chartreuse3]{host_str}[/]"
+            )
+        log_lines.append(konum_line)
+
+    log_lines.append(f"  {cihaz_label} [magenta]{log_veri['cihaz']}[/]")
+
+    return "\n".join(log_lines) + "\n"
+
+class ErisimLogu:
+    """
+    Erişim logları için arka plan kuyruğu
+    - Middleware kaydı sınırlı kuyruğa bırakıp hemen döner; kuyruk doluysa kayıt düşürülür (sayılır)
+    - Worker kayıtları `batch_size` adede / `flush_interval` süresine kadar toplar
+    - Gruptaki IP'ler tek seferde (cache + ip-api toplu POST) çözülür, loglar sonra yazılır
+    """
+
+    def __init__(self, max_queue: int = 1000, batch_size: int = 100, flush_interval: float = 0.5):
+        self.max_queue      = max_queue
+        self.batch_size     = batch_size
+        self.flush_interval = flush_interval
+
+        self.logged  = 0
+        self.dropped = 0
+
+        self._queue = None
+        self._task  = None
+
+    def submit(self, log_veri: dict):
+        """Kaydı kuyruğa bırak (beklemez)"""
+        if self._queue is None:
+            return
+
+        try:
+            self._queue.put_nowait(log_veri)
+        except asyncio.QueueFull:
+            self.dropped += 1
+
+    async def _collect(self) -> list[dict]:
+        """İlk kaydı bekle, ardından süre / adet dolana kadar kalanları topla"""
+        grup = [await self._queue.get()]
+        bitis = monotonic() + self.flush_interval
+
+        while len(grup) < self.batch_size:
+            if not self._queue.empty():
+                grup.append(self._queue.get_nowait())
+                continue
+
+            kalan = bitis - monotonic()
+            if kalan <= 0:
+                break
+
+            try:
+                grup.append(await asyncio.wait_for(self._queue.get(), timeout=kalan))
+            except asyncio.TimeoutError:
+                break
+
+        return grup
+
+    async def _write(self, grup: list[dict]):
+        try:
+            ip_detaylar = await ip_log_toplu([log_veri["ip"] for log_veri in grup])
+        except Exception as hata:
+            ip_detaylar = {}
+            konsol.log(f"[red]IP çözümleme hatası : {hata}")
+
+        for log_veri in grup:
+            konsol.log(log_formatla(log_veri, ip_detaylar.get(log_veri["ip"], {})))
+            self.logged += 1
+
+    async def _loop(self):
+        while True:
+            grup = await self._collect()
+            try:
+                await self._write(grup)
+            except Exception as hata:
+                konsol.log(f"[red]Erişim logu hatası : {hata}")
+
+    def start(self):
+        """Worker'ı başlat (lifespan startup'ta çağrılmalı)"""
+        if self._task is not None and not self._task.done():
+            return
+
+        self._queue = asyncio.Queue(maxsize=self.max_queue)
+        self._task  = asyncio.create_task(self._loop())
+
+    async def stop(self, timeout: float = 5.0):
+        """Worker'ı durdur, kuyrukta kalanları yaz (lifespan shutdown'da çağrılmalı)"""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        if self._queue is None:
+            return
+
+        kalanlar = []
+        while not self._queue.empty():
+            kalanlar.append(self._queue.get_nowait())
+        self._queue = None
+
+        if kalanlar:
+            try:
+                await asyncio.wait_for(self._write(kalanlar), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    def get_stats(self) -> dict:
+        return {
+            "queued"  : self._queue.qsize() if self._queue else 0,
+            "logged"  : self.logged,
+            "dropped" : self.dropped,
+        }
+
+erisim_logu = ErisimLogu()
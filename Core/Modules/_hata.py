@@ -5,6 +5,7 @@ from starlette.exceptions            import HTTPException as StarletteHTTPExcept
 from fastapi_csrf_protect.exceptions import CsrfProtectError
 from pydantic                        import ValidationError
 from Settings                        import PRODUCTION
+from Public.API.v1.Libs              import PluginUnavailable
 
 @kekik_FastAPI.exception_handler(StarletteHTTPException)
 async def custom_http_exception_handler(request: Request, exc):
@@ -34,6 +35,15 @@ async def csrf_exception_handler(request: Request, exc: CsrfProtectError):
         content     = {"success": False, "message": detail}
     )
 
+@kekik_FastAPI.exception_handler(PluginUnavailable)
+async def plugin_unavailable_handler(request: Request, exc: PluginUnavailable):
+    """Circuit'i açık eklenti - beklemeden 503"""
+    return JSONResponse(
+        status_code = 503,
+        content     = {"hata": str(exc)},
+        headers     = {"Retry-After": str(exc.retry_after)}
+    )
+
 @kekik_FastAPI.get("/favicon.ico")
 async def get_favicon():
     return FileResponse(path="Public/Home/Static/ico/favicon.ico")
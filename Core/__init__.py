@@ -1,6 +1,6 @@
 # Bu araç @keyiflerolsun tarafından | @KekikAkademi için yazılmıştır.
 
-from fastapi                 import FastAPI, Request, Response, HTTPException, Form, Depends
+from fastapi                 import FastAPI, Request, Response, HTTPException, Form, Depends, Query
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
 from Core.Modules            import lifespan
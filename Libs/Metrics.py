@@ -0,0 +1,49 @@
+# Bu araç @keyiflerolsun tarafından | @KekikAkademi için yazılmıştır.
+
+from bisect import bisect_left
+
+# Varsayılan süre kovaları (saniye)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+class Histogram:
+    """
+    Sabit kovalı, Prometheus uyumlu histogram
+    - observe O(log kova) ve kilitsiz (tek event loop)
+    - Kovalar kümülatif değil tutulur, dışa aktarırken toplanır
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self.counts  = [0] * (len(self.buckets) + 1)  # son kova = +Inf
+        self.count   = 0
+        self.sum     = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum   += value
+
+    def cumulative(self) -> list[tuple[str, int]]:
+        """[(le, kümülatif sayı)] - son eleman "+Inf" """
+        toplam, sonuc = 0, []
+        for bound, adet in zip((*map(str, self.buckets), "+Inf"), self.counts):
+            toplam += adet
+            sonuc.append((bound, toplam))
+        return sonuc
+
+    def get_stats(self) -> dict:
+        return {
+            "count"   : self.count,
+            "sum"     : round(self.sum, 6),
+            "avg"     : round(self.sum / self.count, 6) if self.count else 0.0,
+            "buckets" : dict(self.cumulative()),
+        }
+
+    def prometheus(self, name: str, labels: str = "") -> list[str]:
+        """Prometheus text formatında satırlar (HELP/TYPE hariç)"""
+        ek    = f",{labels}" if labels else ""
+        sade  = f"{{{labels}}}" if labels else ""
+        lines = [f'{name}_bucket{{le="{bound}"{ek}}} {adet}' for bound, adet in self.cumulative()]
+        lines.append(f"{name}_sum{sade} {self.sum}")
+        lines.append(f"{name}_count{sade} {self.count}")
+        return lines
@@ -3,24 +3,187 @@
 from __future__   import annotations
 from CLI          import konsol
 from urllib.parse import urlparse
+from collections  import deque
+from contextlib   import contextmanager
+from contextvars  import ContextVar, Context, copy_context
+from math         import ceil
+from random       import uniform
+from time         import perf_counter, monotonic
+from .Metrics     import Histogram
 import httpx, asyncio
 
+# Gelen isteğin kalan süre bütçesi (monotonic mutlak zaman) - istekten_once_sonra middleware'i set eder
+request_deadline: ContextVar[float | None] = ContextVar("request_deadline", default=None)
+
+# Tekrar denenebilecek (idempotent) metodlar ve durum kodları
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+RETRY_STATUS_CODES = frozenset({429, 502, 503, 504})
+
+class DeadlineExceeded(httpx.TimeoutException):
+    """Çağıranın süre bütçesi origin cevap vermeden tükendi"""
+
+def without_deadline() -> Context:
+    """Süre bütçesi taşımayan context - isteği aşan arka plan görevleri (create_task(..., context=)) için"""
+    context = copy_context()
+    context.run(request_deadline.set, None)
+    return context
+
+class DomainLimiter:
+    """
+    Domain başına adaptif (AIMD) eşzamanlılık limiti.
+    - Başarılı her istekte limit 1/limit kadar artar (limit kadar başarıda +1)
+    - 429 / 5xx / timeout / bağlantı hatasında limit yarıya iner (saniyede en fazla bir kez)
+    - Limit dolunca istekler FIFO kuyrukta bekler
+    """
+    def __init__(self, max_limit: int = 50, min_limit: int = 1, initial_limit: int | None = None, decrease_factor: float = 0.5, decrease_interval: float = 1.0):
+        self.max_limit         = max_limit
+        self.min_limit         = min_limit
+        self.limit             = float(initial_limit or max(min_limit, max_limit // 4))
+        self.decrease_factor   = decrease_factor
+        self.decrease_interval = decrease_interval
+        self.active            = 0
+        self._waiters: deque[asyncio.Future] = deque()
+        self._last_decrease    = 0.0
+
+    async def acquire(self):
+        if self.active < int(self.limit) and not self._waiters:
+            self.active += 1
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Slot verildi ama beklerken iptal edildi - sıradakine devret
+                self.active -= 1
+                self._wake()
+            else:
+                try:
+                    self._waiters.remove(waiter)
+                except ValueError:
+                    pass
+            raise
+
+    def release(self, congested: bool | None = False):
+        """Slotu bırak; `congested` True ise limiti düşür, False ise artır, None ise dokunma"""
+        self.active -= 1
+
+        if congested:
+            now = monotonic()
+            if now - self._last_decrease >= self.decrease_interval:
+                self.limit          = max(float(self.min_limit), self.limit * self.decrease_factor)
+                self._last_decrease = now
+        elif congested is False and self.limit < self.max_limit:
+            self.limit = min(float(self.max_limit), self.limit + 1 / self.limit)
+
+        self._wake()
+
+    def _wake(self):
+        while self._waiters and self.active < int(self.limit):
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.active += 1
+                waiter.set_result(None)
+
+    def get_stats(self) -> dict:
+        return {
+            "limit"  : int(self.limit),
+            "active" : self.active,
+            "queued" : len(self._waiters),
+        }
+
 class RequestLimiter:
     """
-    Global ve domain bazlı rate limiting (Semaphore) yönetimi.
-    Kontrollü concurrency sağlayarak ban/retry riskini azaltır.
+    Global ve domain bazlı rate limiting yönetimi.
+    Global limit sabit bir Semaphore, domain limitleri ise trafiğe göre adaptif (AIMD).
+    Domain limiter araması kilitsizdir (event loop tek thread, get / setdefault arasında await yok).
     """
-    def __init__(self, global_limit: int = 200, domain_limit: int = 50):
+    def __init__(self, global_limit: int = 200, domain_limit: int = 50, domain_initial: int | None = None):
         self.global_semaphore = asyncio.Semaphore(global_limit)
-        self.domain_semaphores: dict[str, asyncio.Semaphore] = {}
-        self.domain_limit = domain_limit
-        self._lock        = asyncio.Lock()
+        self.global_limit     = global_limit
+        self.domain_limit     = domain_limit
+        self.domain_initial   = domain_initial
+        self.domain_limiters: dict[str, DomainLimiter] = {}
+
+    def get_domain_limiter(self, domain: str) -> DomainLimiter:
+        limiter = self.domain_limiters.get(domain)
+        if limiter is None:
+            limiter = self.domain_limiters.setdefault(domain, DomainLimiter(max_limit=self.domain_limit, initial_limit=self.domain_initial))
+        return limiter
 
-    async def get_domain_semaphore(self, domain: str) -> asyncio.Semaphore:
-        async with self._lock:
-            if domain not in self.domain_semaphores:
-                self.domain_semaphores[domain] = asyncio.Semaphore(self.domain_limit)
-            return self.domain_semaphores[domain]
+    def get_stats(self) -> dict:
+        return {
+            "global_limit" : self.global_limit,
+            "global_free"  : self.global_semaphore._value,
+            "domains"      : {domain: limiter.get_stats() for domain, limiter in self.domain_limiters.items()},
+        }
+
+def is_congested(response: httpx.Response) -> bool:
+    """Origin yavaşlamamızı istiyor mu? (429 / 5xx)"""
+    return response.status_code == 429 or response.status_code >= 500
+
+class UpstreamStats:
+    """
+    Origin istek istatistikleri
+    - Domain bazlı anlık (in-flight) istek sayısı
+    - Limiter beklemesi hariç, header'lar gelene kadar geçen süre histogramı
+    - Domain bazlı son N sürenin p95'i (hedge gecikmesi için)
+    """
+    def __init__(self, window: int = 100, min_samples: int = 20):
+        self.inflight: dict[str, int] = {}
+        self.latency  = Histogram()
+        self.errors   = 0
+        self.retries  = 0
+        self.hedges   = 0
+
+        self.window      = window
+        self.min_samples = min_samples
+        self._recent : dict[str, deque[float]] = {}
+        self._p95    : dict[str, float]        = {}
+
+    def observe_domain(self, domain: str, latency: float):
+        recent = self._recent.get(domain)
+        if recent is None:
+            recent = self._recent[domain] = deque(maxlen=self.window)
+        recent.append(latency)
+
+        # p95'i her istekte değil, pencerenin onda biri dolduğunda yeniden hesapla
+        if len(recent) >= self.min_samples and len(recent) % max(1, self.window // 10) == 0:
+            sirali = sorted(recent)
+            self._p95[domain] = sirali[min(len(sirali) - 1, ceil(len(sirali) * 0.95) - 1)]
+
+    def p95(self, domain: str) -> float | None:
+        return self._p95.get(domain)
+
+    @contextmanager
+    def track(self, domain: str):
+        self.inflight[domain] = self.inflight.get(domain, 0) + 1
+        baslangic = perf_counter()
+        try:
+            yield
+        except Exception:
+            self.errors += 1
+            raise
+        else:
+            self.observe_domain(domain, perf_counter() - baslangic)
+        finally:
+            self.latency.observe(perf_counter() - baslangic)
+            if (kalan := self.inflight[domain] - 1):
+                self.inflight[domain] = kalan
+            else:
+                del self.inflight[domain]
+
+    def get_stats(self) -> dict:
+        return {
+            "inflight" : dict(self.inflight),
+            "errors"   : self.errors,
+            "retries"  : self.retries,
+            "hedges"   : self.hedges,
+            "latency"  : self.latency.get_stats(),
+            "p95"      : {domain: round(value, 3) for domain, value in self._p95.items()},
+        }
 
 class GlobalClient:
     """
@@ -30,6 +193,7 @@ class GlobalClient:
     _instance : 'GlobalClient'    | None = None
     _client   : httpx.AsyncClient | None = None
     _limiter  : RequestLimiter    | None = None
+    _stats    : UpstreamStats     | None = None
 
     def __new__(cls):
         if cls._instance is None:
@@ -39,20 +203,34 @@ class GlobalClient:
     @property
     def client(self) -> httpx.AsyncClient:
         if self._client is None:
-            raise RuntimeError("GlobalClient henüz başlatılmadı! lifespan içinde 'start()' çağrılmalı.")
+            raise RuntimeError(f"{type(self).__name__} henüz başlatılmadı! lifespan içinde 'start()' çağrılmalı.")
         return self._client
 
     @property
     def limiter(self) -> RequestLimiter:
         if self._limiter is None:
-            self._limiter = RequestLimiter()
+            self._limiter = self._build_limiter()
         return self._limiter
 
+    @property
+    def stats(self) -> UpstreamStats:
+        if self._stats is None:
+            self._stats = UpstreamStats()
+        return self._stats
+
+    def _build_limiter(self) -> RequestLimiter:
+        return RequestLimiter()
+
     async def start(self):
         """Client'ı ilklendir (FastAPI startup'ta çağrılmalı)"""
         if self._client is not None:
             return
 
+        self._client = self._build_client()
+        # konsol.log("[bold green]🚀 GlobalClient başlatıldı (HTTP/2 + Pooling)[/]")
+
+    def _build_client(self) -> httpx.AsyncClient:
+        """Profil ayarlarıyla httpx.AsyncClient oluşturur"""
         limits = httpx.Limits(
             max_connections           = 200,
             max_keepalive_connections = 50,
@@ -65,14 +243,13 @@ class GlobalClient:
             pool    = 5.0
         )
 
-        self._client = httpx.AsyncClient(
+        return httpx.AsyncClient(
             http2            = True,
             headers          = {"User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 15_7_3) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/26.0 Safari/605.1.15"},
             limits           = limits,
             timeout          = timeout,
             follow_redirects = True
         )
-        # konsol.log("[bold green]🚀 GlobalClient başlatıldı (HTTP/2 + Pooling)[/]")
 
     async def stop(self):
         """Client'ı kapat (FastAPI shutdown'da çağrılmalı)"""
@@ -81,17 +258,182 @@ class GlobalClient:
             self._client = None
             # konsol.log("[bold yellow]🛑 GlobalClient kapatıldı[/]")
 
-    async def fetch(self, url: str, method: str = "GET", **kwargs) -> httpx.Response:
+    max_retries  = 2
+    backoff_base = 0.2
+    backoff_max  = 2.0
+
+    async def fetch(self, url: str, method: str = "GET", *, deadline: float | None = None, retries: int | None = None, hedge: bool = False, **kwargs) -> httpx.Response:
         """
         Paylaşımlı client ve limiter ile istek atar.
+        - `deadline`: monotonic mutlak bitiş zamanı; verilmezse / daha geçse gelen isteğin kalan bütçesi (request_deadline) kullanılır
+        - Idempotent metodlarda bağlantı hatası / timeout / 429 / 5xx için jitter'lı üstel bekleme ile `retries` kez tekrar dener
+        - `hedge=True` ise domain'in p95 süresi aşılınca ikinci bir deneme başlatır, önce biten kazanır
+        - Hiçbir deneme / bekleme kalan bütçeyi aşmaz; bütçe biterse httpx.TimeoutException
         """
-        domain = urlparse(url).netloc
+        domain     = urlparse(url).netloc
+        idempotent = method.upper() in IDEMPOTENT_METHODS
+        retries    = (self.max_retries if idempotent else 0) if retries is None else retries
+        hedge      = hedge and idempotent
+
+        if (context_deadline := request_deadline.get()) is not None:
+            deadline = context_deadline if deadline is None else min(deadline, context_deadline)
+
+        attempt = 0
+        while True:
+            try:
+                if hedge:
+                    response = await self._hedged_attempt(domain, url, method, deadline, kwargs)
+                else:
+                    response = await self._attempt(domain, url, method, deadline, kwargs)
+            except DeadlineExceeded:
+                raise
+            except (httpx.TimeoutException, httpx.NetworkError):
+                if attempt >= retries or not await self._backoff(attempt, deadline):
+                    raise
+            else:
+                if response.status_code not in RETRY_STATUS_CODES or attempt >= retries:
+                    return response
+                if not await self._backoff(attempt, deadline, response.headers.get("retry-after")):
+                    return response
 
-        domain_sem = await self.limiter.get_domain_semaphore(domain)
+            attempt += 1
+            self.stats.retries += 1
+
+    async def _backoff(self, attempt: int, deadline: float | None, retry_after: str | None = None) -> bool:
+        """Denemeden önce bekle; bütçe yetmiyorsa beklemeden False döndür"""
+        delay = uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+        if retry_after and retry_after.isdigit():
+            delay = max(delay, float(retry_after))
+
+        if delay > self.backoff_max * 2:
+            return False
+
+        if deadline is not None and monotonic() + delay >= deadline:
+            return False
+
+        await asyncio.sleep(delay)
+        return True
+
+    async def _attempt(self, domain: str, url: str, method: str, deadline: float | None, kwargs: dict) -> httpx.Response:
+        """Limiter altında tek deneme, kalan bütçe ile sınırlı"""
+        domain_limiter = self.limiter.get_domain_limiter(domain)
+
+        async with self.limiter.global_semaphore:
+            await domain_limiter.acquire()
+            congested = None
+            try:
+                remaining = None if deadline is None else deadline - monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise DeadlineExceeded(f"Süre bütçesi tükendi: {url}")
+
+                with self.stats.track(domain):
+                    try:
+                        response = await asyncio.wait_for(self.client.request(method, url, **kwargs), timeout=remaining)
+                    except asyncio.TimeoutError:
+                        raise DeadlineExceeded(f"Süre bütçesi tükendi: {url}") from None
+
+                congested = is_congested(response)
+                return response
+            except DeadlineExceeded:
+                # Bütçe kaynaklı kesinti origin'in tıkanıklığı sayılmaz
+                raise
+            except (httpx.TimeoutException, httpx.NetworkError):
+                congested = True
+                raise
+            finally:
+                domain_limiter.release(congested)
+
+    async def _hedged_attempt(self, domain: str, url: str, method: str, deadline: float | None, kwargs: dict) -> httpx.Response:
+        """p95 süresinde cevap gelmezse ikinci deneme başlat, önce başarılı olanı döndür"""
+        delay = self.stats.p95(domain)
+        if delay is None:
+            return await self._attempt(domain, url, method, deadline, kwargs)
+
+        if deadline is not None:
+            delay = min(delay, max(0.0, deadline - monotonic()))
+
+        pending = {asyncio.create_task(self._attempt(domain, url, method, deadline, kwargs))}
+        try:
+            done, pending = await asyncio.wait(pending, timeout=delay)
+            if not done:
+                self.stats.hedges += 1
+                pending.add(asyncio.create_task(self._attempt(domain, url, method, deadline, kwargs)))
+
+            hata = None
+            while True:
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    hata = task.exception()
+
+                if not pending:
+                    raise hata
+
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def stream(self, url: str, method: str = "GET", **kwargs) -> httpx.Response:
+        """
+        Body okunmadan (stream=True) response döndürür.
+        Limiter sadece header'lar gelene kadar tutulur; çağıran `response.aclose()` yapmalıdır.
+        """
+        domain         = urlparse(url).netloc
+        domain_limiter = self.limiter.get_domain_limiter(domain)
 
         async with self.limiter.global_semaphore:
-            async with domain_sem:
-                return await self.client.request(method, url, **kwargs)
+            await domain_limiter.acquire()
+            congested = None
+            try:
+                with self.stats.track(domain):
+                    req      = self.client.build_request(method, url, **kwargs)
+                    response = await self.client.send(req, stream=True)
+                congested = is_congested(response)
+                return response
+            except (httpx.TimeoutException, httpx.NetworkError):
+                congested = True
+                raise
+            finally:
+                domain_limiter.release(congested)
+
+class ProxyClient(GlobalClient):
+    """
+    Proxy router'ları için ikinci pooled client profili.
+    - SSL doğrulaması kapalı (bazı CDN'ler self-signed sertifika kullanıyor)
+    - Uzun okuma süreleri (video segment / progressive stream)
+    - Origin başına geniş keep-alive havuzu (aynı CDN'den ardışık segmentler bağlantıyı yeniden kullanır)
+    """
+    _instance : 'ProxyClient'     | None = None
+    _client   : httpx.AsyncClient | None = None
+    _limiter  : RequestLimiter    | None = None
+    _stats    : UpstreamStats     | None = None
+
+    def _build_limiter(self) -> RequestLimiter:
+        # Watch party'de tüm izleyiciler aynı CDN'e gider, domain limiti daha geniş ve yüksekten başlar
+        return RequestLimiter(global_limit=500, domain_limit=100, domain_initial=50)
+
+    def _build_client(self) -> httpx.AsyncClient:
+        limits = httpx.Limits(
+            max_connections           = 500,
+            max_keepalive_connections = 200,
+            keepalive_expiry          = 60.0
+        )
+        timeout = httpx.Timeout(
+            connect = 10.0,
+            read    = 60.0,
+            write   = 10.0,
+            pool    = 10.0
+        )
+
+        return httpx.AsyncClient(
+            http2            = True,
+            limits           = limits,
+            timeout          = timeout,
+            follow_redirects = True,
+            verify           = False
+        )
 
 # Singleton instance
 global_request = GlobalClient()
+proxy_request  = ProxyClient()
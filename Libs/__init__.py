@@ -1,3 +1,3 @@
 # Bu araç @keyiflerolsun tarafından | @KekikAkademi için yazılmıştır.
 
-from .Networking import global_request
+from .Networking import global_request, proxy_request, request_deadline, without_deadline, DeadlineExceeded
@@ -1,7 +1,20 @@
 # Bu araç @keyiflerolsun tarafından | @KekikAkademi için yazılmıştır.
 
 from KekikStream.Core import PluginManager, ExtractorManager, MediaManager, MovieInfo, SeriesInfo
+from .plugin_cache    import PluginCache
+from .plugin_health   import PluginHealthMonitor, PluginUnavailable
+from .prewarm         import MainPagePrewarmer
+from Settings         import PREWARM_INTERVAL, PREWARM_PAGES, PREWARM_JITTER, HEALTH_CHECK_INTERVAL
 
 plugin_manager    = PluginManager()
 extractor_manager = ExtractorManager()
 media_manager     = MediaManager()
+
+# Eklenti circuit breaker'ları ve periyodik erişim kontrolü
+plugin_health = PluginHealthMonitor(plugin_manager, interval=HEALTH_CHECK_INTERVAL)
+
+# Eklenti sonuçları için paylaşımlı response cache (API + Home router'ları)
+plugin_cache = PluginCache(plugin_manager, health=plugin_health)
+
+# Ana sayfa kategorilerini plugin_cache'e periyodik ısıtan zamanlayıcı (PREWARM_INTERVAL=0 ise devre dışı)
+main_page_prewarmer = MainPagePrewarmer(plugin_manager, plugin_cache, interval=PREWARM_INTERVAL, pages=PREWARM_PAGES, jitter=PREWARM_JITTER)
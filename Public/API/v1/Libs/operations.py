@@ -0,0 +1,59 @@
+# Bu araç @keyiflerolsun tarafından | @KekikAkademi için yazılmıştır.
+
+from .            import plugin_manager, plugin_cache, SeriesInfo
+from urllib.parse import quote_plus
+import asyncio
+
+# Tekil endpoint'ler, /batch ve /search_all'un ortak işlemleri - sonuçlar API'nin döndürdüğü biçimde
+
+def get_plugin(plugin_name: str) -> dict:
+    """Eklenti bilgisi (kategori url / adları encode edilmiş)"""
+    plugin    = plugin_manager.select_plugin(plugin_name)
+    main_page = {quote_plus(url): quote_plus(category) for url, category in plugin.main_page.items()}
+
+    return {
+        "name"        : plugin.name,
+        "language"    : plugin.language,
+        "main_url"    : plugin.main_url,
+        "favicon"     : plugin.favicon,
+        "description" : plugin.description,
+        "main_page"   : main_page
+    }
+
+async def get_main_page(plugin_name: str, page: int, encoded_url: str, encoded_category: str) -> list:
+    result = await plugin_cache.call(plugin_name, "get_main_page", page, encoded_url, encoded_category)
+    for icerik in result:
+        icerik.url = quote_plus(icerik.url)
+
+    return result
+
+async def search(plugin_name: str, query: str, limit: asyncio.Semaphore | None = None) -> list:
+    result = await plugin_cache.call(plugin_name, "search", query, limit=limit)
+    for elem in result:
+        elem.url = quote_plus(elem.url)
+
+    return result
+
+async def load_item(plugin_name: str, encoded_url: str):
+    result     = await plugin_cache.call(plugin_name, "load_item", encoded_url)
+    result.url = quote_plus(result.url)
+
+    if isinstance(result, SeriesInfo):
+        for episode in result.episodes:
+            episode.url = quote_plus(episode.url)
+
+    return result
+
+async def load_links(plugin_name: str, encoded_url: str) -> list[dict]:
+    links = await plugin_cache.call(plugin_name, "load_links", encoded_url)
+
+    return [
+        {
+            "name"       : link.name,
+            "url"        : link.url,
+            "referer"    : link.referer or "",
+            "user_agent" : link.user_agent or "",
+            "subtitles"  : [sub.model_dump() for sub in link.subtitles] if link.subtitles else []
+        }
+            for link in links
+    ]
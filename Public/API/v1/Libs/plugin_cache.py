@@ -0,0 +1,150 @@
+# Bu araç @keyiflerolsun tarafından | @KekikAkademi için yazılmıştır.
+
+from collections    import OrderedDict
+from dataclasses    import dataclass
+from copy           import deepcopy
+from functools      import partial
+from time           import time
+from .single_flight import SingleFlight
+import asyncio
+
+# Metod başına (taze kalma süresi, sonrasında bayat servis edilebilecek süre) - saniye
+METHOD_TTLS = {
+    "get_main_page" : (600, 3600),
+    "search"        : (300, 900),
+    "load_item"     : (300, 1800),
+    "load_links"    : (60,  60),
+}
+
+@dataclass
+class CacheEntry:
+    """Cache'teki eklenti sonucu"""
+    value      : object
+    fresh_till : float
+    stale_till : float
+
+class PluginCache:
+    """
+    Eklenti metodları (scrape) için response cache
+    - Anahtar: (eklenti, metod, normalize edilmiş argümanlar)
+    - Metod başına TTL; süresi dolan kayıt bayat pencere içinde hemen döndürülür, arka planda yenilenir
+    - Boyut limitli, LRU sıralı
+    - Router'lar sonucu yerinde değiştirdiği için her çağrıya kopya döner
+    - Hatalar ve boş sonuçlar cache'lenmez
+    - Aynı anahtarlı eşzamanlı scrape'ler (miss, arka plan yenileme, cache'lenmeyen metodlar) tek istekte birleştirilir
+    - `health` verilirse scrape'ler eklentinin circuit breaker'ı üzerinden yapılır
+    - `limit` semaforu verilirse scrape izni görevin içinde alınır; bekleyen ayrılsa da arka plan scrape'leri sınırlı kalır
+    """
+
+    def __init__(self, plugin_manager, health=None, max_items: int = 2048, method_ttls: dict[str, tuple[int, int]] = METHOD_TTLS):
+        self.plugin_manager = plugin_manager
+        self.health         = health
+        self.max_items      = max_items
+        self.method_ttls    = method_ttls
+
+        self._entries  : OrderedDict[tuple, CacheEntry] = OrderedDict()
+        self._inflight = SingleFlight()
+
+        self.hits       = 0
+        self.stale_hits = 0
+        self.misses     = 0
+
+    @staticmethod
+    def _normalize(args: tuple) -> tuple:
+        return tuple(arg.strip() if isinstance(arg, str) else arg for arg in args)
+
+    async def call(self, plugin_name: str, method: str, *args, limit: asyncio.Semaphore | None = None):
+        """`plugin_manager.select_plugin(plugin_name).<method>(*args)` sonucunu cache üzerinden döndür"""
+        args = self._normalize(args)
+        key  = (plugin_name, method, args)
+
+        if method not in self.method_ttls:
+            return await self._inflight.do(key, partial(self._limited, limit, self._load, plugin_name, method, args))
+
+        now   = time()
+        entry = self._entries.get(key)
+        if entry is not None:
+            if now < entry.fresh_till:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return deepcopy(entry.value)
+
+            if now < entry.stale_till:
+                self._entries.move_to_end(key)
+                self.stale_hits += 1
+                self._refresh(key, limit)
+                return deepcopy(entry.value)
+
+            del self._entries[key]
+
+        self.misses += 1
+        # Sonuç cache'e yazılacağı için istemci koparsa da scrape tamamlanır
+        value = await self._inflight.do(key, partial(self._limited, limit, self._load_and_store, key), keep_alive=True)
+        return deepcopy(value)
+
+    async def _load(self, plugin_name: str, method: str, args: tuple):
+        plugin = self.plugin_manager.select_plugin(plugin_name)
+        if self.health is None:
+            return await getattr(plugin, method)(*args)
+
+        # Circuit açıksa PluginUnavailable - scrape'e hiç başlanmaz
+        return await self.health.call(plugin_name, partial(getattr(plugin, method), *args))
+
+    @staticmethod
+    async def _limited(limit: asyncio.Semaphore | None, func, *args):
+        if limit is None:
+            return await func(*args)
+
+        async with limit:
+            return await func(*args)
+
+    async def _load_and_store(self, key: tuple):
+        value = await self._load(*key)
+        self._store(key, value)
+        return value
+
+    async def refresh(self, plugin_name: str, method: str, *args):
+        """Tazeliğine bakmadan yeniden scrape edip cache'e yaz (ön ısıtma için), sonucu döndür"""
+        key = (plugin_name, method, self._normalize(args))
+        return await self._inflight.do(key, partial(self._load_and_store, key), keep_alive=True)
+
+    def _refresh(self, key: tuple, limit: asyncio.Semaphore | None = None):
+        """Bayat kaydı arka planda yenile (devam eden scrape varsa ona katılır)"""
+        # Yenilenemezse bayat kayıt penceresi bitene kadar kullanılmaya devam eder
+        self._inflight.start(key, partial(self._limited, limit, self._load_and_store, key))
+
+    def _store(self, key: tuple, value):
+        if not value:
+            return
+
+        fresh, stale = self.method_ttls[key[1]]
+        now          = time()
+
+        self._entries[key] = CacheEntry(value=value, fresh_till=now + fresh, stale_till=now + fresh + stale)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_items:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, plugin_name: str | None = None):
+        """Tüm kayıtları (ya da tek eklentinin kayıtlarını) sil"""
+        if plugin_name is None:
+            self._entries.clear()
+            return
+
+        for key in [key for key in self._entries if key[0] == plugin_name]:
+            del self._entries[key]
+
+    async def stop(self):
+        """Devam eden scrape'leri ve arka plan yenilemelerini durdur (lifespan shutdown'da çağrılmalı)"""
+        await self._inflight.stop()
+
+    def get_stats(self) -> dict:
+        """Cache istatistikleri"""
+        return {
+            "total_items" : len(self._entries),
+            "max_items"   : self.max_items,
+            "hits"        : self.hits,
+            "stale_hits"  : self.stale_hits,
+            "misses"      : self.misses,
+            "inflight"    : len(self._inflight),
+        }
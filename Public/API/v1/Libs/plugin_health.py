@@ -0,0 +1,258 @@
+# Bu araç @keyiflerolsun tarafından | @KekikAkademi için yazılmıştır.
+
+from CLI         import konsol
+from dataclasses import dataclass
+from time        import time, perf_counter
+from Libs        import global_request, without_deadline
+import asyncio
+
+# Circuit durumları
+CLOSED    = "closed"
+OPEN      = "open"
+HALF_OPEN = "half_open"
+
+class PluginUnavailable(Exception):
+    """Circuit'i açık eklentiye yapılan çağrı (503)"""
+    def __init__(self, plugin_name: str, retry_after: int):
+        super().__init__(f"'{plugin_name}' şu an erişilemiyor, {retry_after} sn sonra tekrar deneyin.")
+        self.plugin_name = plugin_name
+        self.retry_after = retry_after
+
+@dataclass
+class CircuitBreaker:
+    """
+    Eklenti başına circuit breaker
+    - closed    : çağrılar serbest; sağlık yoklaması başarısız olursa açılır
+    - open      : çağrılar beklemeden reddedilir; bekleme süresi dolunca half_open
+    - half_open : tek deneme çağrısına izin verilir; başarılıysa closed, yoklama da başarısızsa bekleme süresi ikiye katlanarak open
+    """
+    failure_threshold : int   = 3
+    error_threshold   : float = 0.5
+    min_samples       : int   = 10
+    base_cooldown     : float = 30.0
+    max_cooldown      : float = 600.0
+    alpha             : float = 0.2
+
+    state                : str         = CLOSED
+    ewma_latency         : float       = 0.0
+    error_rate           : float       = 0.0
+    samples              : int         = 0
+    consecutive_failures : int         = 0
+    cooldown             : float       = 30.0
+    opened_at            : float       = 0.0
+    trial_inflight       : bool        = False
+    last_error           : str | None  = None
+
+    def allow(self) -> bool:
+        """Çağrı yapılabilir mi? (half_open'da aynı anda tek deneme)"""
+        if self.state == OPEN:
+            if time() - self.opened_at < self.cooldown:
+                return False
+            self.state = HALF_OPEN
+
+        if self.state == HALF_OPEN:
+            if self.trial_inflight:
+                return False
+            self.trial_inflight = True
+
+        return True
+
+    def retry_after(self) -> int:
+        return max(1, int(self.opened_at + self.cooldown - time()))
+
+    def _observe(self, latency: float, failed: bool):
+        self.samples      += 1
+        self.ewma_latency  = latency if self.samples == 1 else self.alpha * latency + (1 - self.alpha) * self.ewma_latency
+        self.error_rate    = self.alpha * failed + (1 - self.alpha) * self.error_rate
+
+    def record_success(self, latency: float):
+        self._observe(latency, failed=False)
+        self.consecutive_failures = 0
+        self.trial_inflight       = False
+        if self.state != CLOSED:
+            self.state      = CLOSED
+            self.cooldown   = self.base_cooldown
+            self.error_rate = 0.0
+
+    def record_failure(self, latency: float, error: str, trip: bool = False):
+        """Hatayı işle; `trip=True` (başarısız yoklama) ise circuit'i aç"""
+        self._observe(latency, failed=True)
+        self.consecutive_failures += 1
+        self.last_error            = error
+        self.trial_inflight        = False
+
+        if not trip:
+            return
+
+        if self.state == HALF_OPEN:
+            self._open(min(self.cooldown * 2, self.max_cooldown))
+        elif self.state == CLOSED:
+            self._open(self.base_cooldown)
+
+    @property
+    def unhealthy(self) -> bool:
+        """Art arda hata ya da yüksek hata oranı - yoklama gerekir"""
+        return (
+            self.consecutive_failures >= self.failure_threshold
+            or (self.samples >= self.min_samples and self.error_rate >= self.error_threshold)
+        )
+
+    def release_trial(self):
+        """Sonucu belirsiz (iptal edilen) deneme çağrısını serbest bırak"""
+        self.trial_inflight = False
+
+    def _open(self, cooldown: float):
+        self.state     = OPEN
+        self.cooldown  = cooldown
+        self.opened_at = time()
+
+    def get_stats(self) -> dict:
+        return {
+            "state"        : self.state,
+            "ewma_latency" : round(self.ewma_latency, 3),
+            "error_rate"   : round(self.error_rate, 3),
+            "failures"     : self.consecutive_failures,
+            "retry_after"  : self.retry_after() if self.state == OPEN else 0,
+            "last_error"   : self.last_error,
+        }
+
+class PluginHealthMonitor:
+    """
+    Eklenti sağlık izleyicisi
+    - Gerçek eklenti çağrılarının sonucu / süresi circuit breaker'lara işlenir (PluginCache üzerinden)
+    - Çağrılarda hata oranı yükselirse eklenti hemen yoklanır; circuit'i yoklama açar
+      (hatalı argümanlı istekler tek başına eklentiyi kapatamaz)
+    - Arka planda eklenti ana sayfaları periyodik yoklanır; açık circuit'ler bekleme süresi dolunca yeniden denenir
+    - Açık circuit'e gelen çağrı beklemeden PluginUnavailable (503) ile reddedilir
+    - Eklentiler listeden kaldırılmaz, durumları canlı olarak raporlanır
+    """
+
+    # Ana sayfası yoklanamayan (API tabanlı) eklentiler
+    SKIP_PROBE = ("RecTV", "BıdıkTV")
+
+    def __init__(self, plugin_manager, interval: int = 120, max_concurrent: int = 10, probe_timeout: float = 15.0):
+        self.plugin_manager = plugin_manager
+        self.interval       = interval
+        self.max_concurrent = max_concurrent
+        self.probe_timeout  = probe_timeout
+
+        self._breakers : dict[str, CircuitBreaker] = {}
+        self._probes   : dict[str, asyncio.Task]   = {}
+        self._task     = None
+
+    def breaker(self, plugin_name: str) -> CircuitBreaker:
+        if (breaker := self._breakers.get(plugin_name)) is None:
+            breaker = self._breakers[plugin_name] = CircuitBreaker()
+        return breaker
+
+    def is_available(self, plugin_name: str) -> bool:
+        breaker = self._breakers.get(plugin_name)
+        return breaker is None or breaker.state != OPEN or time() - breaker.opened_at >= breaker.cooldown
+
+    def available_names(self) -> list[str]:
+        """Circuit'i açık olmayan eklenti adları"""
+        return [name for name in self.plugin_manager.get_plugin_names() if self.is_available(name)]
+
+    async def call(self, plugin_name: str, coro_factory):
+        """Çağrıyı circuit breaker üzerinden yap, sonucu / süresini kaydet"""
+        breaker = self.breaker(plugin_name)
+        if not breaker.allow():
+            raise PluginUnavailable(plugin_name, breaker.retry_after())
+
+        baslangic = perf_counter()
+        try:
+            result = await coro_factory()
+        except asyncio.CancelledError:
+            breaker.release_trial()
+            raise
+        except Exception as hata:
+            breaker.record_failure(perf_counter() - baslangic, f"{type(hata).__name__}: {hata}")
+            if breaker.state == HALF_OPEN or breaker.unhealthy:
+                self._schedule_probe(plugin_name)
+            raise
+
+        breaker.record_success(perf_counter() - baslangic)
+        return result
+
+    def _schedule_probe(self, plugin_name: str):
+        if plugin_name in self._probes or plugin_name in self.SKIP_PROBE:
+            return
+
+        # Yoklama tetikleyen isteğin süre bütçesiyle kesilmemeli
+        task = asyncio.create_task(self._probe(plugin_name), context=without_deadline())
+        self._probes[plugin_name] = task
+        task.add_done_callback(lambda _: self._probes.pop(plugin_name, None))
+
+    async def _probe(self, plugin_name: str):
+        try:
+            plugin = self.plugin_manager.select_plugin(plugin_name)
+        except Exception:
+            return
+
+        breaker = self.breaker(plugin_name)
+        if not breaker.allow():
+            return
+
+        baslangic = perf_counter()
+        try:
+            istek = await global_request.fetch(plugin.main_url, timeout=self.probe_timeout, hedge=True)
+        except asyncio.CancelledError:
+            breaker.release_trial()
+            raise
+        except Exception as hata:
+            istek, hata_mesaji = None, f"{type(hata).__name__}: {hata}"
+
+        gecen = perf_counter() - baslangic
+        if istek is not None and istek.status_code == 200:
+            if breaker.state == HALF_OPEN:
+                konsol.log(f"[green]Eklentiye yeniden erişildi : {plugin_name} | {plugin.main_url}")
+            breaker.record_success(gecen)
+            return
+
+        onceki = breaker.state
+        breaker.record_failure(gecen, hata_mesaji if istek is None else f"HTTP {istek.status_code}", trip=True)
+        if onceki == CLOSED and breaker.state == OPEN:
+            konsol.log(f"[red]Eklentiye erişilemiyor : {plugin_name} | {plugin.main_url}")
+
+    async def check_all(self):
+        """Tüm eklentileri sınırlı eşzamanlılıkla yokla"""
+        semaphore = asyncio.Semaphore(self.max_concurrent)
+
+        async def sinirli(name: str):
+            async with semaphore:
+                await self._probe(name)
+
+        names = [name for name in self.plugin_manager.get_plugin_names() if name not in self.SKIP_PROBE]
+        await asyncio.gather(*(sinirli(name) for name in names))
+
+    async def _loop(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.check_all()
+            except Exception as hata:
+                konsol.log(f"[red]Sağlık kontrolü hatası : {hata}")
+
+    def start(self):
+        """Periyodik yoklamayı başlat (lifespan startup'ta çağrılmalı)"""
+        if self.interval > 0 and (self._task is None or self._task.done()):
+            self._task = asyncio.create_task(self._loop())
+
+    async def stop(self):
+        """Periyodik yoklamayı durdur (lifespan shutdown'da çağrılmalı)"""
+        # İptal edilen yoklamalar beklenir - havuzdaki bağlantıları bırakmadan kapanış bitmesin
+        probes = list(self._probes.values())
+        for task in probes:
+            task.cancel()
+        await asyncio.gather(*probes, return_exceptions=True)
+
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def get_stats(self) -> dict:
+        return {name: self.breaker(name).get_stats() for name in self.plugin_manager.get_plugin_names()}
@@ -0,0 +1,121 @@
+# Bu araç @keyiflerolsun tarafından | @KekikAkademi için yazılmıştır.
+
+from CLI         import konsol
+from dataclasses import dataclass
+from random      import uniform
+from time        import time
+import asyncio
+
+@dataclass
+class PrewarmState:
+    """Eklenti başına ön ısıtma durumu"""
+    failures   : int   = 0
+    skip_until : float = 0.0
+
+class MainPagePrewarmer:
+    """
+    Eklenti ana sayfa kategorilerini arka planda periyodik olarak plugin_cache'e ısıtır
+    - Her turda her eklentinin `main_page` kategorileri için 1. (istenirse 2.) sayfa yenilenir
+    - Tur aralığına ±jitter eklenir (tüm sitelere aynı anda yüklenmemek için)
+    - Global semaphore ile sınırlı sayıda eşzamanlı scrape
+    - Tüm kategorileri başarısız olan eklenti üstel artan sürelerle atlanır, başarıda sıfırlanır
+    """
+
+    def __init__(self, plugin_manager, plugin_cache, interval: int = 0, pages: int = 1, jitter: float = 0.1, max_concurrent: int = 4, max_backoff: int = 3600):
+        self.plugin_manager = plugin_manager
+        self.plugin_cache   = plugin_cache
+        self.interval       = interval
+        self.pages          = max(1, min(pages, 2))
+        self.jitter         = jitter
+        self.max_concurrent = max_concurrent
+        self.max_backoff    = max_backoff
+
+        self._states    : dict[str, PrewarmState] = {}
+        self._semaphore = None
+        self._task      = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.interval > 0
+
+    async def _warm(self, plugin_name: str, page: int, url: str, category: str) -> bool:
+        async with self._semaphore:
+            try:
+                await self.plugin_cache.refresh(plugin_name, "get_main_page", page, url, category)
+                return True
+            except Exception:
+                return False
+
+    async def warm_plugin(self, plugin_name: str) -> bool:
+        """Eklentinin tüm kategorilerini ısıt, en az biri başarılıysa True"""
+        try:
+            plugin = self.plugin_manager.select_plugin(plugin_name)
+        except Exception:
+            return False
+
+        jobs = [
+            self._warm(plugin_name, page, url, category)
+                for url, category in plugin.main_page.items()
+                    for page in range(1, self.pages + 1)
+        ]
+        if not jobs:
+            return True
+
+        return any(await asyncio.gather(*jobs))
+
+    async def _warm_and_track(self, plugin_name: str):
+        state = self._states.setdefault(plugin_name, PrewarmState())
+
+        if await self.warm_plugin(plugin_name):
+            state.failures   = 0
+            state.skip_until = 0.0
+            return
+
+        state.failures  += 1
+        backoff          = min(self.interval * 2 ** (state.failures - 1), self.max_backoff)
+        state.skip_until = time() + backoff
+        konsol.log(f"[yellow]Ön ısıtma başarısız : {plugin_name} | {state.failures}. kez, {backoff:.0f} sn atlanacak")
+
+    async def run_once(self):
+        """Tek tur: sırası gelen tüm eklentileri ısıt"""
+        now   = time()
+        names = [
+            name for name in self.plugin_manager.get_plugin_names()
+                if self._states.get(name, PrewarmState()).skip_until <= now
+        ]
+        await asyncio.gather(*(self._warm_and_track(name) for name in names))
+
+    async def _loop(self):
+        while True:
+            try:
+                await self.run_once()
+            except Exception as hata:
+                konsol.log(f"[red]Ön ısıtma turu hatası : {hata}")
+
+            await asyncio.sleep(self.interval * uniform(1 - self.jitter, 1 + self.jitter))
+
+    def start(self):
+        """Zamanlayıcıyı başlat (lifespan startup'ta çağrılmalı)"""
+        if not self.enabled or (self._task is not None and not self._task.done()):
+            return
+
+        self._semaphore = asyncio.Semaphore(self.max_concurrent)
+        self._task      = asyncio.create_task(self._loop())
+
+    async def stop(self):
+        """Zamanlayıcıyı durdur (lifespan shutdown'da çağrılmalı)"""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def get_stats(self) -> dict:
+        return {
+            "enabled"  : self.enabled,
+            "interval" : self.interval,
+            "pages"    : self.pages,
+            "backoff"  : {name: state.failures for name, state in self._states.items() if state.failures},
+        }
@@ -0,0 +1,69 @@
+# Bu araç @keyiflerolsun tarafından | @KekikAkademi için yazılmıştır.
+
+from collections.abc import Awaitable, Callable, Hashable
+from functools       import partial
+from Libs            import without_deadline
+import asyncio
+
+class SingleFlight:
+    """
+    Aynı anahtarlı eşzamanlı çağrıları tek görevde birleştirir (request coalescing)
+    - İlk çağıran görevi başlatır, sonrakiler aynı görevin sonucunu bekler
+    - Hata tüm bekleyenlere aynen iletilir, sonuç / hata saklanmaz (görev bitince anahtar boşalır)
+    - Bekleyenlerden biri iptal edilirse diğerleri etkilenmez (asyncio.shield)
+    - Kimse beklemiyorsa görev iptal edilir; `keep_alive=True` ise (ör. sonucu cache'e yazıyorsa) tamamlanır
+    - Görev ilk çağıranın süre bütçesini taşımaz; her bekleyen kendi bütçesiyle (wait_for) ayrılır
+    """
+
+    def __init__(self):
+        self._tasks   : dict[Hashable, asyncio.Task] = {}
+        self._waiters : dict[Hashable, int]          = {}
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._tasks
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    def start(self, key: Hashable, factory: Callable[[], Awaitable]) -> asyncio.Task:
+        """Anahtar için görev yoksa başlat, varsa mevcut görevi döndür"""
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.create_task(factory(), context=without_deadline())
+            self._tasks[key] = task
+            task.add_done_callback(partial(self._task_done, key))
+        return task
+
+    async def do(self, key: Hashable, factory: Callable[[], Awaitable], keep_alive: bool = False):
+        """Görevi başlat / devam edene katıl ve sonucunu döndür"""
+        task = self.start(key, factory)
+
+        self._waiters[key] = self._waiters.get(key, 0) + 1
+        try:
+            return await asyncio.shield(task)
+        finally:
+            kalan = self._waiters.get(key, 1) - 1
+            if kalan:
+                self._waiters[key] = kalan
+            else:
+                self._waiters.pop(key, None)
+                # Son bekleyen de ayrıldı (iptal) - sonucu isteyen kalmadı
+                if not keep_alive and not task.done():
+                    task.cancel()
+
+    def _task_done(self, key: Hashable, task: asyncio.Task):
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        # Bekleyen kalmadıysa "exception was never retrieved" uyarısını önle
+        if not task.cancelled():
+            task.exception()
+
+    async def stop(self):
+        """Devam eden tüm görevleri iptal et"""
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._tasks.clear()
+        self._waiters.clear()
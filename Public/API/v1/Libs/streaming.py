@@ -0,0 +1,35 @@
+# Bu araç @keyiflerolsun tarafından | @KekikAkademi için yazılmıştır.
+
+from collections.abc   import AsyncGenerator
+from fastapi.encoders  import jsonable_encoder
+from fastapi.responses import StreamingResponse
+import json
+
+# Desteklenen akış formatları - {format: media_type}
+STREAM_FORMATS = {
+    "ndjson" : "application/x-ndjson",
+    "sse"    : "text/event-stream",
+}
+
+def encode_line(veri: dict, format: str) -> bytes:
+    """Tek kaydı NDJSON satırı ya da SSE event'i olarak kodla"""
+    metin = json.dumps(jsonable_encoder(veri), ensure_ascii=False, separators=(",", ":"))
+    if format == "sse":
+        return f"data: {metin}\n\n".encode("utf-8")
+    return f"{metin}\n".encode("utf-8")
+
+def stream_response(kayitlar: AsyncGenerator[dict, None], format: str) -> StreamingResponse:
+    """Kayıtları üretildikleri sırayla NDJSON / SSE olarak akıtan response"""
+    async def akis():
+        try:
+            async for veri in kayitlar:
+                yield encode_line(veri, format)
+        finally:
+            # Client koptuysa üreticideki bekleyen görevler de temizlensin
+            await kayitlar.aclose()
+
+    return StreamingResponse(
+        akis(),
+        media_type = STREAM_FORMATS[format],
+        headers    = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -20,8 +20,10 @@ from . import (
     get_plugin,
     get_main_page,
     search,
+    search_all,
     load_item,
     load_links,
+    batch,
     extract,
     ytdlp_extract
 )
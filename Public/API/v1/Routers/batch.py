@@ -0,0 +1,120 @@
+# Bu araç @keyiflerolsun tarafından | @KekikAkademi için yazılmıştır.
+
+from .      import api_v1_router, api_v1_global_message
+from Core   import Request, JSONResponse
+from ..Libs import plugin_manager, operations
+from ..Libs.streaming import STREAM_FORMATS, stream_response
+from Libs   import request_deadline
+
+from time import monotonic
+import asyncio
+
+# Tek istekteki işlem sayısı ve aynı anda çalışan işlem üst sınırı
+BATCH_MAX_OPERATIONS = 50
+BATCH_MAX_CONCURRENT = 8
+
+# İşlem başına bekleme süresi (sn) - JSON cevapta isteğin kalan bütçesiyle sınırlanır
+BATCH_TIMEOUT = 20.0
+
+# Sonuçları kodlayıp göndermek için istek bütçesinden ayrılan pay (sn)
+BATCH_DEADLINE_MARGIN = 1.0
+
+async def op_get_plugin(plugin_name: str, args: dict):
+    return operations.get_plugin(plugin_name)
+
+async def op_get_main_page(plugin_name: str, args: dict):
+    return await operations.get_main_page(plugin_name, int(args.get("page", 1)), args["encoded_url"], args["encoded_category"])
+
+async def op_search(plugin_name: str, args: dict):
+    return await operations.search(plugin_name, args["query"])
+
+async def op_load_item(plugin_name: str, args: dict):
+    return await operations.load_item(plugin_name, args["encoded_url"])
+
+async def op_load_links(plugin_name: str, args: dict):
+    return await operations.load_links(plugin_name, args["encoded_url"])
+
+# Batch içinde çağrılabilen metodlar (tekil endpoint'lerle aynı çıktı)
+BATCH_OPERATIONS = {
+    "get_plugin"    : op_get_plugin,
+    "get_main_page" : op_get_main_page,
+    "search"        : op_search,
+    "load_item"     : op_load_item,
+    "load_links"    : op_load_links,
+}
+
+async def run_operation(index: int, op: dict, semaphore: asyncio.Semaphore, deadline: float | None = None) -> dict:
+    """Tek işlemi çalıştır, sonucu ya da hatayı kayıt olarak döndür (`deadline`: monotonic mutlak bitiş zamanı)"""
+    kayit = {"index": index, "id": op.get("id", index), "plugin": op.get("plugin"), "method": op.get("method")}
+
+    handler = BATCH_OPERATIONS.get(kayit["method"])
+    if handler is None:
+        return {**kayit, "hata": f"Desteklenmeyen metod. ({', '.join(BATCH_OPERATIONS)})"}
+
+    if kayit["plugin"] not in plugin_manager.get_plugin_names():
+        return {**kayit, "hata": "Eklenti bulunamadı."}
+
+    args = op.get("args") or {}
+    if not isinstance(args, dict):
+        return {**kayit, "hata": "'args' bir obje olmalı."}
+
+    try:
+        async with semaphore:
+            timeout = BATCH_TIMEOUT if deadline is None else min(BATCH_TIMEOUT, deadline - monotonic())
+            if timeout <= 0:
+                raise asyncio.TimeoutError
+            result = await asyncio.wait_for(handler(kayit["plugin"], args), timeout=timeout)
+    except asyncio.TimeoutError:
+        return {**kayit, "hata": "Zaman Aşımı.."}
+    except KeyError as hata:
+        return {**kayit, "hata": f"Eksik argüman: {hata}"}
+    except Exception as hata:
+        return {**kayit, "hata": f"{type(hata).__name__}: {hata}"}
+
+    return {**kayit, "result": result}
+
+async def batch_results(operations: list[dict], deadline: float | None = None):
+    """İşlem sonuçlarını tamamlanma sırasıyla üret, yarıda kalırsa kalan görevleri iptal et"""
+    semaphore = asyncio.Semaphore(BATCH_MAX_CONCURRENT)
+    tasks     = [asyncio.create_task(run_operation(index, op, semaphore, deadline)) for index, op in enumerate(operations)]
+    try:
+        for task in asyncio.as_completed(tasks):
+            yield await task
+    finally:
+        for task in tasks:
+            task.cancel()
+
+@api_v1_router.post("/batch")
+async def batch(request:Request):
+    istek = request.state.veri
+    ornek = {
+        "operations" : [
+            {"id": "eklenti", "plugin": "...", "method": "get_plugin"},
+            {"id": "kategori", "plugin": "...", "method": "get_main_page", "args": {"page": 1, "encoded_url": "", "encoded_category": ""}},
+        ],
+        "format" : "json|ndjson|sse"
+    }
+
+    operations = istek.get("operations") if isinstance(istek, dict) else None
+    if not operations or not isinstance(operations, list) or not all(isinstance(op, dict) for op in operations):
+        return JSONResponse(status_code=410, content={"hata": ornek})
+
+    if len(operations) > BATCH_MAX_OPERATIONS:
+        return JSONResponse(status_code=413, content={"hata": f"En fazla {BATCH_MAX_OPERATIONS} işlem gönderilebilir."})
+
+    _format = istek.get("format", "json")
+    if _format in STREAM_FORMATS:
+        # Akış header'ları hemen gönderildiği için istek timeout'u akışı kesmez - işlemler BATCH_TIMEOUT ile sınırlı
+        return stream_response(batch_results(operations), _format)
+
+    # JSON cevap tüm işlemler bitince döner - istek timeout'a düşüp biten sonuçlar kaybolmasın diye
+    # bütçesi yetmeyen işlemler kendi kaydında zaman aşımı olarak döner
+    deadline = request_deadline.get()
+    if deadline is not None:
+        deadline -= BATCH_DEADLINE_MARGIN
+
+    result = [None] * len(operations)
+    async for kayit in batch_results(operations, deadline):
+        result[kayit["index"]] = kayit
+
+    return {**api_v1_global_message, "result": result}
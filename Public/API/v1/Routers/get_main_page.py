@@ -2,10 +2,9 @@
 
 from .        import api_v1_router, api_v1_global_message
 from Core     import Request, JSONResponse
-from ..Libs   import plugin_manager
+from ..Libs   import plugin_manager, operations
 
-from random       import choice
-from urllib.parse import quote_plus
+from random import choice
 
 @api_v1_router.get("/get_main_page")
 async def get_main_page(request:Request):
@@ -23,9 +22,6 @@ async def get_main_page(request:Request):
     if not _plugin or not _page or not _encoded_url or not _encoded_category:
         return JSONResponse(status_code=410, content={"hata": f"{request.url.path}?plugin={_plugin or choice(plugin_names)}&page=1&encoded_url=&encoded_category="})
 
-    plugin = plugin_manager.select_plugin(_plugin)
-    result = await plugin.get_main_page(_page, _encoded_url, _encoded_category)
-    for icerik in result:
-        icerik.url = quote_plus(icerik.url)
+    result = await operations.get_main_page(_plugin, _page, _encoded_url, _encoded_category)
 
     return {**api_v1_global_message, "result": result}
\ No newline at end of file
@@ -2,10 +2,9 @@
 
 from .        import api_v1_router, api_v1_global_message
 from Core     import Request, JSONResponse
-from ..Libs   import plugin_manager
+from ..Libs   import plugin_manager, operations
 
-from random       import choice
-from urllib.parse import quote_plus
+from random import choice
 
 @api_v1_router.get("/get_plugin")
 async def get_plugin(request:Request):
@@ -19,19 +18,6 @@ async def get_plugin(request:Request):
     if not _plugin:
         return JSONResponse(status_code=410, content={"hata": f"{request.url.path}?plugin={_plugin or choice(plugin_names)}"})
 
-    plugin = plugin_manager.select_plugin(_plugin)
-
-    main_page = {}
-    for url, category in plugin.main_page.items():
-        main_page[quote_plus(url)] = quote_plus(category)
-
-    result = {
-        "name"        : plugin.name,
-        "language"    : plugin.language,
-        "main_url"    : plugin.main_url,
-        "favicon"     : plugin.favicon,
-        "description" : plugin.description,
-        "main_page"   : main_page
-    }
+    result = operations.get_plugin(_plugin)
 
     return {**api_v1_global_message, "result": result}
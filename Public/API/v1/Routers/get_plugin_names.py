@@ -2,10 +2,11 @@
 
 from .        import api_v1_router, api_v1_global_message
 from Core     import Request
-from ..Libs   import plugin_manager
+from ..Libs   import plugin_health
 
 @api_v1_router.get("/get_plugin_names")
 async def get_plugin_names(request: Request):
-    plugin_names = plugin_manager.get_plugin_names()
+    # Circuit'i açık (şu an erişilemeyen) eklentiler listelenmez, durumları "status" altında döner
+    plugin_names = plugin_health.available_names()
 
-    return {**api_v1_global_message, "result": plugin_names}
\ No newline at end of file
+    return {**api_v1_global_message, "result": plugin_names, "status": plugin_health.get_stats()}
\ No newline at end of file
@@ -1,9 +1,10 @@
 # Bu araç @keyiflerolsun tarafından | @KekikAkademi için yazılmıştır.
 
 from Core import JSONResponse
+from Libs import global_request
 from .    import api_v1_router
 
 @api_v1_router.get("/health")
 async def health_check():
     """API sağlık kontrolü"""
-    return JSONResponse({"success": True, "status": "healthy"})
+    return JSONResponse({"success": True, "status": "healthy", "limiter": global_request.limiter.get_stats()})
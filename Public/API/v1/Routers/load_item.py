@@ -2,10 +2,9 @@
 
 from .        import api_v1_router, api_v1_global_message
 from Core     import Request, JSONResponse
-from ..Libs   import plugin_manager, SeriesInfo
+from ..Libs   import plugin_manager, operations
 
-from random       import choice
-from urllib.parse import quote_plus
+from random import choice
 
 @api_v1_router.get("/load_item")
 async def load_item(request:Request):
@@ -20,13 +19,6 @@ async def load_item(request:Request):
     if not _plugin or not _encoded_url:
         return JSONResponse(status_code=410, content={"hata": f"{request.url.path}?plugin={_plugin or choice(plugin_names)}&encoded_url="})
 
-    plugin = plugin_manager.select_plugin(_plugin)
-    result = await plugin.load_item(_encoded_url)
-
-    result.url = quote_plus(result.url)
-
-    if isinstance(result, SeriesInfo):
-        for episode in result.episodes:
-            episode.url = quote_plus(episode.url)
+    result = await operations.load_item(_plugin, _encoded_url)
 
     return {**api_v1_global_message, "result": result}
@@ -2,7 +2,7 @@
 
 from .      import api_v1_router, api_v1_global_message
 from Core   import Request, JSONResponse
-from ..Libs import plugin_manager
+from ..Libs import plugin_manager, operations
 from random import choice
 
 @api_v1_router.get("/load_links")
@@ -18,21 +18,6 @@ async def load_links(request:Request):
     if not _plugin or not _encoded_url:
         return JSONResponse(status_code=410, content={"hata": f"{request.url.path}?plugin={_plugin or choice(plugin_names)}&encoded_url="})
 
-    plugin = plugin_manager.select_plugin(_plugin)
-    links  = await plugin.load_links(_encoded_url)
-
-    result = []
-    for link in links:
-        subtitles = []
-        if link.subtitles:
-            subtitles = [sub.model_dump() for sub in link.subtitles]
-        
-        result.append({
-            "name"       : link.name,
-            "url"        : link.url,
-            "referer"    : link.referer or "",
-            "user_agent" : link.user_agent or "",
-            "subtitles"  : subtitles
-        })
+    result = await operations.load_links(_plugin, _encoded_url)
 
     return {**api_v1_global_message, "result": result}
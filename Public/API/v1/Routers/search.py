@@ -2,10 +2,9 @@
 
 from .        import api_v1_router, api_v1_global_message
 from Core     import Request, JSONResponse
-from ..Libs   import plugin_manager
+from ..Libs   import plugin_manager, operations
 
-from random       import choice
-from urllib.parse import quote_plus
+from random import choice
 
 @api_v1_router.get("/search")
 async def search(request:Request):
@@ -20,10 +19,6 @@ async def search(request:Request):
     if not _plugin or not _query:
         return JSONResponse(status_code=410, content={"hata": f"{request.url.path}?plugin={_plugin or choice(plugin_names)}&query="})
 
-    plugin = plugin_manager.select_plugin(_plugin)
-    result = await plugin.search(_query)
-
-    for elem in result:
-        elem.url = quote_plus(elem.url)
+    result = await operations.search(_plugin, _query)
 
     return {**api_v1_global_message, "result": result}
\ No newline at end of file
@@ -0,0 +1,61 @@
+# Bu araç @keyiflerolsun tarafından | @KekikAkademi için yazılmıştır.
+
+from .      import api_v1_router, api_v1_global_message
+from Core   import Request, JSONResponse, Query
+from ..Libs import plugin_health, operations
+from ..Libs.streaming import STREAM_FORMATS, stream_response
+
+import asyncio
+
+# Tüm istekler genelinde aynı anda çalışan eklenti araması üst sınırı
+# İzin scrape görevinin içinde tutulur - zaman aşımında istemci ayrılsa da devam eden scrape izni bırakmaz
+SEARCH_ALL_MAX_CONCURRENT = 16
+SEARCH_ALL_SEMAPHORE      = asyncio.Semaphore(SEARCH_ALL_MAX_CONCURRENT)
+
+# Eklenti başına bekleme süresi (sn) - yavaş / ölü eklentiler yanıtı bekletmez
+SEARCH_ALL_TIMEOUT     = 10.0
+SEARCH_ALL_MAX_TIMEOUT = 25.0
+
+async def search_plugin(name: str, query: str, timeout: float) -> dict:
+    """Tek eklentide ara, sonucu ya da hatayı kayıt olarak döndür"""
+    try:
+        result = await asyncio.wait_for(operations.search(name, query, limit=SEARCH_ALL_SEMAPHORE), timeout=timeout)
+    except asyncio.TimeoutError:
+        return {"plugin": name, "hata": "Zaman Aşımı.."}
+    except Exception as hata:
+        return {"plugin": name, "hata": f"{type(hata).__name__}: {hata}"}
+
+    return {"plugin": name, "result": result}
+
+async def search_results(names: list[str], query: str, timeout: float):
+    """Eklenti sonuçlarını tamamlanma sırasıyla üret, yarıda kalırsa kalan görevleri iptal et"""
+    tasks = [asyncio.create_task(search_plugin(name, query, timeout)) for name in names]
+    try:
+        for task in asyncio.as_completed(tasks):
+            yield await task
+    finally:
+        for task in tasks:
+            task.cancel()
+
+@api_v1_router.get("/search_all")
+async def search_all(request:Request, timeout: float = Query(SEARCH_ALL_TIMEOUT, gt=0, le=SEARCH_ALL_MAX_TIMEOUT)):
+    istek = request.state.veri
+    if not istek or not istek.get("query"):
+        return JSONResponse(status_code=410, content={"hata": f"{request.url.path}?query=&plugins=&timeout={SEARCH_ALL_TIMEOUT:g}&format=json|ndjson|sse"})
+
+    _query   = istek.get("query")
+    _format  = istek.get("format", "json")
+    _format  = _format if _format in STREAM_FORMATS else "json"
+
+    # Circuit'i açık eklentiler hiç sorgulanmaz
+    plugin_names = plugin_health.available_names()
+    if _plugins := istek.get("plugins"):
+        istenen      = {name.strip() for name in _plugins.split(",")}
+        plugin_names = [name for name in plugin_names if name in istenen]
+
+    if _format in STREAM_FORMATS:
+        return stream_response(search_results(plugin_names, _query, timeout), _format)
+
+    result = [kayit async for kayit in search_results(plugin_names, _query, timeout)]
+
+    return {**api_v1_global_message, "result": result}
@@ -2,13 +2,14 @@
 
 from Core import Request, HTMLResponse, CsrfProtect, Depends
 from .    import home_router, home_template
-from Public.API.v1.Libs import plugin_manager
+from Public.API.v1.Libs import plugin_manager, plugin_health
 
 @home_router.get("/", response_class=HTMLResponse)
 async def ana_sayfa(request: Request, csrf_protect: CsrfProtect = Depends()):
 
     plugins = []
-    for name in plugin_manager.get_plugin_names():
+    # Şu an erişilemeyen (circuit'i açık) eklentiler listelenmez
+    for name in plugin_health.available_names():
         plugin = plugin_manager.select_plugin(name)
 
         # if plugin.name in ["Shorten", "JetFilmizle"]:
@@ -3,7 +3,7 @@
 from Core     import Request, HTMLResponse
 from .        import home_router, home_template
 
-from Public.API.v1.Libs import plugin_manager
+from Public.API.v1.Libs import plugin_manager, plugin_cache
 from urllib.parse       import quote_plus
 
 @home_router.get("/ara/{eklenti_adi}", response_class=HTMLResponse)
@@ -14,8 +14,7 @@ async def ara(request: Request, eklenti_adi: str, sorgu: str):
         if eklenti_adi not in plugin_names:
             raise ValueError(f"'{eklenti_adi}' Bulunamadı!")
 
-        plugin = plugin_manager.select_plugin(eklenti_adi)
-        results = await plugin.search(sorgu)
+        results = await plugin_cache.call(eklenti_adi, "search", sorgu)
 
         for elem in results:
             elem.url = quote_plus(elem.url)
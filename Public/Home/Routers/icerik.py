@@ -3,7 +3,7 @@
 from Core     import Request, HTMLResponse
 from .        import home_router, home_template
 
-from Public.API.v1.Libs import plugin_manager, SeriesInfo
+from Public.API.v1.Libs import plugin_manager, plugin_cache, SeriesInfo
 from urllib.parse       import quote_plus
 
 @home_router.get("/icerik/{eklenti_adi}", response_class=HTMLResponse)
@@ -14,8 +14,7 @@ async def icerik(request: Request, eklenti_adi: str, url: str):
         if eklenti_adi not in plugin_names:
             raise ValueError(f"'{eklenti_adi}' Bulunamadı!")
 
-        plugin  = plugin_manager.select_plugin(eklenti_adi)
-        content = await plugin.load_item(url)
+        content = await plugin_cache.call(eklenti_adi, "load_item", url)
 
         content.url = quote_plus(content.url)
 
@@ -3,7 +3,7 @@
 from Core import Request, HTMLResponse
 from .    import home_router, home_template
 
-from Public.API.v1.Libs import plugin_manager
+from Public.API.v1.Libs import plugin_manager, plugin_cache
 from Settings           import PROXY_URL, WS_URL
 
 @home_router.get("/izle/{eklenti_adi}", response_class=HTMLResponse)
@@ -14,9 +14,7 @@ async def izle(request: Request, eklenti_adi: str, url: str, baslik: str):
         if eklenti_adi not in plugin_names:
             raise ValueError(f"'{eklenti_adi}' Bulunamadı!")
 
-        plugin = plugin_manager.select_plugin(eklenti_adi)
-
-        load_links = await plugin.load_links(url)
+        load_links = await plugin_cache.call(eklenti_adi, "load_links", url)
 
         links = []
         for link in load_links:
@@ -3,7 +3,7 @@
 from Core     import Request, HTMLResponse
 from .        import home_router, home_template
 
-from Public.API.v1.Libs import plugin_manager
+from Public.API.v1.Libs import plugin_manager, plugin_cache
 from urllib.parse       import quote_plus
 
 @home_router.get("/kategori/{eklenti_adi}", response_class=HTMLResponse)
@@ -14,8 +14,7 @@ async def kategori(request: Request, eklenti_adi: str, kategori_url: str, katego
         if eklenti_adi not in plugin_names:
             raise ValueError(f"'{eklenti_adi}' Bulunamadı!")
 
-        plugin = plugin_manager.select_plugin(eklenti_adi)
-        items  = await plugin.get_main_page(sayfa, kategori_url, kategori_adi)
+        items = await plugin_cache.call(eklenti_adi, "get_main_page", sayfa, kategori_url, kategori_adi)
         for icerik in items:
             icerik.url = quote_plus(icerik.url)
 
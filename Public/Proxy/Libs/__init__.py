@@ -5,6 +5,7 @@ from .helpers import (
     prepare_request_headers,
     prepare_response_headers,
     detect_hls_from_url,
+    is_hls_segment,
     stream_wrapper,
     process_subtitle_content
 )
\ No newline at end of file
@@ -0,0 +1,167 @@
+# Bu araç @keyiflerolsun tarafından | @KekikAkademi için yazılmıştır.
+
+from CLI            import konsol
+from collections    import OrderedDict
+from Libs           import proxy_request
+from .helpers       import DEFAULT_CHUNK_SIZE
+from .metrics       import proxy_metrics
+from Settings       import PROXY_CACHE_MB, PROXY_CACHE_TTL
+from .segment_cache import SegmentCache
+import httpx
+
+class RangeIncomplete(Exception):
+    """Header'ları gönderilmiş aralık tamamlanamadı - bağlantı kesilir, client yeniden dener"""
+    def __init__(self, url: str, position: int, end: int):
+        super().__init__(f"Aralık tamamlanamadı: {position}-{end} | {url}")
+        self.url      = url
+        self.position = position
+        self.end      = end
+
+class BlockCache(SegmentCache):
+    """
+    Progressive video (mp4/mkv/webm) için blok hizalı byte-range cache
+    - Anahtar: (url, blok index) - her blok `block_size` byte (dosyanın son bloğu hariç)
+    - Depolama / LRU / hard TTL davranışı SegmentCache ile aynı
+    - Dosya başına toplam boyut ve content-type meta olarak tutulur (Content-Range üretmek için)
+    - Meta sadece Range destekleyen origin'ler için tutulur; Range isteği reddedilir ya da aralık tamamlanamazsa unutulur
+    """
+
+    def __init__(self, max_size_mb: int = 128, hard_ttl_seconds: int = 900, block_size: int = 1024 * 1024, max_meta_items: int = 1024):
+        super().__init__(max_size_mb=max_size_mb, hard_ttl_seconds=hard_ttl_seconds)
+        self.block_size     = block_size
+        self.max_meta_items = max_meta_items
+
+        # {url: {"total": int, "content_type": str}}
+        self._meta: OrderedDict[str, dict] = OrderedDict()
+
+    def get_meta(self, url: str) -> dict | None:
+        if (meta := self._meta.get(url)) is not None:
+            self._meta.move_to_end(url)
+        return meta
+
+    def set_meta(self, url: str, total: int, content_type: str):
+        self._meta[url] = {"total": total, "content_type": content_type}
+        self._meta.move_to_end(url)
+        while len(self._meta) > self.max_meta_items:
+            self._meta.popitem(last=False)
+
+    def forget_meta(self, url: str):
+        """Dosyanın meta'sını sil (sonraki istekler origin'e düz proxy'lenir)"""
+        self._meta.pop(url, None)
+
+    async def fetch_range(self, url: str, index: int, end: int, request_headers: dict) -> tuple[httpx.Response, int] | None:
+        """
+        `index`. bloktan başlayan ardışık eksik blokları (en fazla `end`'e kadar) tek Range isteğiyle, blok hizalı ister.
+        (response, istenen son byte) döndürür; origin Range'i desteklemiyorsa meta'yı unutur, None döndürür
+        """
+        block_size  = self.block_size
+        last_index  = end // block_size
+        missing_end = index
+        while missing_end < last_index and (url, missing_end + 1) not in self:
+            missing_end += 1
+
+        fetch_end = min((missing_end + 1) * block_size - 1, end)
+        headers   = {**request_headers, "Range": f"bytes={index * block_size}-{fetch_end}"}
+        response  = await proxy_request.stream(url, headers=headers)
+
+        if response.status_code != 206:
+            await response.aclose()
+            self.forget_meta(url)
+            konsol.print(f"[red]Range isteği desteklenmedi: {response.status_code}[/red]")
+            return None
+
+        return response, fetch_end
+
+    async def tee_blocks(self, url: str, response: httpx.Response, offset: int, total: int, skip: int = 0):
+        """
+        Origin body'sini client'a akıtır ve tamamlanan blokları cache'e yazar.
+        `offset`: body'nin dosyadaki başlangıç byte'ı, `skip`: client'a gönderilmeyecek baştaki byte sayısı
+        """
+        block_size = self.block_size
+        buffer     = bytearray()
+        position   = offset  # buffer'ın dosyadaki başlangıcı
+
+        try:
+            async for chunk in response.aiter_bytes(chunk_size=DEFAULT_CHUNK_SIZE):
+                if skip:
+                    if len(chunk) <= skip:
+                        skip -= len(chunk)
+                    else:
+                        yield chunk[skip:]
+                        skip = 0
+                else:
+                    yield chunk
+
+                buffer += chunk
+
+                # Blok sınırına hizalı değilse sınıra kadar olan kısmı cache'leme
+                if misaligned := position % block_size:
+                    drop = min(len(buffer), block_size - misaligned)
+                    del buffer[:drop]
+                    position += drop
+
+                while len(buffer) >= block_size:
+                    await self.set((url, position // block_size), bytes(buffer[:block_size]))
+                    del buffer[:block_size]
+                    position += block_size
+
+            # Dosyanın son (kısa) bloğu
+            if buffer and position % block_size == 0 and position + len(buffer) == total:
+                await self.set((url, position // block_size), bytes(buffer))
+
+        except Exception as e:
+            konsol.print(f"[red]Stream hatası: {str(e)}[/red]")
+        finally:
+            # Client koparsa (GeneratorExit / CancelledError) bağlantı kapatılıp hata yukarı iletilir
+            await response.aclose()
+
+    async def iter_range(self, url: str, start: int, end: int, request_headers: dict, first: tuple[httpx.Response, int] | None = None):
+        """
+        [start, end] aralığını cache'teki bloklardan akıtır, eksik blok aralıklarını origin'den tamamlar.
+        `first`: ilk blok eksikse önceden açılmış `fetch_range` sonucu.
+        Header'lar (Content-Length) gönderildikten sonra aralık tamamlanamazsa meta unutulur ve RangeIncomplete fırlatılır;
+        kısa body yerine bağlantı kesilir, sonraki istekler düz proxy'ye düşer
+        """
+        block_size = self.block_size
+        total      = self._meta.get(url, {}).get("total", 0)
+        position   = start
+
+        while position <= end:
+            index = position // block_size
+            # Önceden açılmış istek ilk bloğa ait - arada cache'e yazılmış olsa da o kullanılır
+            block = None if first else await self.get((url, index))
+
+            if block:
+                piece = block[position - index * block_size : end - index * block_size + 1]
+                if not piece:
+                    self.forget_meta(url)
+                    raise RangeIncomplete(url, position, end)
+
+                proxy_metrics.add_bytes("block", len(piece))
+                yield piece
+                position += len(piece)
+                continue
+
+            # Ardışık eksik blokları tek Range isteğiyle, blok hizalı iste
+            fetched, first = first or await self.fetch_range(url, index, end, request_headers), None
+            if fetched is None:
+                raise RangeIncomplete(url, position, end)
+
+            response, fetch_end = fetched
+            aligned             = index * block_size
+            stream              = self.tee_blocks(url, response, aligned, total, skip=position - aligned)
+            try:
+                async for piece in stream:
+                    proxy_metrics.add_bytes("origin", len(piece))
+                    yield piece
+                    position += len(piece)
+            finally:
+                await stream.aclose()
+
+            # Origin beklenenden kısa döndü
+            if position <= fetch_end:
+                self.forget_meta(url)
+                raise RangeIncomplete(url, position, end)
+
+# Global cache instance
+block_cache = BlockCache(max_size_mb=PROXY_CACHE_MB, hard_ttl_seconds=PROXY_CACHE_TTL)
@@ -0,0 +1,247 @@
+# Bu araç @keyiflerolsun tarafından | @KekikAkademi için yazılmıştır.
+
+from collections    import OrderedDict
+from hashlib        import sha1
+from itertools      import count
+from pathlib        import Path
+from time           import time
+from Settings       import PROXY_DISK_CACHE_DIR, PROXY_DISK_CACHE_MB
+from .segment_cache import segment_cache
+import asyncio, mmap, os, threading
+
+class DiskSegmentCache:
+    """
+    Disk tabanlı ikinci kademe (L2) segment cache
+    - RAM'deki SegmentCache'ten (L1) LRU ile atılan segmentler diske yazılır
+    - Boyut limitli, LRU sıralı; L1 ile aynı hard TTL (oluşturulma zamanı L1'den taşınır)
+    - Hit'ler mmap üzerinden kopyalanmadan (memoryview) servis edilir
+    - `promote_after_hits` kez istenen segment `promote_to`'ya (L1) geri taşınır, diskten silinir
+    - Her yazma benzersiz dosya adı kullanır; kuyruktaki silme aynı URL'nin yeni dosyasına dokunmaz
+    - Index RAM'de tutulur; başlangıçta dizindeki eski dosyalar temizlenir
+    """
+
+    def __init__(self, directory: str, max_size_mb: int = 1024, hard_ttl_seconds: int = 900, max_pending_writes: int = 32, sweep_interval: int = 60, promote_after_hits: int = 2):
+        self.directory          = Path(directory) if directory else None
+        self.max_size_bytes     = max_size_mb * 1024 * 1024
+        self.hard_ttl_seconds   = hard_ttl_seconds
+        self.max_pending_writes = max_pending_writes
+        self.sweep_interval     = sweep_interval
+        self.promote_after_hits = promote_after_hits
+
+        # Index: {url: (path, created_at, size)} - baş = en eski erişim, son = en yeni
+        self._index: OrderedDict[str, tuple[Path, float, int]] = OrderedDict()
+        self._hit_counts: dict[str, int] = {}
+        self._total_size     = 0
+        self._pending_writes = 0
+        self._sweep_task     = None
+        self._generation     = count()
+
+        # Hit'leri geri taşınacak üst kademe (set(url, content, created_at) metodu olan nesne)
+        self.promote_to = None
+
+        self.hits    = 0
+        self.misses  = 0
+        self.dropped = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.directory is not None
+
+    def _path_for(self, url: str) -> Path:
+        return self.directory / f"{sha1(url.encode('utf-8')).hexdigest()}.{next(self._generation)}"
+
+    # ============== Disk I/O (thread) ==============
+
+    @staticmethod
+    def _write_file(path: Path, content: bytes):
+        tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        with open(tmp_path, "wb") as dosya:
+            dosya.write(content)
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def _map_file(path: Path) -> mmap.mmap:
+        with open(path, "rb") as dosya:
+            return mmap.mmap(dosya.fileno(), 0, access=mmap.ACCESS_READ)
+
+    @staticmethod
+    def _remove_files(paths: list[Path]):
+        for path in paths:
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+    def _reset_directory(self):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._remove_files([path for path in self.directory.iterdir() if path.is_file()])
+
+    # ============== Cache ==============
+
+    def spill(self, url: str, content: bytes, created_at: float):
+        """L1'den atılan segmenti arka planda diske yaz (yazma kuyruğu doluysa düşür)"""
+        if not content or time() - created_at > self.hard_ttl_seconds:
+            return
+
+        if self._pending_writes >= self.max_pending_writes:
+            self.dropped += 1
+            return
+
+        self._pending_writes += 1
+        asyncio.create_task(self._write(url, content, created_at))
+
+    async def _write(self, url: str, content: bytes, created_at: float):
+        path = self._path_for(url)
+        try:
+            await asyncio.to_thread(self._write_file, path, content)
+        except OSError:
+            return
+        finally:
+            self._pending_writes -= 1
+
+        # Aynı URL'nin eski dosyası da silinir (yeni dosyanın adı farklı)
+        evicted = []
+        if (old_path := self._discard(url)) is not None:
+            evicted.append(old_path)
+
+        self._index[url] = (path, created_at, len(content))
+        self._total_size += len(content)
+
+        # Boyut limiti aşıldıysa baştan (en az kullanılan) sil
+        while self._total_size > self.max_size_bytes and self._index:
+            old_url, (old_path, _, size) = self._index.popitem(last=False)
+            self._hit_counts.pop(old_url, None)
+            self._total_size -= size
+            evicted.append(old_path)
+
+        if evicted:
+            await asyncio.to_thread(self._remove_files, evicted)
+
+    def _discard(self, url: str) -> Path | None:
+        if (entry := self._index.pop(url, None)) is None:
+            return None
+
+        self._hit_counts.pop(url, None)
+        self._total_size -= entry[2]
+        return entry[0]
+
+    async def get(self, url: str) -> mmap.mmap | None:
+        """
+        Segment'i mmap olarak döndür (kopyalama yok) ve LRU sırasını güncelle.
+        mmap'i çağıran kapatır; sık istenen segment bu hit'te L1'e de taşınır
+        """
+        entry = self._index.get(url)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        path, created_at, _ = entry
+
+        # Hard TTL kontrolü (15 dakika)
+        if time() - created_at > self.hard_ttl_seconds:
+            self._discard(url)
+            await asyncio.to_thread(self._remove_files, [path])
+            self.misses += 1
+            return None
+
+        try:
+            mapped = await asyncio.to_thread(self._map_file, path)
+        except (OSError, ValueError):
+            # Beklerken yeni dosya yazıldıysa o kayda dokunma
+            if self._index.get(url, (None,))[0] == path:
+                self._discard(url)
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        if url not in self._index:
+            return mapped
+
+        self._index.move_to_end(url)
+        hit_count = self._hit_counts[url] = self._hit_counts.get(url, 0) + 1
+        if self.promote_to is not None and hit_count >= self.promote_after_hits:
+            await self._promote(url, mapped, created_at)
+
+        return mapped
+
+    async def _promote(self, url: str, mapped: mmap.mmap, created_at: float):
+        """Segment'i üst kademeye kopyala, diskten sil (açık mmap silinen dosyada geçerli kalır)"""
+        path = self._discard(url)
+        await self.promote_to.set(url, bytes(mapped), created_at=created_at)
+        if path is not None:
+            await asyncio.to_thread(self._remove_files, [path])
+
+    async def sweep_expired(self) -> int:
+        """Hard TTL dolmuş dosyaları sil, silinen sayısını döndür"""
+        current_time = time()
+
+        expired_urls = [
+            url for url, (_, created_at, _) in self._index.items()
+            if current_time - created_at > self.hard_ttl_seconds
+        ]
+        expired_paths = [self._discard(url) for url in expired_urls]
+
+        if expired_paths:
+            await asyncio.to_thread(self._remove_files, expired_paths)
+
+        return len(expired_paths)
+
+    async def _sweep_loop(self):
+        """Periyodik TTL süpürücü"""
+        while True:
+            await asyncio.sleep(self.sweep_interval)
+            try:
+                await self.sweep_expired()
+            except Exception:
+                pass
+
+    async def start(self):
+        """Dizini hazırla ve süpürücüyü başlat (lifespan startup'ta çağrılmalı)"""
+        if not self.enabled:
+            return
+
+        await asyncio.to_thread(self._reset_directory)
+        if self._sweep_task is None or self._sweep_task.done():
+            self._sweep_task = asyncio.create_task(self._sweep_loop())
+
+    async def stop(self):
+        """Süpürücüyü durdur ve diski temizle (lifespan shutdown'da çağrılmalı)"""
+        if self._sweep_task:
+            self._sweep_task.cancel()
+            try:
+                await self._sweep_task
+            except asyncio.CancelledError:
+                pass
+            self._sweep_task = None
+
+        if self.enabled:
+            self._index.clear()
+            self._hit_counts.clear()
+            self._total_size = 0
+            await asyncio.to_thread(self._reset_directory)
+
+    def get_stats(self) -> dict:
+        """Cache istatistikleri"""
+        return {
+            "enabled"          : self.enabled,
+            "total_items"      : len(self._index),
+            "total_size_mb"    : round(self._total_size / (1024 * 1024), 2),
+            "total_size_bytes" : self._total_size,
+            "max_size_mb"      : round(self.max_size_bytes / (1024 * 1024), 2),
+            "hard_ttl_minutes" : self.hard_ttl_seconds // 60,
+            "hits"             : self.hits,
+            "misses"           : self.misses,
+            "dropped_writes"   : self.dropped,
+        }
+
+# Global cache instance (PROXY_DISK_CACHE_DIR boşsa devre dışı)
+disk_segment_cache = DiskSegmentCache(
+    directory        = PROXY_DISK_CACHE_DIR,
+    max_size_mb      = PROXY_DISK_CACHE_MB,
+    hard_ttl_seconds = segment_cache.hard_ttl_seconds
+)
+
+# L1'den atılan segmentler L2'ye, L2'de sık istenenler L1'e taşınır
+if disk_segment_cache.enabled:
+    segment_cache.spill_to        = disk_segment_cache
+    disk_segment_cache.promote_to = segment_cache
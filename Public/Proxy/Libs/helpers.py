@@ -2,13 +2,21 @@
 
 from CLI          import konsol
 from fastapi      import Request
+from collections  import OrderedDict
+from hashlib      import blake2b
+from time         import time
 from urllib.parse import unquote, urljoin, quote
-import httpx, traceback, re
+import httpx, traceback, asyncio
 
 DEFAULT_USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_14_5)"
 DEFAULT_REFERER    = "https://twitter.com/"
 DEFAULT_CHUNK_SIZE = 1024 * 128  # 128KB
 
+# Yeniden yazılmış manifest memo'su - {(url, içerik hash, referer, user_agent): (içerik, zaman)}
+MANIFEST_MEMO_TTL       = 30
+MANIFEST_MEMO_MAX_ITEMS = 256
+_manifest_memo: OrderedDict[tuple, tuple[bytes, float]] = OrderedDict()
+
 CONTENT_TYPES = {
     ".m3u8" : "application/vnd.apple.mpegurl",
     ".ts"   : "video/mp2t",
@@ -21,6 +29,7 @@ CORS_HEADERS = {
     "Access-Control-Allow-Origin"  : "*",
     "Access-Control-Allow-Methods" : "GET, HEAD, OPTIONS",
     "Access-Control-Allow-Headers" : "Origin, Content-Type, Accept, Range",
+    "Access-Control-Expose-Headers": "Content-Length, Content-Range, Accept-Ranges",
 }
 
 def get_content_type(url: str, response_headers: dict) -> str:
@@ -38,8 +47,8 @@ def get_content_type(url: str, response_headers: dict) -> str:
     # 3. Varsayılan
     return "video/mp4"
 
-def prepare_request_headers(request: Request, url: str, referer: str | None, user_agent: str | None) -> dict:
-    """Proxy isteği için headerları hazırlar"""
+def prepare_request_headers(request: Request, url: str, referer: str | None, user_agent: str | None, forward_range: bool = False) -> dict:
+    """Proxy isteği için headerları hazırlar (forward_range: client'ın Range header'ını origin'e ilet)"""
     headers = {}
 
     # Standart headerlar (Eğer extra_headers'da yoksa ekle)
@@ -59,8 +68,45 @@ def prepare_request_headers(request: Request, url: str, referer: str | None, use
     if referer and referer != "None":
         headers["referer"] = unquote(referer)
 
+    if forward_range and request is not None and (range_header := request.headers.get("range")):
+        headers["Range"] = range_header
+
     return headers
 
+def parse_range_header(range_header: str | None, total: int) -> tuple[int, int] | None:
+    """Tekli `bytes=` Range header'ını [start, end] aralığına çevirir (geçersiz / çoklu aralık -> None)"""
+    if not range_header or not range_header.startswith("bytes=") or "," in range_header:
+        return None
+
+    start_str, _, end_str = range_header[6:].strip().partition("-")
+    try:
+        if not start_str:
+            # bytes=-N -> son N byte
+            start = max(total - int(end_str), 0)
+            end   = total - 1
+        else:
+            start = int(start_str)
+            end   = min(int(end_str), total - 1) if end_str else total - 1
+    except ValueError:
+        return None
+
+    if start > end:
+        return None
+
+    return start, end
+
+def parse_content_range(content_range: str | None) -> tuple[int, int | None] | None:
+    """`bytes start-end/total` -> (start, total) ; total bilinmiyorsa (`*`) None"""
+    if not content_range or not content_range.startswith("bytes "):
+        return None
+
+    try:
+        span, _, total = content_range[6:].partition("/")
+        start = int(span.split("-")[0])
+        return start, (int(total) if total.isdigit() else None)
+    except ValueError:
+        return None
+
 def prepare_response_headers(response_headers: dict, url: str, detected_content_type: str = None) -> dict:
     """Client'a dönecek headerları hazırlar"""
     headers = CORS_HEADERS.copy()
@@ -90,62 +136,97 @@ def detect_hls_from_url(url: str) -> bool:
     indicators = (".m3u8", "/m.php", "/l.php", "/ld.php", "master.txt", "embed/sheila")
     return any(x in url for x in indicators)
 
+def is_hls_segment(url: str) -> bool:
+    """URL'nin HLS segment'i olup olmadığını kontrol et"""
+    url_lower = url.lower()
+
+    # Manifest'leri hariç tut
+    if ".m3u8" in url_lower:
+        return False
+
+    # Segment göstergeleri
+    segment_indicators = (".ts", ".m4s", "seg-", "chunk-", "fragment", ".png")
+    return any(indicator in url_lower for indicator in segment_indicators)
+
+def build_proxy_query_suffix(referer: str = None, user_agent: str = None) -> str:
+    """Proxy URL'lerine eklenecek referer / user_agent query parçası (manifest başına bir kez hesaplanır)"""
+    suffix = ""
+    if referer:
+        suffix += f'&referer={quote(referer, safe="")}'
+    if user_agent:
+        suffix += f'&user_agent={quote(user_agent, safe="")}'
+    return suffix
+
+def _rewrite_hls_manifest(content: bytes, base_url: str, suffix: str) -> bytes:
+    """Tek geçişte, bytes üzerinde, regex'siz manifest yeniden yazımı"""
+    def proxy_url(uri: bytes) -> bytes:
+        uri_str      = uri.decode("utf-8")
+        absolute_url = uri_str if uri_str.startswith(("http://", "https://")) else urljoin(base_url, uri_str)
+        return f'/proxy/video?url={quote(absolute_url, safe="")}{suffix}'.encode("utf-8")
+
+    new_lines = []
+    for line in content.split(b"\n"):
+        # URI="..." içeren satırları işle (audio/subtitle tracks, key, map)
+        if b'URI="' in line:
+            parts    = []
+            position = 0
+            while (start := line.find(b'URI="', position)) != -1:
+                start += 5
+                end    = line.find(b'"', start)
+                if end == -1:
+                    break
+                parts.append(line[position:start])
+                parts.append(proxy_url(line[start:end]) if end > start else b"")
+                position = end
+            parts.append(line[position:])
+            new_lines.append(b"".join(parts))
+            continue
+
+        # Segment URL satırları (# ile başlamayan ve boş olmayan)
+        stripped = line.strip()
+        if stripped and not stripped.startswith(b"#"):
+            new_lines.append(proxy_url(stripped))
+        else:
+            new_lines.append(line)
+
+    return b"\n".join(new_lines)
+
 def rewrite_hls_manifest(content: bytes, base_url: str, referer: str = None, user_agent: str = None) -> bytes:
     """
     HLS manifest içindeki göreceli URL'leri proxy URL'lerine dönüştürür.
-    
+    Aynı (manifest URL, içerik hash, referer, user_agent) için sonuç kısa süre memoize edilir;
+    böylece canlı yayında aynı playlist'i yoklayan izleyiciler yeniden yazım maliyeti ödemez.
+
     Args:
         content: HLS manifest içeriği (bytes)
         base_url: Orijinal manifest URL'i (göreceli URL'lerin çözümleneceği base)
         referer: Referer header değeri
-    
+
     Returns:
         Yeniden yazılmış manifest içeriği (bytes)
     """
-    try:
-        text = content.decode('utf-8')
-    except UnicodeDecodeError:
-        return content  # Binary içerik, değiştirme
-
     # HLS manifest değilse değiştirme
-    if not text.strip().startswith('#EXTM3U'):
+    if not content.lstrip().startswith(b"#EXTM3U"):
         return content
 
-    lines = text.split('\n')
-    new_lines = []
+    memo_key = (base_url, blake2b(content, digest_size=16).digest(), referer, user_agent)
+    now      = time()
 
-    for line in lines:
-        stripped = line.strip()
-
-        # URI="..." içeren satırları işle (audio/subtitle tracks)
-        if 'URI="' in line:
-            def replace_uri(match):
-                uri = match.group(1)
-                absolute_url = urljoin(base_url, uri)
-                proxy_url = f'/proxy/video?url={quote(absolute_url, safe="")}'
-                if referer:
-                    proxy_url += f'&referer={quote(referer, safe="")}'
-                if user_agent:
-                    proxy_url += f'&user_agent={quote(user_agent, safe="")}'
-                return f'URI="{proxy_url}"'
-
-            line = re.sub(r'URI="([^"]+)"', replace_uri, line)
-            new_lines.append(line)
+    if (memo := _manifest_memo.get(memo_key)) is not None and now - memo[1] < MANIFEST_MEMO_TTL:
+        _manifest_memo.move_to_end(memo_key)
+        return memo[0]
 
-        # Segment URL satırları (# ile başlamayan ve boş olmayan)
-        elif stripped and not stripped.startswith('#'):
-            absolute_url = urljoin(base_url, stripped)
-            proxy_url = f'/proxy/video?url={quote(absolute_url, safe="")}'
-            if referer:
-                proxy_url += f'&referer={quote(referer, safe="")}'
-            if user_agent:
-                proxy_url += f'&user_agent={quote(user_agent, safe="")}'
-            new_lines.append(proxy_url)
+    try:
+        rewritten = _rewrite_hls_manifest(content, base_url, build_proxy_query_suffix(referer, user_agent))
+    except UnicodeDecodeError:
+        return content  # Binary içerik, değiştirme
 
-        else:
-            new_lines.append(line)
+    _manifest_memo[memo_key] = (rewritten, now)
+    _manifest_memo.move_to_end(memo_key)
+    while len(_manifest_memo) > MANIFEST_MEMO_MAX_ITEMS:
+        _manifest_memo.popitem(last=False)
 
-    return '\n'.join(new_lines).encode('utf-8')
+    return rewritten
 
 async def stream_wrapper(response: httpx.Response):
     """Response içeriğini yield eder ve HLS kontrolü yapar"""
@@ -170,17 +251,60 @@ async def stream_wrapper(response: httpx.Response):
                 #     konsol.print(f"[red]⚠️  UYARI: Kaynak HTML döndürüyor![/red]")
 
             yield chunk
-            
-    except GeneratorExit:
-        pass
+
     except Exception as e:
         konsol.print(f"[red]Stream hatası: {str(e)}[/red]")
         konsol.print(traceback.format_exc())
-    except BaseException:
-        pass
     finally:
+        # Client koparsa (GeneratorExit / CancelledError) bağlantı kapatılıp hata yukarı iletilir
         await response.aclose()
 
+class SegmentDownload:
+    """
+    Origin body'sini client'tan bağımsız bir task'ta indirir
+    - Chunk'lar geldikçe `stream()` ile client'a akıtılır; client koparsa indirme yine tamamlanır
+    - İndirme eksiksiz biterse `on_complete(content)`, aksi halde `on_complete(None)` çağrılır
+    """
+
+    # Devam eden indirmeler - task'lar GC ile toplanmasın diye referans tutulur
+    _tasks: set[asyncio.Task] = set()
+
+    def __init__(self, response: httpx.Response, on_complete):
+        self._queue: asyncio.Queue[bytes | None] = asyncio.Queue()
+
+        task = asyncio.create_task(self._run(response, on_complete))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, response: httpx.Response, on_complete):
+        chunks   = []
+        total    = 0
+        complete = False
+        try:
+            async for chunk in response.aiter_bytes(chunk_size=DEFAULT_CHUNK_SIZE):
+                chunks.append(chunk)
+                total += len(chunk)
+                self._queue.put_nowait(chunk)
+
+            # Content-Length varsa eksik (kesilmiş) body'yi cache'leme
+            # Content-Encoding varsa Content-Length sıkıştırılmış boyuttur, decode edilmiş body ile karşılaştırılmaz
+            expected = response.headers.get("content-length")
+            encoded  = bool(response.headers.get("content-encoding"))
+            complete = encoded or not (expected and expected.isdigit() and int(expected) != total)
+
+        except Exception as e:
+            konsol.print(f"[red]Stream hatası: {str(e)}[/red]")
+        finally:
+            self._queue.put_nowait(None)
+            await response.aclose()
+            # Tek seferde birleştir (her chunk'ta yeniden kopyalama yok)
+            await on_complete(b"".join(chunks) if complete else None)
+
+    async def stream(self):
+        """İndirilen chunk'ları sırayla yield eder (client koparsa sadece akış durur)"""
+        while (chunk := await self._queue.get()) is not None:
+            yield chunk
+
 def process_subtitle_content(content: bytes, content_type: str, url: str) -> bytes:
     """Altyazı içeriğini işler ve VTT formatına çevirir"""
     # 1. UTF-8 BOM temizliği
@@ -0,0 +1,129 @@
+# Bu araç @keyiflerolsun tarafından | @KekikAkademi için yazılmıştır.
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools   import partial
+from time        import time
+from Libs        import proxy_request, without_deadline
+import asyncio
+
+# 304 yanıtında güncellenen origin headerları
+REVALIDATION_HEADERS = ("etag", "last-modified", "cache-control", "expires", "date")
+
+@dataclass
+class ManifestEntry:
+    """Cache'teki origin manifest'i"""
+    content    : bytes
+    headers    : dict[str, str]
+    fetched_at : float
+    ttl        : float
+
+    @property
+    def is_fresh(self) -> bool:
+        return time() - self.fetched_at < self.ttl
+
+class ManifestCache:
+    """
+    HLS manifest cache - canlı yayını yoklayan izleyiciler için
+    - Media playlist TTL'i `#EXT-X-TARGETDURATION`'ın yarısı (yeni segmentler gecikmeden görünür)
+    - `#EXT-X-ENDLIST` içeren VOD playlist'ler hard TTL boyunca sabit kabul edilir
+    - Süresi dolan kayıt origin'e `If-None-Match` / `If-Modified-Since` ile sorulur, 304 ise gövde yeniden kullanılır
+    - Aynı manifest için eşzamanlı origin istekleri tek istekte birleştirilir
+    """
+
+    def __init__(self, max_items: int = 512, hard_ttl_seconds: int = 900, master_ttl_seconds: int = 60, default_ttl_seconds: float = 2.0):
+        self.max_items           = max_items
+        self.hard_ttl_seconds    = hard_ttl_seconds
+        self.master_ttl_seconds  = master_ttl_seconds
+        self.default_ttl_seconds = default_ttl_seconds
+
+        self._entries  : OrderedDict[tuple, ManifestEntry] = OrderedDict()
+        self._inflight : dict[tuple, asyncio.Task]         = {}
+
+    def _ttl_for(self, content: bytes) -> float:
+        """Playlist tipine göre TTL belirle"""
+        if b"#EXT-X-ENDLIST" in content:
+            return self.hard_ttl_seconds
+
+        if b"#EXT-X-STREAM-INF" in content:
+            return self.master_ttl_seconds
+
+        marker = content.find(b"#EXT-X-TARGETDURATION:")
+        if marker != -1:
+            value = content[marker + 22 : marker + 32].split(b"\n", 1)[0].strip()
+            try:
+                return max(float(value) / 2, 1.0)
+            except ValueError:
+                pass
+
+        return self.default_ttl_seconds
+
+    async def fetch(self, url: str, request_headers: dict, key: tuple) -> tuple[int, dict[str, str], bytes]:
+        """Manifest'i (status_code, origin headerları, içerik) olarak döndür"""
+        entry = self._entries.get(key)
+        if entry is not None and entry.is_fresh:
+            self._entries.move_to_end(key)
+            return 200, entry.headers, entry.content
+
+        # Origin isteği ayrı task'ta çalışır; isteyen client koparsa ya da süre bütçesi biterse bekleyenler etkilenmez
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._revalidate(url, request_headers, key, entry), context=without_deadline())
+            self._inflight[key] = task
+            task.add_done_callback(partial(self._task_done, key))
+
+        return await asyncio.shield(task)
+
+    def _task_done(self, key: tuple, task: asyncio.Task):
+        self._inflight.pop(key, None)
+        # Bekleyen kalmadıysa "exception was never retrieved" uyarısını önle
+        if not task.cancelled():
+            task.exception()
+
+    async def _revalidate(self, url: str, request_headers: dict, key: tuple, entry: ManifestEntry | None) -> tuple[int, dict[str, str], bytes]:
+        headers = dict(request_headers)
+        if entry is not None:
+            if etag := entry.headers.get("etag"):
+                headers["If-None-Match"] = etag
+            if last_modified := entry.headers.get("last-modified"):
+                headers["If-Modified-Since"] = last_modified
+
+        response = await proxy_request.fetch(url, headers=headers)
+
+        # Değişmemiş - eldeki gövdeyi tazele
+        if response.status_code == 304 and entry is not None:
+            for name in REVALIDATION_HEADERS:
+                if value := response.headers.get(name):
+                    entry.headers[name] = value
+            entry.fetched_at = time()
+            self._store(key, entry)
+            return 200, entry.headers, entry.content
+
+        response_headers = dict(response.headers)
+        content          = response.content
+
+        if response.status_code >= 400:
+            self._entries.pop(key, None)
+            return response.status_code, response_headers, content
+
+        if response.status_code == 200 and content.lstrip().startswith(b"#EXTM3U"):
+            self._store(key, ManifestEntry(content=content, headers=response_headers, fetched_at=time(), ttl=self._ttl_for(content)))
+
+        return response.status_code, response_headers, content
+
+    def _store(self, key: tuple, entry: ManifestEntry):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_items:
+            self._entries.popitem(last=False)
+
+    def get_stats(self) -> dict:
+        """Cache istatistikleri"""
+        return {
+            "total_items" : len(self._entries),
+            "max_items"   : self.max_items,
+            "inflight"    : len(self._inflight),
+        }
+
+# Global cache instance
+manifest_cache = ManifestCache()
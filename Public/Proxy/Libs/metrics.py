@@ -0,0 +1,49 @@
+# Bu araç @keyiflerolsun tarafından | @KekikAkademi için yazılmıştır.
+
+from Libs.Metrics import Histogram
+
+# Manifest yeniden yazma süreleri milisaniyenin altında kalır
+REWRITE_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05)
+
+class ProxyMetrics:
+    """
+    Proxy sayaçları (/proxy/stats)
+    - Kaynağa göre client'a gönderilen byte (memory / disk / block / origin)
+    - Anlık aktif streaming response sayısı
+    - Manifest yeniden yazma süresi histogramı
+    """
+
+    SOURCES = ("memory", "disk", "block", "origin")
+
+    def __init__(self):
+        self.bytes_served   = dict.fromkeys(self.SOURCES, 0)
+        self.active_streams = 0
+        self.rewrite_time   = Histogram(REWRITE_BUCKETS)
+
+    def add_bytes(self, source: str, size: int):
+        self.bytes_served[source] += size
+
+    async def track_stream(self, stream, source: str | None = None):
+        """Stream'i aktif sayar; `source` verilirse akan byte'ları o kaynağa yazar"""
+        self.active_streams += 1
+        try:
+            async for chunk in stream:
+                if source is not None:
+                    self.bytes_served[source] += len(chunk)
+                yield chunk
+        finally:
+            self.active_streams -= 1
+            await stream.aclose()
+
+    def get_stats(self) -> dict:
+        from_cache = self.bytes_served["memory"] + self.bytes_served["disk"] + self.bytes_served["block"]
+        toplam     = from_cache + self.bytes_served["origin"]
+        return {
+            "bytes_served"     : dict(self.bytes_served),
+            "byte_hit_ratio"   : round(from_cache / toplam, 4) if toplam else 0.0,
+            "active_streams"   : self.active_streams,
+            "manifest_rewrite" : self.rewrite_time.get_stats(),
+        }
+
+# Global metrics instance
+proxy_metrics = ProxyMetrics()
@@ -0,0 +1,180 @@
+# Bu araç @keyiflerolsun tarafından | @KekikAkademi için yazılmıştır.
+
+from dataclasses    import dataclass, field
+from functools      import partial
+from urllib.parse   import urljoin, unquote
+from time           import time
+from Libs           import proxy_request, without_deadline
+from Settings       import PROXY_PREFETCH_SEGMENTS
+from .helpers       import prepare_request_headers, is_hls_segment
+from .segment_cache import segment_cache
+import asyncio
+
+@dataclass
+class PlaylistState:
+    """Prefetch için takip edilen media playlist"""
+    segments    : list[str]
+    index       : dict[str, int]
+    referer     : str | None = None
+    user_agent  : str | None = None
+    last_access : float = field(default_factory=time)
+    tasks       : dict[str, asyncio.Task] = field(default_factory=dict)
+
+class SegmentPrefetcher:
+    """
+    HLS segment prefetch-ahead motoru
+    - Media playlist servis edilince sıralı segment listesi kaydedilir
+    - Bir segment servis edilince sonraki N segment arka planda segment_cache'e ısıtılır
+    - Global semaphore ile sınırlı sayıda eşzamanlı indirme
+    - Oynatıcı ileri/geri atlarsa pencere dışındaki indirmeler iptal edilir
+    - Kimse istemeyen playlist'ler idle süresi sonunda tüm görevleriyle birlikte düşürülür
+    """
+
+    def __init__(self, ahead: int = 0, max_concurrent: int = 8, idle_seconds: int = 30):
+        self.ahead          = ahead
+        self.idle_seconds   = idle_seconds
+        self._semaphore     = asyncio.Semaphore(max_concurrent)
+        self._playlists     : dict[str, PlaylistState] = {}  # playlist_url -> state
+        self._segment_owner : dict[str, str]           = {}  # segment_url  -> playlist_url
+        self._sweep_task    = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.ahead > 0
+
+    def register_playlist(self, playlist_url: str, content: bytes, referer: str | None = None, user_agent: str | None = None):
+        """Media playlist'teki segment URL'lerini sırasıyla kaydet (master playlist'ler atlanır)"""
+        if not self.enabled:
+            return
+
+        try:
+            text = content.decode("utf-8")
+        except UnicodeDecodeError:
+            return
+
+        if not text.lstrip().startswith("#EXTM3U") or "#EXT-X-STREAM-INF" in text:
+            return
+
+        # video_proxy segment URL'lerini unquote ederek anahtarladığı için aynı dönüşüm uygulanır
+        segments = []
+        for line in text.splitlines():
+            line = line.strip()
+            if line and not line.startswith("#"):
+                segment_url = unquote(urljoin(playlist_url, line))
+                if is_hls_segment(segment_url):
+                    segments.append(segment_url)
+
+        if not segments:
+            return
+
+        state = self._playlists.get(playlist_url)
+        if state is None:
+            state = PlaylistState(segments=[], index={}, referer=referer, user_agent=user_agent)
+            self._playlists[playlist_url] = state
+
+        # Live playlist'te kayan pencereden düşen segmentleri unut
+        for old_url in state.index.keys() - set(segments):
+            self._segment_owner.pop(old_url, None)
+
+        state.segments    = segments
+        state.index       = {url: i for i, url in enumerate(segments)}
+        state.last_access = time()
+        for segment_url in segments:
+            self._segment_owner[segment_url] = playlist_url
+
+    def on_segment_served(self, segment_url: str):
+        """Servis edilen segmentten sonraki N segmenti arka planda ısıt"""
+        if not self.enabled:
+            return
+
+        playlist_url = self._segment_owner.get(segment_url)
+        state        = self._playlists.get(playlist_url) if playlist_url else None
+        if state is None or segment_url not in state.index:
+            return
+
+        state.last_access = time()
+
+        position = state.index[segment_url]
+        wanted   = state.segments[position + 1 : position + 1 + self.ahead]
+
+        # Pencere dışına düşen (seek sonrası gereksiz) indirmeleri iptal et
+        for url, task in list(state.tasks.items()):
+            if url not in wanted:
+                task.cancel()
+
+        for url in wanted:
+            if url in state.tasks or url in segment_cache or url in segment_cache.inflight:
+                continue
+
+            # Prefetch tetikleyen isteği aşar - isteğin süre bütçesi (request_deadline) taşınmaz
+            task = asyncio.create_task(self._prefetch(state, url), context=without_deadline())
+            state.tasks[url] = task
+            task.add_done_callback(partial(self._task_done, state, url))
+
+    @staticmethod
+    def _task_done(state: PlaylistState, url: str, task: asyncio.Task):
+        if state.tasks.get(url) is task:
+            del state.tasks[url]
+
+    async def _prefetch(self, state: PlaylistState, url: str):
+        """Tek segmenti indirip cache'e yaz (video_proxy ile aynı single-flight kaydını kullanır)"""
+        async with self._semaphore:
+            # Beklerken oynatıcı kendisi istemiş olabilir
+            if url in segment_cache or url in segment_cache.inflight:
+                return
+
+            event = asyncio.Event()
+            segment_cache.inflight[url] = event
+            try:
+                headers  = prepare_request_headers(None, url, state.referer, state.user_agent)
+                response = await proxy_request.fetch(url, headers=headers)
+                if response.status_code < 400:
+                    await segment_cache.set(url, response.content)
+            except Exception:
+                pass
+            finally:
+                if segment_cache.inflight.get(url) is event:
+                    del segment_cache.inflight[url]
+                event.set()
+
+    def _drop_playlist(self, playlist_url: str):
+        state = self._playlists.pop(playlist_url, None)
+        if state is None:
+            return
+
+        for task in state.tasks.values():
+            task.cancel()
+
+        for segment_url in state.segments:
+            if self._segment_owner.get(segment_url) == playlist_url:
+                del self._segment_owner[segment_url]
+
+    async def _sweep_loop(self):
+        """Uzun süre segment istenmeyen playlist'leri düşür"""
+        while True:
+            await asyncio.sleep(self.idle_seconds)
+            now = time()
+            for playlist_url, state in list(self._playlists.items()):
+                if now - state.last_access > self.idle_seconds:
+                    self._drop_playlist(playlist_url)
+
+    def start(self):
+        """Arka plan temizleyiciyi başlat (lifespan startup'ta çağrılmalı)"""
+        if self.enabled and (self._sweep_task is None or self._sweep_task.done()):
+            self._sweep_task = asyncio.create_task(self._sweep_loop())
+
+    async def stop(self):
+        """Tüm prefetch görevlerini ve temizleyiciyi durdur (lifespan shutdown'da çağrılmalı)"""
+        for playlist_url in list(self._playlists):
+            self._drop_playlist(playlist_url)
+
+        if self._sweep_task:
+            self._sweep_task.cancel()
+            try:
+                await self._sweep_task
+            except asyncio.CancelledError:
+                pass
+            self._sweep_task = None
+
+# Global prefetcher instance (PROXY_PREFETCH_SEGMENTS=0 ise devre dışı)
+segment_prefetcher = SegmentPrefetcher(ahead=PROXY_PREFETCH_SEGMENTS)
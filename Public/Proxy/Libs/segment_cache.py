@@ -1,100 +1,148 @@
 # Bu araç @keyiflerolsun tarafından | @KekikAkademi için yazılmıştır.
 
-from time import time
+from collections import OrderedDict
+from time        import time
+from Settings    import PROXY_CACHE_MB, PROXY_CACHE_TTL
 import asyncio
 
 class SegmentCache:
     """
     LRU cache - HLS video segmentleri için
-    - 128MB boyut limiti
+    - Boyut limiti (varsayılan 128MB, PROXY_CACHE_MB)
     - En az kullanılan (LRU) segment'ler silinir
     - 15 dakika hard TTL (stream token güvenliği için)
+    - get / set / evict O(1) (OrderedDict sırası = erişim sırası)
+    - Süresi dolanlar arka planda periyodik olarak süpürülür
+    - `spill_to` atanmışsa LRU ile atılan segmentler ikinci kademeye (disk) aktarılır
     """
 
-    def __init__(self, max_size_mb: int = 128, hard_ttl_seconds: int = 900):  # 900s = 15 dakika
+    def __init__(self, max_size_mb: int = 128, hard_ttl_seconds: int = 900, sweep_interval: int = 60):  # 900s = 15 dakika
         self.max_size_bytes   = max_size_mb * 1024 * 1024
         self.hard_ttl_seconds = hard_ttl_seconds
+        self.sweep_interval   = sweep_interval
 
-        # Cache storage: {url: (content, created_at, last_access, size)}
-        self._cache: dict[str, tuple[bytes, float, float, int]] = {}
-        self._total_size = 0
-        self._lock = asyncio.Lock()
+        # Cache storage: {url: (content, created_at, size)} - baş = en eski erişim, son = en yeni
+        self._cache: OrderedDict[str, tuple[bytes, float, int]] = OrderedDict()
+        self._total_size  = 0
+        self._lock        = asyncio.Lock()
+        self._sweep_task  = None
+
+        # Devam eden origin indirmeleri (single-flight) - {url: Event}
+        self.inflight: dict[str, asyncio.Event] = {}
+
+        # LRU ile atılanların aktarılacağı ikinci kademe (spill(url, content, created_at) metodu olan nesne)
+        self.spill_to = None
+
+        self.hits   = 0
+        self.misses = 0
+
+    def __contains__(self, url: str) -> bool:
+        """LRU sırasını değiştirmeden varlık kontrolü"""
+        return url in self._cache
 
     async def get(self, url: str) -> bytes | None:
-        """Cache'den segment al ve access time'ı güncelle"""
+        """Cache'den segment al ve LRU sırasını güncelle"""
         async with self._lock:
-            if url not in self._cache:
+            entry = self._cache.get(url)
+            if entry is None:
+                self.misses += 1
                 return None
 
-            content, created_at, _, size = self._cache[url]
+            content, created_at, size = entry
 
             # Hard TTL kontrolü (15 dakika)
             if time() - created_at > self.hard_ttl_seconds:
                 # Süresi dolmuş, sil
                 del self._cache[url]
                 self._total_size -= size
+                self.misses += 1
                 return None
 
-            # Last access time'ı güncelle (LRU için)
-            self._cache[url] = (content, created_at, time(), size)
+            # En yeni erişilen olarak sona taşı (LRU için)
+            self._cache.move_to_end(url)
+            self.hits += 1
 
             return content
 
-    async def set(self, url: str, content: bytes):
-        """Segment'i cache'e ekle"""
-        async with self._lock:
-            content_size = len(content)
+    async def set(self, url: str, content: bytes, created_at: float | None = None):
+        """Segment'i cache'e ekle (`created_at`: alt kademeden geri taşınan segmentin ilk oluşturulma zamanı)"""
+        content_size = len(content)
 
-            # Max size kontrolü - yeni içerik çok büyükse cache'leme
-            if content_size > self.max_size_bytes:
-                return
+        # Max size kontrolü - yeni içerik çok büyükse cache'leme
+        if content_size > self.max_size_bytes:
+            return
 
+        async with self._lock:
             # Eğer bu URL zaten cache'deyse, önce eski boyutunu çıkar
-            if url in self._cache:
-                _, _, _, old_size = self._cache[url]
-                self._total_size -= old_size
+            if (old := self._cache.pop(url, None)) is not None:
+                self._total_size -= old[2]
 
-            # Yeni içeriği ekle (content, created_at, last_access, size)
-            current_time = time()
-            self._cache[url] = (content, current_time, current_time, content_size)
+            # Yeni içeriği sona ekle (content, created_at, size)
+            self._cache[url] = (content, time() if created_at is None else created_at, content_size)
             self._total_size += content_size
 
             # LRU eviction - boyut limiti aşıldıysa en az kullanılanları sil
-            await self._evict_if_needed()
-
-    async def _evict_if_needed(self):
-        """Gerekirse en az kullanılan itemları sil"""
-        current_time = time()
+            self._evict_if_needed()
 
-        # Hard TTL dolmuş itemları temizle (15 dakika)
-        expired_urls = [
-            url for url, (_, created_at, _, _) in self._cache.items()
-            if current_time - created_at > self.hard_ttl_seconds
-        ]
-        for url in expired_urls:
-            _, _, _, size = self._cache[url]
-            del self._cache[url]
+    def _evict_if_needed(self):
+        """Boyut limiti aşıldıysa baştan (en az kullanılan) sil - her adım O(1)"""
+        while self._total_size > self.max_size_bytes and self._cache:
+            url, (content, created_at, size) = self._cache.popitem(last=False)
             self._total_size -= size
 
-        # Hala 128MB limiti aşılmışsa, en az kullanılan (LRU) itemları sil
-        while self._total_size > self.max_size_bytes:
-            if not self._cache:
-                break
+            if self.spill_to is not None:
+                self.spill_to.spill(url, content, created_at)
 
-            # En az kullanılan item'ı bul (en küçük last_access)
-            lru_url = min(self._cache.items(), key=lambda x: x[1][2])[0]  # [1][2] = last_access
-            _, _, _, size = self._cache[lru_url]
-            del self._cache[lru_url]
-            self._total_size -= size
+    async def sweep_expired(self) -> int:
+        """Hard TTL dolmuş itemları temizle, silinen sayısını döndür"""
+        current_time = time()
+
+        async with self._lock:
+            expired_urls = [
+                url for url, (_, created_at, _) in self._cache.items()
+                if current_time - created_at > self.hard_ttl_seconds
+            ]
+            for url in expired_urls:
+                _, _, size = self._cache.pop(url)
+                self._total_size -= size
+
+        return len(expired_urls)
+
+    async def _sweep_loop(self):
+        """Periyodik TTL süpürücü"""
+        while True:
+            await asyncio.sleep(self.sweep_interval)
+            try:
+                await self.sweep_expired()
+            except Exception:
+                pass
+
+    def start(self):
+        """Arka plan süpürücüyü başlat (lifespan startup'ta çağrılmalı)"""
+        if self._sweep_task is None or self._sweep_task.done():
+            self._sweep_task = asyncio.create_task(self._sweep_loop())
+
+    async def stop(self):
+        """Arka plan süpürücüyü durdur (lifespan shutdown'da çağrılmalı)"""
+        if self._sweep_task:
+            self._sweep_task.cancel()
+            try:
+                await self._sweep_task
+            except asyncio.CancelledError:
+                pass
+            self._sweep_task = None
 
     def get_stats(self) -> dict:
         """Cache istatistikleri"""
         return {
             "total_items"      : len(self._cache),
             "total_size_mb"    : round(self._total_size / (1024 * 1024), 2),
+            "total_size_bytes" : self._total_size,
             "max_size_mb"      : round(self.max_size_bytes / (1024 * 1024), 2),
             "hard_ttl_minutes" : self.hard_ttl_seconds // 60,
+            "hits"             : self.hits,
+            "misses"           : self.misses,
         }
 
 # Global cache instance
-segment_cache = SegmentCache(max_size_mb=128, hard_ttl_seconds=900)
+segment_cache = SegmentCache(max_size_mb=PROXY_CACHE_MB, hard_ttl_seconds=PROXY_CACHE_TTL)
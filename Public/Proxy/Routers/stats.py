@@ -0,0 +1,91 @@
+# Bu araç @keyiflerolsun tarafından | @KekikAkademi için yazılmıştır.
+
+from Core                  import JSONResponse, PlainTextResponse
+from .                     import proxy_router
+from ..Libs.segment_cache  import segment_cache
+from ..Libs.disk_cache     import disk_segment_cache
+from ..Libs.block_cache    import block_cache
+from ..Libs.manifest_cache import manifest_cache
+from ..Libs.metrics        import proxy_metrics
+from Libs                  import proxy_request
+
+def hit_ratio(stats: dict) -> float:
+    toplam = stats["hits"] + stats["misses"]
+    return round(stats["hits"] / toplam, 4) if toplam else 0.0
+
+def collect_stats() -> dict:
+    """Tüm proxy katmanlarının anlık istatistikleri"""
+    caches = {
+        "segment_memory" : segment_cache.get_stats(),
+        "segment_disk"   : disk_segment_cache.get_stats(),
+        "block"          : block_cache.get_stats(),
+    }
+    for stats in caches.values():
+        stats["hit_ratio"] = hit_ratio(stats)
+
+    caches["manifest"] = manifest_cache.get_stats()
+
+    return {
+        "cache"    : caches,
+        "upstream" : proxy_request.stats.get_stats(),
+        "limiter"  : proxy_request.limiter.get_stats(),
+        **proxy_metrics.get_stats(),
+    }
+
+@proxy_router.get("/stats")
+async def proxy_stats():
+    """Proxy cache / upstream / stream istatistikleri"""
+    return JSONResponse(collect_stats())
+
+@proxy_router.get("/stats/prometheus")
+async def proxy_stats_prometheus():
+    """Aynı istatistikler Prometheus text formatında"""
+    lines = []
+
+    def metric(name: str, kind: str, help_text: str, samples: list[str]):
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+        lines.extend(samples)
+
+    tiers = {
+        "segment_memory" : segment_cache.get_stats(),
+        "segment_disk"   : disk_segment_cache.get_stats(),
+        "block"          : block_cache.get_stats(),
+    }
+    metric("kekik_proxy_cache_hits_total", "counter", "Cache hit sayısı", [
+        f'kekik_proxy_cache_hits_total{{tier="{tier}"}} {stats["hits"]}' for tier, stats in tiers.items()
+    ])
+    metric("kekik_proxy_cache_misses_total", "counter", "Cache miss sayısı", [
+        f'kekik_proxy_cache_misses_total{{tier="{tier}"}} {stats["misses"]}' for tier, stats in tiers.items()
+    ])
+    metric("kekik_proxy_cache_items", "gauge", "Cache'teki kayıt sayısı", [
+        f'kekik_proxy_cache_items{{tier="{tier}"}} {stats["total_items"]}' for tier, stats in tiers.items()
+    ] + [f'kekik_proxy_cache_items{{tier="manifest"}} {manifest_cache.get_stats()["total_items"]}'])
+    metric("kekik_proxy_cache_size_bytes", "gauge", "Cache'in kullandığı byte", [
+        f'kekik_proxy_cache_size_bytes{{tier="{tier}"}} {stats["total_size_bytes"]}' for tier, stats in tiers.items()
+    ])
+    metric("kekik_proxy_bytes_served_total", "counter", "Client'a kaynağa göre gönderilen byte", [
+        f'kekik_proxy_bytes_served_total{{source="{source}"}} {size}' for source, size in proxy_metrics.bytes_served.items()
+    ])
+    metric("kekik_proxy_active_streams", "gauge", "Aktif streaming response sayısı", [
+        f"kekik_proxy_active_streams {proxy_metrics.active_streams}"
+    ])
+
+    upstream = proxy_request.stats
+    metric("kekik_proxy_upstream_inflight", "gauge", "Domain bazlı devam eden origin isteği", [
+        f'kekik_proxy_upstream_inflight{{domain="{domain}"}} {adet}' for domain, adet in upstream.inflight.items()
+    ])
+    domains = proxy_request.limiter.domain_limiters
+    metric("kekik_proxy_upstream_limit", "gauge", "Domain bazlı adaptif eşzamanlılık limiti", [
+        f'kekik_proxy_upstream_limit{{domain="{domain}"}} {int(limiter.limit)}' for domain, limiter in domains.items()
+    ])
+    metric("kekik_proxy_upstream_queued", "gauge", "Domain limiti dolduğu için bekleyen origin isteği", [
+        f'kekik_proxy_upstream_queued{{domain="{domain}"}} {limiter.get_stats()["queued"]}' for domain, limiter in domains.items()
+    ])
+    metric("kekik_proxy_upstream_errors_total", "counter", "Hatayla biten origin isteği", [
+        f"kekik_proxy_upstream_errors_total {upstream.errors}"
+    ])
+    metric("kekik_proxy_upstream_latency_seconds", "histogram", "Origin header gecikmesi", upstream.latency.prometheus("kekik_proxy_upstream_latency_seconds"))
+    metric("kekik_proxy_manifest_rewrite_seconds", "histogram", "Manifest yeniden yazma süresi", proxy_metrics.rewrite_time.prometheus("kekik_proxy_manifest_rewrite_seconds"))
+
+    return PlainTextResponse("\n".join(lines) + "\n", media_type="text/plain; version=0.0.4")
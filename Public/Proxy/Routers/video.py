@@ -1,68 +1,218 @@
 # Bu araç @keyiflerolsun tarafından | @KekikAkademi için yazılmıştır.
 
-from CLI                  import konsol
-from fastapi              import Request, Response
-from starlette.background import BackgroundTask
-from fastapi.responses    import StreamingResponse
-from .                    import proxy_router
-from ..Libs.helpers       import prepare_request_headers, prepare_response_headers, detect_hls_from_url, stream_wrapper, rewrite_hls_manifest
-from ..Libs.segment_cache import segment_cache
-from urllib.parse         import unquote
-import httpx
-
-def is_hls_segment(url: str) -> bool:
-    """URL'nin HLS segment'i olup olmadığını kontrol et"""
-    url_lower = url.lower()
-
-    # Manifest'leri hariç tut
-    if ".m3u8" in url_lower:
-        return False
-
-    # Segment göstergeleri
-    segment_indicators = (".ts", ".m4s", "seg-", "chunk-", "fragment", ".png")
-    return any(indicator in url_lower for indicator in segment_indicators)
+from CLI                   import konsol
+from fastapi               import Request, Response
+from starlette.background  import BackgroundTask
+from fastapi.responses     import StreamingResponse
+from .                     import proxy_router
+from ..Libs.helpers        import prepare_request_headers, prepare_response_headers, detect_hls_from_url, is_hls_segment, stream_wrapper, rewrite_hls_manifest
+from ..Libs.helpers        import parse_range_header, parse_content_range, CORS_HEADERS, SegmentDownload
+from ..Libs.segment_cache  import segment_cache
+from ..Libs.disk_cache     import disk_segment_cache
+from ..Libs.block_cache    import block_cache
+from ..Libs.manifest_cache import manifest_cache
+from ..Libs.prefetch       import segment_prefetcher
+from ..Libs.metrics        import proxy_metrics
+from Libs                  import proxy_request
+from urllib.parse          import unquote
+from time                  import perf_counter
+import asyncio
+
+# Devam eden indirmeyi bekleme üst sınırı (origin hiç cevap vermezse bekleyenler takılı kalmasın)
+INFLIGHT_WAIT_TIMEOUT = 60.0
+
+# İndirme başarısız olursa bekleyenin yeniden single-flight'a girme sayısı (sonrasında kendisi indirir)
+INFLIGHT_WAIT_ROUNDS = 2
+
+def release_inflight(url: str, event: asyncio.Event | None):
+    """Single-flight kaydını kaldır ve bekleyenleri uyandır"""
+    if event is None:
+        return
+
+    if segment_cache.inflight.get(url) is event:
+        del segment_cache.inflight[url]
+    event.set()
+
+def cached_segment_response(url: str, content: bytes) -> Response:
+    """Cache'den gelen segment için response oluştur"""
+    proxy_metrics.add_bytes("memory", len(content))
+    return Response(
+        content     = content,
+        status_code = 200,
+        headers     = {
+            "Content-Type"                : "video/MP2T" if url.endswith('.ts') else "video/iso.segment",
+            "Cache-Control"               : "public, max-age=30",
+            "Access-Control-Allow-Origin" : "*",
+        },
+    )
+
+def close_mapped(view: memoryview, mapped):
+    """memoryview'ı bırak ve mmap'i kapat (transport buffer'ı hâlâ tutuyorsa kapanış GC'ye kalır)"""
+    try:
+        view.release()
+        mapped.close()
+    except BufferError:
+        pass
+
+def disk_segment_response(url: str, mapped) -> StreamingResponse:
+    """Disk cache'teki segmenti mmap üzerinden kopyalamadan gönder, gönderim bitince mmap'i kapat"""
+    async def iter_mapped():
+        view = memoryview(mapped)
+        try:
+            yield view
+        finally:
+            close_mapped(view, mapped)
+
+    return StreamingResponse(
+        proxy_metrics.track_stream(iter_mapped(), "disk"),
+        status_code = 200,
+        headers     = {
+            "Content-Type"                : "video/MP2T" if url.endswith('.ts') else "video/iso.segment",
+            "Content-Length"              : str(len(mapped)),
+            "Cache-Control"               : "public, max-age=30",
+            "Access-Control-Allow-Origin" : "*",
+        },
+    )
+
+async def cached_range_response(request: Request, url: str, request_headers: dict, meta: dict) -> Response | None:
+    """Boyutu bilinen progressive video için aralığı blok cache'ten (eksik kısmı origin'den) sun"""
+    total        = meta["total"]
+    range_header = request.headers.get("range")
+    byte_range   = parse_range_header(range_header, total) if range_header else (0, total - 1)
+    if byte_range is None:
+        # Çoklu / geçersiz aralık - origin'e bırak
+        return None
+
+    start, end = byte_range
+
+    # İlk blok cache'te yoksa origin'in Range cevabını header'lar gönderilmeden önce doğrula
+    first = None
+    index = start // block_cache.block_size
+    if (url, index) not in block_cache:
+        try:
+            first = await block_cache.fetch_range(url, index, end, request_headers)
+        except Exception as e:
+            konsol.print(f"[red]Range isteği hatası: {str(e)}[/red]")
+            return None
+
+        if first is None:
+            # Origin Range'i desteklemiyor - meta unutuldu, düz proxy'ye bırak
+            return None
+
+    headers = {
+        **CORS_HEADERS,
+        "Content-Type"   : meta["content_type"],
+        "Content-Length" : str(end - start + 1),
+        "Accept-Ranges"  : "bytes",
+    }
+    if range_header:
+        headers["Content-Range"] = f"bytes {start}-{end}/{total}"
+
+    return StreamingResponse(
+        proxy_metrics.track_stream(block_cache.iter_range(url, start, end, request_headers, first)),
+        status_code = 206 if range_header else 200,
+        headers     = headers,
+        media_type  = meta["content_type"],
+        background  = BackgroundTask(first[0].aclose) if first else None
+    )
+
+async def manifest_response(decoded_url: str, request_headers: dict, referer: str | None, user_agent: str | None) -> Response:
+    """HLS manifest'i cache'ten (gerekirse origin'e koşullu istekle) alıp yeniden yazarak döndür"""
+    try:
+        status_code, origin_headers, content = await manifest_cache.fetch(
+            decoded_url, request_headers, key=(decoded_url, referer, user_agent)
+        )
+    except Exception as e:
+        konsol.print(f"[red]Proxy başlatma hatası: {str(e)}[/red]")
+        return Response(status_code=502, content=f"Proxy Error: {str(e)}")
+
+    if status_code >= 400:
+        return Response(status_code=status_code, content=f"Upstream Error: {status_code}")
+
+    # Response headerlarını hazırla
+    final_headers = prepare_response_headers(origin_headers, decoded_url, "application/vnd.apple.mpegurl")
+
+    # Manifest URL'lerini yeniden yaz
+    baslangic         = perf_counter()
+    rewritten_content = rewrite_hls_manifest(content, decoded_url, referer, user_agent)
+    proxy_metrics.rewrite_time.observe(perf_counter() - baslangic)
+
+    # Media playlist ise segment sırasını prefetcher'a bildir
+    segment_prefetcher.register_playlist(decoded_url, content, referer, user_agent)
+
+    # Content-Length güncelle
+    final_headers["Content-Length"] = str(len(rewritten_content))
+
+    return Response(
+        content     = rewritten_content,
+        status_code = status_code,
+        headers     = final_headers,
+        media_type  = final_headers.get("Content-Type")
+    )
 
 @proxy_router.get("/video")
 @proxy_router.head("/video")
 async def video_proxy(request: Request, url: str, referer: str = None, user_agent: str = None):
     """Video proxy endpoint'i"""
-    decoded_url     = unquote(url)
-    request_headers = prepare_request_headers(request, decoded_url, referer, user_agent)
+    decoded_url = unquote(url)
+
+    # HLS Tahmini (URL'den)
+    is_hls         = detect_hls_from_url(decoded_url)
+    is_segment     = is_hls_segment(decoded_url)
+    is_progressive = not is_hls and not is_segment
+
+    # Range sadece progressive videoda origin'e iletilir (manifest / segment cache'i tam içerik tutar)
+    request_headers = prepare_request_headers(request, decoded_url, referer, user_agent, forward_range=is_progressive)
+
+    # HLS manifest - kısa TTL'li cache + koşullu revalidation (aynı yayını yoklayan izleyiciler tek origin isteği paylaşır)
+    if is_hls and request.method == "GET":
+        return await manifest_response(decoded_url, request_headers, referer, user_agent)
+
+    # Progressive video boyutu biliniyorsa seek'ler blok cache'ten karşılanır
+    if is_progressive and request.method == "GET" and (meta := block_cache.get_meta(decoded_url)):
+        if cached_response := await cached_range_response(request, decoded_url, request_headers, meta):
+            return cached_response
 
     # HLS segment ise cache'i kontrol et
-    if is_hls_segment(decoded_url):
+    inflight_event = None
+    if is_segment:
         cached_content = await segment_cache.get(decoded_url)
         if cached_content:
             # konsol.print(f"[green]✓ Cache HIT:[/green] {decoded_url[-50:]}")
-            return Response(
-                content     = cached_content,
-                status_code = 200,
-                headers     = {
-                    "Content-Type"                : "video/MP2T" if decoded_url.endswith('.ts') else "video/iso.segment",
-                    "Cache-Control"               : "public, max-age=30",
-                    "Access-Control-Allow-Origin" : "*",
-                },
-            )
+            segment_prefetcher.on_segment_served(decoded_url)
+            return cached_segment_response(decoded_url, cached_content)
 
-    # Client oluştur (SSL doğrulaması devre dışı - bazı sunucular self-signed sertifika kullanıyor)
-    client = httpx.AsyncClient(
-        follow_redirects = True,
-        timeout          = httpx.Timeout(connect=10.0, read=60.0, write=10.0, pool=10.0),
-        verify           = False,
-    )
+        # L2 (disk) cache
+        if disk_segment_cache.enabled and (mapped := await disk_segment_cache.get(decoded_url)):
+            segment_prefetcher.on_segment_served(decoded_url)
+            return disk_segment_response(decoded_url, mapped)
+
+        # Single-flight: aynı segment zaten indiriliyorsa onu bekle, sonra cache'den oku
+        # İndirme başarısız olduysa bekleyenlerden ilki kaydı devralıp yeniden indirir, diğerleri onu bekler
+        if request.method == "GET":
+            for _ in range(INFLIGHT_WAIT_ROUNDS):
+                if (bekleyen := segment_cache.inflight.get(decoded_url)) is None:
+                    inflight_event = asyncio.Event()
+                    segment_cache.inflight[decoded_url] = inflight_event
+                    break
+
+                try:
+                    await asyncio.wait_for(bekleyen.wait(), timeout=INFLIGHT_WAIT_TIMEOUT)
+                except asyncio.TimeoutError:
+                    pass
+                if cached_content := await segment_cache.get(decoded_url):
+                    segment_prefetcher.on_segment_served(decoded_url)
+                    return cached_segment_response(decoded_url, cached_content)
 
+    response = None
     try:
-        # HLS Tahmini (URL'den)
-        is_hls = detect_hls_from_url(decoded_url)
         detected_content_type = "application/vnd.apple.mpegurl" if is_hls else None
 
-        # GET isteğini başlat
-        req = client.build_request("GET", decoded_url, headers=request_headers)
-        response = await client.send(req, stream=True)
+        # GET isteğini paylaşımlı proxy client üzerinden başlat (keep-alive havuzu, SSL doğrulaması kapalı)
+        response = await proxy_request.stream(decoded_url, headers=request_headers)
 
         if response.status_code >= 400:
             await response.aclose()
-            await client.aclose()
             return Response(status_code=response.status_code, content=f"Upstream Error: {response.status_code}")
 
         # Response headerlarını hazırla
@@ -71,7 +221,6 @@ async def video_proxy(request: Request, url: str, referer: str = None, user_agen
         # HEAD isteği ise stream yapma, kapat ve dön
         if request.method == "HEAD":
             await response.aclose()
-            await client.aclose()
             return Response(
                 content     = b"",
                 status_code = response.status_code,
@@ -79,53 +228,67 @@ async def video_proxy(request: Request, url: str, referer: str = None, user_agen
                 media_type  = final_headers.get("Content-Type")
             )
 
-        # HLS manifest ise içeriği yeniden yaz
-        if is_hls:
-            # Tüm içeriği oku
-            content = await response.aread()
-            await response.aclose()
-            await client.aclose()
-
-            # Manifest URL'lerini yeniden yaz
-            rewritten_content = rewrite_hls_manifest(content, decoded_url, referer, user_agent)
+        # HLS segment ise client'tan bağımsız indir, client'a akıtırken biriktir, tamamlanınca cache'e al
+        if is_segment:
+            # Single-flight kaydının sahipliği indirmeye geçer (bekleyenler cache yazılınca uyanır, client koparsa da)
+            segment_event, inflight_event = inflight_event, None
 
-            # Content-Length güncelle
-            final_headers["Content-Length"] = str(len(rewritten_content))
+            async def on_complete(content: bytes | None):
+                try:
+                    if content is not None:
+                        await segment_cache.set(decoded_url, content)
+                        # konsol.print(f"[yellow]⚡ Cache MISS:[/yellow] {decoded_url[-50:]} ({len(content) // 1024}KB)")
+                        segment_prefetcher.on_segment_served(decoded_url)
+                finally:
+                    release_inflight(decoded_url, segment_event)
 
-            return Response(
-                content     = rewritten_content,
+            return StreamingResponse(
+                proxy_metrics.track_stream(SegmentDownload(response, on_complete).stream(), "origin"),
                 status_code = response.status_code,
                 headers     = final_headers,
                 media_type  = final_headers.get("Content-Type")
             )
 
-        # HLS segment ise cache'e al
-        if is_hls_segment(decoded_url):
-            content = await response.aread()
-            await response.aclose()
-            await client.aclose()
-
-            # Cache'e ekle
-            await segment_cache.set(decoded_url, content)
-            # konsol.print(f"[yellow]⚡ Cache MISS:[/yellow] {decoded_url[-50:]} ({len(content) // 1024}KB)")
+        # Progressive video - origin Range destekliyorsa ve dosyadaki konum / toplam boyut biliniyorsa tam blokları cache'e al
+        # (Range'i yok sayan origin'de meta tutulursa sonraki seek'ler eksik bloklar yüzünden boş / yarım döner;
+        #  Range'li isteğe 200 dönen origin'in Accept-Ranges header'ına güvenilmez)
+        offset, total = 0, None
+        if response.status_code == 206:
+            offset, total = parse_content_range(response.headers.get("content-range")) or (0, None)
+        elif (
+            response.status_code == 200
+            and "range" not in request.headers
+            and response.headers.get("accept-ranges", "").lower() == "bytes"
+            and (content_length := response.headers.get("content-length", "")).isdigit()
+        ):
+            total = int(content_length)
 
-            return Response(
-                content     = content,
+        content_type = final_headers.get("Content-Type", "")
+        if total and "mpegurl" not in content_type.lower():
+            block_cache.set_meta(decoded_url, total, content_type)
+            return StreamingResponse(
+                proxy_metrics.track_stream(block_cache.tee_blocks(decoded_url, response, offset, total), "origin"),
                 status_code = response.status_code,
                 headers     = final_headers,
-                media_type  = final_headers.get("Content-Type")
+                media_type  = content_type,
+                background  = BackgroundTask(response.aclose)
             )
 
         # Normal video - StreamingResponse döndür
         return StreamingResponse(
-            stream_wrapper(response),
+            proxy_metrics.track_stream(stream_wrapper(response), "origin"),
             status_code = response.status_code,
             headers     = final_headers,
             media_type  = final_headers.get("Content-Type"),
-            background  = BackgroundTask(client.aclose)
+            background  = BackgroundTask(response.aclose)
         )
 
     except Exception as e:
-        await client.aclose()
+        if response is not None:
+            await response.aclose()
         konsol.print(f"[red]Proxy başlatma hatası: {str(e)}[/red]")
         return Response(status_code=502, content=f"Proxy Error: {str(e)}")
+
+    finally:
+        # Stream'e devredilmediyse bekleyen istekleri burada uyandır
+        release_inflight(decoded_url, inflight_event)
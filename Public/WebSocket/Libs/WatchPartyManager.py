@@ -1,20 +1,49 @@
 # Bu araç @keyiflerolsun tarafından | @KekikAkademi için yazılmıştır.
 
-from fastapi  import WebSocket
-from ..Models import User, Room, ChatMessage
-import json, asyncio, time
+from CLI        import konsol
+from fastapi    import WebSocket
+from contextlib import asynccontextmanager
+from ..Models   import User, Room, ChatMessage
+from .outbound  import OutboundQueue, coalesce_key
+from .codec     import codec, SYNC_CORRECTION_PAYLOADS
+from .frames    import SYNC_CORRECTION_FRAMES
+import asyncio, time
 
 # ============== Timing Constants (seconds) ==============
 DEBOUNCE_WINDOW = 1.0       # Genel debounce penceresi (tüm race condition'lar için)
 MIN_BUFFER_DURATION = 2.0   # Minimum buffer süresi (kısa buffer'ları ignore)
+SYNC_TICK_INTERVAL = 0.5    # Heartbeat'lerin toplu işlendiği oda sync tick aralığı
 
 class WatchPartyManager:
-    """Watch Party oda ve kullanıcı yönetimi"""
+    """
+    Watch Party oda ve kullanıcı yönetimi
+    - Oda state'i odanın kendi lock'u (room.lock) ile korunur, odalar birbirini beklemez
+    - Global lock sadece oda oluşturma / silme sırasında kısa süre tutulur
+    - Silinen oda `closed` işaretlenir; lock'u bekleyen işlemler onu görmez
+    """
 
     def __init__(self):
         self.rooms: dict[str, Room] = {}
         self._lock = asyncio.Lock()
         self._cleanup_task = None
+        self._sync_task = None
+
+    @asynccontextmanager
+    async def _room_lock(self, room_id: str):
+        """Odanın lock'unu al ve odayı ver (oda yoksa / beklerken silindiyse None)"""
+        room = self.rooms.get(room_id)
+        if room is None:
+            yield None
+            return
+
+        async with room.lock:
+            yield None if room.closed else room
+
+    async def _close_room(self, room: Room):
+        """Oda lock'u içinde `closed` işaretlenmiş odayı sözlükten kaldır"""
+        async with self._lock:
+            if self.rooms.get(room.room_id) is room:
+                del self.rooms[room.room_id]
 
     async def _cleanup_loop(self):
         """Periyodik temizlik (dead users & empty rooms)"""
@@ -24,15 +53,11 @@ class WatchPartyManager:
 
     async def _cleanup(self):
         """Temizlik mantığı"""
-        room_ids = []
-        async with self._lock:
-            room_ids = list(self.rooms.keys())
-
-        for room_id in room_ids:
+        for room_id in list(self.rooms.keys()):
             broadcast_payloads = []
+            closed_room        = None
             
-            async with self._lock:
-                room = self.rooms.get(room_id)
+            async with self._room_lock(room_id) as room:
                 if not room:
                     continue
                 
@@ -49,6 +74,7 @@ class WatchPartyManager:
                     })
                     
                     del room.users[uid]
+                    user.outbox.close()
                     room.buffering_users.discard(uid)
                     room.buffer_start_time_by_user.pop(uid, None)
                     room.buffer_end_time_by_user.pop(uid, None)
@@ -85,25 +111,29 @@ class WatchPartyManager:
                 
                 # Oda boşsa sil
                 if not room.users:
-                    del self.rooms[room_id]
+                    room.closed = True
+                    closed_room = room
+
+            if closed_room:
+                await self._close_room(closed_room)
 
             # Lock DIŞI: Broadcast task'ları oluştur
             for payload in broadcast_payloads:
                 asyncio.create_task(self.broadcast_to_room(room_id, payload))
 
     async def get_room(self, room_id: str) -> Room | None:
-        """Odayı getir (lock protected)"""
-        async with self._lock:
-            return self.rooms.get(room_id)
+        """Odayı getir"""
+        room = self.rooms.get(room_id)
+        return None if room is None or room.closed else room
 
     async def get_room_users_map(self, room_id: str) -> dict[str, "User"]:
         """Odadaki kullanıcıları User objesi olarak getir (broadcast için)"""
-        async with self._lock:
-            room = self.rooms.get(room_id)
-            if not room:
-                return {}
-            # Return dict: {user_id: User}
-            return dict(room.users)
+        # Lock gerekmez: await'siz kopya atomiktir, broadcast'ler oda lock'unu beklemez
+        room = self.rooms.get(room_id)
+        if not room or room.closed:
+            return {}
+        # Return dict: {user_id: User}
+        return dict(room.users)
 
     async def join_room(self, room_id: str, websocket: WebSocket, username: str, avatar: str) -> User | None:
         """Odaya katıl"""
@@ -111,23 +141,33 @@ class WatchPartyManager:
         if self._cleanup_task is None:
             try:
                 self._cleanup_task = asyncio.create_task(self._cleanup_loop())
+                self._sync_task = asyncio.create_task(self._sync_loop())
             except Exception:
                 pass
 
-        async with self._lock:
-            room = self.rooms.get(room_id)
-            if not room:
-                room = Room(room_id=room_id)
-                self.rooms[room_id] = room
+        while True:
+            # Global lock sadece oda oluşturma için
+            async with self._lock:
+                room = self.rooms.get(room_id)
+                if not room or room.closed:
+                    room = Room(room_id=room_id)
+                    self.rooms[room_id] = room
+
+            async with room.lock:
+                # Lock beklenirken oda kapandıysa yenisiyle tekrar dene
+                if room.closed:
+                    continue
 
-            user = User(websocket=websocket, username=username, avatar=avatar)
+                user = User(websocket=websocket, username=username, avatar=avatar)
+                user.outbox = OutboundQueue(user)
+                user.outbox.start()
 
-            # İlk kullanıcı host olur
-            if room.host_id is None:
-                room.host_id = user.user_id
+                # İlk kullanıcı host olur
+                if room.host_id is None:
+                    room.host_id = user.user_id
 
-            room.users[user.user_id] = user
-            return user
+                room.users[user.user_id] = user
+                return user
 
     async def leave_room(self, room_id: str, user_id: str) -> bool:
         """Odadan ayrıl"""
@@ -135,15 +175,14 @@ class WatchPartyManager:
         resume_time = 0.0
         task_to_cancel = None
 
-        async with self._lock:
-            room = self.rooms.get(room_id)
+        async with self._room_lock(room_id) as room:
             if not room:
                 return False
 
             if user_id not in room.users:
                 return False
 
-            del room.users[user_id]
+            room.users.pop(user_id).outbox.close()
             
             # Eğer buffer listesindeyse sil
             if user_id in room.buffering_users:
@@ -194,7 +233,10 @@ class WatchPartyManager:
                     if not task.done():
                         task.cancel()
 
-                del self.rooms[room_id]
+                room.closed = True
+
+        if room.closed:
+            await self._close_room(room)
 
         # Lock dışında task iptal et
         if task_to_cancel and not task_to_cancel.done():
@@ -215,8 +257,7 @@ class WatchPartyManager:
 
     async def update_video(self, room_id: str, url: str, title: str = "", video_format: str = "hls", user_agent: str = "", referer: str = "", subtitle_url: str = "", duration: float = 0.0) -> bool:
         """Video URL'sini güncelle - full state reset yapılır"""
-        async with self._lock:
-            room = self.rooms.get(room_id)
+        async with self._room_lock(room_id) as room:
             if not room:
                 return False
 
@@ -264,8 +305,7 @@ class WatchPartyManager:
 
     async def update_playback_state(self, room_id: str, is_playing: bool, current_time: float, pause_reason: str | None = None, now: float | None = None) -> bool:
         """Oynatım durumunu güncelle - opsiyonel pause_reason için atomik"""
-        async with self._lock:
-            room = self.rooms.get(room_id)
+        async with self._room_lock(room_id) as room:
             if not room:
                 return False
 
@@ -296,8 +336,7 @@ class WatchPartyManager:
 
     async def pause_now(self, room_id: str, now: float, reason: str = "manual") -> float | None:
         """Server-otoriteli pause: canlı zamanı hesapla ve odayı durdur"""
-        async with self._lock:
-            room = self.rooms.get(room_id)
+        async with self._room_lock(room_id) as room:
             if not room:
                 return None
 
@@ -315,8 +354,7 @@ class WatchPartyManager:
 
     async def resume_soft(self, room_id: str, now: float) -> float | None:
         """Soft resume: odayı direkt playing yap (bariyer yok)"""
-        async with self._lock:
-            room = self.rooms.get(room_id)
+        async with self._room_lock(room_id) as room:
             if not room:
                 return None
 
@@ -339,8 +377,7 @@ class WatchPartyManager:
 
     async def set_buffering_status(self, room_id: str, user_id: str, is_buffering: bool) -> bool:
         """Kullanıcının buffering durumunu güncelle - sadece liste yönetimi"""
-        async with self._lock:
-            room = self.rooms.get(room_id)
+        async with self._room_lock(room_id) as room:
             if not room:
                 return False
 
@@ -357,8 +394,7 @@ class WatchPartyManager:
 
     async def mark_play_time(self, room_id: str, timestamp: float) -> bool:
         """Play zamanını atomik olarak kaydet"""
-        async with self._lock:
-            room = self.rooms.get(room_id)
+        async with self._room_lock(room_id) as room:
             if not room:
                 return False
             room.last_play_time = timestamp
@@ -366,8 +402,7 @@ class WatchPartyManager:
 
     async def mark_pause_time(self, room_id: str, timestamp: float) -> bool:
         """Pause zamanını atomik olarak kaydet"""
-        async with self._lock:
-            room = self.rooms.get(room_id)
+        async with self._room_lock(room_id) as room:
             if not room:
                 return False
             room.last_pause_time = timestamp
@@ -377,8 +412,7 @@ class WatchPartyManager:
 
     async def mark_seek_time(self, room_id: str, timestamp: float) -> float:
         """Seek zamanını atomik olarak kaydet ve önceki değeri döndür"""
-        async with self._lock:
-            room = self.rooms.get(room_id)
+        async with self._room_lock(room_id) as room:
             if not room:
                 return 0.0
             prev = room.last_seek_time
@@ -387,8 +421,7 @@ class WatchPartyManager:
 
     async def mark_buffer_start_time(self, room_id: str, user_id: str, timestamp: float) -> bool:
         """Buffer start zamanını user bazında atomik olarak kaydet"""
-        async with self._lock:
-            room = self.rooms.get(room_id)
+        async with self._room_lock(room_id) as room:
             if not room:
                 return False
             room.buffer_start_time_by_user[user_id] = timestamp
@@ -396,8 +429,7 @@ class WatchPartyManager:
 
     async def mark_buffer_end_time(self, room_id: str, user_id: str, timestamp: float) -> bool:
         """Buffer end zamanını user bazında atomik olarak kaydet"""
-        async with self._lock:
-            room = self.rooms.get(room_id)
+        async with self._room_lock(room_id) as room:
             if not room:
                 return False
             room.buffer_end_time_by_user[user_id] = timestamp
@@ -411,8 +443,7 @@ class WatchPartyManager:
         """
         now = time.perf_counter()
         
-        async with self._lock:
-            room = self.rooms.get(room_id)
+        async with self._room_lock(room_id) as room:
             if not room:
                 return None
             
@@ -448,8 +479,7 @@ class WatchPartyManager:
         Buffer pause durumunda ve hiç buffering kullanıcı kalmadıysa resume.
         Returns: None veya {"should_broadcast": bool, "current_time": float}
         """
-        async with self._lock:
-            room = self.rooms.get(room_id)
+        async with self._room_lock(room_id) as room:
             if not room:
                 return None
             
@@ -485,8 +515,7 @@ class WatchPartyManager:
         User-based buffer timing kullanır.
         Returns: None veya {"should_resume": bool, "current_time": float}
         """
-        async with self._lock:
-            room = self.rooms.get(room_id)
+        async with self._room_lock(room_id) as room:
             if not room:
                 return None
 
@@ -538,8 +567,7 @@ class WatchPartyManager:
         Pause kabul edilmeli mi? Atomic karar ver.
         Returns: {"accept": bool, "is_playing": bool}
         """
-        async with self._lock:
-            room = self.rooms.get(room_id)
+        async with self._room_lock(room_id) as room:
             if not room:
                 return {"accept": False, "is_playing": False}
 
@@ -584,8 +612,7 @@ class WatchPartyManager:
         Buffer start kabul edilmeli mi? Atomic karar ver. User-based timing kullanır.
         Returns: {"accept": bool, "is_first": bool, "is_post_seek": bool, "should_pause": bool}
         """
-        async with self._lock:
-            room = self.rooms.get(room_id)
+        async with self._room_lock(room_id) as room:
             if not room:
                 return {"accept": False, "is_first": False, "is_post_seek": False, "should_pause": False}
 
@@ -614,8 +641,7 @@ class WatchPartyManager:
 
     async def clear_buffering_users(self, room_id: str) -> bool:
         """Buffering users listesini temizle (atomic)"""
-        async with self._lock:
-            room = self.rooms.get(room_id)
+        async with self._room_lock(room_id) as room:
             if not room:
                 return False
             room.buffering_users.clear()
@@ -637,8 +663,7 @@ class WatchPartyManager:
         now = time.perf_counter()
         
         # Per-user buffer spam kontrolü
-        async with self._lock:
-            room = self.rooms.get(room_id)
+        async with self._room_lock(room_id) as room:
             if not room:
                 return
             
@@ -665,8 +690,7 @@ class WatchPartyManager:
             await asyncio.sleep(delay)
             
             # Snapshot al (lock içinde) + EPOCH GUARD
-            async with self._lock:
-                room = self.rooms.get(room_id)
+            async with self._room_lock(room_id) as room:
                 if not room:
                     return
                 
@@ -712,8 +736,7 @@ class WatchPartyManager:
             })
         
         # Yeni task başlat + EPOCH ARTTIR (user-level)
-        async with self._lock:
-            room = self.rooms.get(room_id)
+        async with self._room_lock(room_id) as room:
             if not room:
                 return
             
@@ -728,8 +751,7 @@ class WatchPartyManager:
         """Bekleyen delayed pause task(larını) iptal et + epoch bump. user_id=None ise hepsini iptal et."""
         tasks_to_cancel = []
 
-        async with self._lock:
-            room = self.rooms.get(room_id)
+        async with self._room_lock(room_id) as room:
             if not room:
                 return
 
@@ -758,8 +780,7 @@ class WatchPartyManager:
     ) -> tuple[int, float]:
         """Internal: Barrier sync başlat (seek veya resume için ortak)"""
         old_task = None
-        async with self._lock:
-            room = self.rooms.get(room_id)
+        async with self._room_lock(room_id) as room:
             if not room:
                 return (0, 0.0)
 
@@ -796,8 +817,7 @@ class WatchPartyManager:
             await self._force_complete_barrier(room_id, my_epoch, reason)
 
         task = asyncio.create_task(_timeout_guard(epoch))
-        async with self._lock:
-            room = self.rooms.get(room_id)
+        async with self._room_lock(room_id) as room:
             if room and room.seek_sync_epoch == epoch:
                 room.pending_seek_sync_task = task
             else:
@@ -811,8 +831,7 @@ class WatchPartyManager:
         """Internal: Client ready bildirimi (seek veya resume için ortak)"""
         task_to_cancel = None
 
-        async with self._lock:
-            room = self.rooms.get(room_id)
+        async with self._room_lock(room_id) as room:
             if not room:
                 return None
 
@@ -855,8 +874,7 @@ class WatchPartyManager:
         should_resume = False
         current_time = 0.0
 
-        async with self._lock:
-            room = self.rooms.get(room_id)
+        async with self._room_lock(room_id) as room:
             if not room:
                 return
             if room.pause_reason != reason or room.seek_sync_epoch != epoch:
@@ -903,8 +921,7 @@ class WatchPartyManager:
     async def cancel_seek_sync(self, room_id: str):
         """Seek-sync veya Resume-sync'i iptal et (manuel override)"""
         task = None
-        async with self._lock:
-            room = self.rooms.get(room_id)
+        async with self._room_lock(room_id) as room:
             if not room:
                 return
             room.seek_sync_waiting_users.clear()
@@ -919,131 +936,107 @@ class WatchPartyManager:
             task.cancel()
 
     async def handle_heartbeat(self, room_id: str, user_id: str, client_time: float, is_syncing: bool = False):
-        """Heartbeat al, soft sync veya hard sync gönder (sadeleştirilmiş)"""
-        now = time.perf_counter()
-        
-        ws = None
-        payload = None
-        early_return = False
-        should_check_hard_sync = True
+        """Heartbeat'i sadece kaydet - drift / stall hesabı ve düzeltmeler oda sync tick'inde (_sync_room)"""
+        room = self.rooms.get(room_id)
+        if not room or room.closed:
+            return
 
-        async with self._lock:
-            room = self.rooms.get(room_id)
-            if not room:
-                return
-            
-            user = room.users.get(user_id)
-            if not user:
-                return
+        user = room.users.get(user_id)
+        if not user:
+            return
+
+        # Lock gerekmez: await'siz atamalar atomik, tick son değeri görür
+        user.hb_client_time = client_time
+        user.hb_received_at = time.perf_counter()
+        user.hb_syncing     = is_syncing
+        user.hb_pending     = True
+
+    @staticmethod
+    def _sync_correction(user: User, rate: float) -> str | bytes:
+        """Kullanıcının protokolüne göre önceden encode edilmiş sync_correction"""
+        return SYNC_CORRECTION_FRAMES[rate] if user.binary_frames else SYNC_CORRECTION_PAYLOADS[rate]
+
+    def _sync_room_locked(self, room: Room, now: float) -> list[tuple[User, str | bytes, str | None]]:
+        """Lock içinde çağrılmalı: son tick'ten beri heartbeat gönderen herkes için drift hesapla, düzeltmeleri döndür"""
+        corrections = []
+        hard_sync   = None
+
+        for user in room.users.values():
+            if not user.hb_pending:
+                continue
+            user.hb_pending = False
+
+            client_time = user.hb_client_time
+            received_at = user.hb_received_at
 
             # Client syncing modunda ise drift/stall hesaplamalarını skip et
-            if is_syncing:
+            if user.hb_syncing:
                 user.last_client_time = client_time
                 user.stall_count = 0
-                return
+                continue
 
             # Oynatılmıyorsa soft sync rate'i resetle
             if not room.is_playing:
                 if user.last_rate_sent != 1.0:
                     user.last_rate_sent = 1.0
-                    ws = user.websocket
-                    payload = json.dumps({
-                        "type": "sync_correction",
-                        "rate": 1.0,
-                    }, ensure_ascii=False)
-                early_return = True
-                should_check_hard_sync = False
+                    corrections.append((user, self._sync_correction(user, 1.0), "sync_correction"))
+                continue
 
             # Seek barrier aktifken soft sync yapma (zaten hard sync koordinasyonu var)
-            elif room.pause_reason == "seek":
-                early_return = True
-                should_check_hard_sync = False
+            if room.pause_reason == "seek":
+                continue
 
-            else:
-                # Server time hesapla
-                server_time = room.current_time + (now - room.updated_at)
+            # Heartbeat'ten sonra oda state'i değiştiyse (seek / play) ölçüm bayat
+            if received_at < room.updated_at:
+                continue
 
-                # VOD duration clamp (sadece non-HLS, HLS duration güvenilmez)
-                if room.video_duration > 0 and room.video_format != "hls":
-                    safe_end = max(0.0, room.video_duration - 0.25)
-                    server_time = min(server_time, safe_end)
-                    
-                    # Video sonuna yakın ve süresi yeterli uzunsa correction yapma
-                    if room.video_duration >= 1.0 and server_time >= room.video_duration - 0.5:
-                        early_return = True
-                        should_check_hard_sync = False
-
-                if not early_return:
-                    # Seek sonrası 1sn drift ignore
-                    if now - room.last_seek_time < DEBOUNCE_WINDOW:
-                        user.last_client_time = client_time
-                        user.stall_count = 0
-                        early_return = True
-                        should_check_hard_sync = False
-
-                if not early_return:
-                    # Stall detection
-                    if abs(client_time - user.last_client_time) < 0.05:
-                        user.stall_count += 1
-                    else:
-                        user.stall_count = 0
-                    user.last_client_time = client_time
-
-                    drift = client_time - server_time
-
-                    # ============== SOFT SYNC (0.5s - 2.0s drift) ==============
-                    # Küçük drift'lerde playbackRate ile yumuşak senkronizasyon (Go backend ile uyumlu)
-                    if 0.5 < abs(drift) <= 2.0 and (now - user.last_sync_time) > 2.0:
-                        rate = 0.97 if drift > 0 else 1.03  # İlerde yavaşlat, geride hızlandır
-                        
-                        # Rate değişmediyse gönderme (spam önleme)
-                        if rate != user.last_rate_sent:
-                            user.last_sync_time = now
-                            user.last_rate_sent = rate
-                            ws = user.websocket
-                            payload = json.dumps({
-                                "type": "sync_correction",
-                                "rate": rate,
-                            }, ensure_ascii=False)
-                            should_check_hard_sync = False  # Soft sync gönderilecekse hard sync yapma
-                    
-        # Lock dışı gönderim (rate reset veya soft sync için)
-        if ws and payload:
-            try:
-                async with user.send_lock:
-                    await ws.send_text(payload)
-            except Exception:
-                # Send fail oldu - user muhtemelen kopmuş, flag at (ileride cleanup için)
-                user.last_send_failed_at = time.perf_counter()
-        
-        if early_return or not should_check_hard_sync:
-            return
+            # Heartbeat anındaki server time
+            server_time = room.current_time + (received_at - room.updated_at)
+
+            # VOD duration clamp (sadece non-HLS, HLS duration güvenilmez)
+            if room.video_duration > 0 and room.video_format != "hls":
+                safe_end = max(0.0, room.video_duration - 0.25)
+                server_time = min(server_time, safe_end)
+
+                # Video sonuna yakın ve süresi yeterli uzunsa correction yapma
+                if room.video_duration >= 1.0 and server_time >= room.video_duration - 0.5:
+                    continue
+
+            # Seek sonrası 1sn drift ignore
+            if received_at - room.last_seek_time < DEBOUNCE_WINDOW:
+                user.last_client_time = client_time
+                user.stall_count = 0
+                continue
+
+            # Stall detection
+            if abs(client_time - user.last_client_time) < 0.05:
+                user.stall_count += 1
+            else:
+                user.stall_count = 0
+            user.last_client_time = client_time
 
-        # ============== HARD SYNC (>3s drift veya stall) ==============
-        async with self._lock:
-            room = self.rooms.get(room_id)
-            if not room:
-                return
-            
-            user = room.users.get(user_id)
-            if not user:
-                return
-            
-            if not room.is_playing:
-                return
-            
-            server_time = room.current_time + (now - room.updated_at)
             drift = client_time - server_time
 
+            # ============== SOFT SYNC (0.5s - 2.0s drift) ==============
+            # Küçük drift'lerde playbackRate ile yumuşak senkronizasyon (Go backend ile uyumlu)
+            if 0.5 < abs(drift) <= 2.0 and (now - user.last_sync_time) > 2.0:
+                rate = 0.97 if drift > 0 else 1.03  # İlerde yavaşlat, geride hızlandır
+
+                # Rate değişmediyse gönderme (spam önleme)
+                if rate != user.last_rate_sent:
+                    user.last_sync_time = now
+                    user.last_rate_sent = rate
+                    corrections.append((user, self._sync_correction(user, rate), "sync_correction"))
+                    continue  # Soft sync gönderildiyse hard sync yapma
+
             # ============== HARD SYNC (>2s drift veya stall) ==============
             # Go backend ile uyumlu: Mobil ve web client'lar 1-1.5s'de hazır oluyor, 2s yeterli
             need_sync = (
                 (user.stall_count >= 2 and (now - user.last_sync_time) > 2.0) or
                 (abs(drift) > 2.0 and (now - user.last_sync_time) > 2.0)
             )
-            
             if not need_sync:
-                return
+                continue
 
             user.last_sync_time        = now
             user.last_rate_sent        = 1.0  # Hard sync sonrası rate reset
@@ -1051,28 +1044,42 @@ class WatchPartyManager:
             room.last_recovery_time    = now
             room.last_auto_resume_time = now
 
-            ws = user.websocket
-            payload = json.dumps({
-                "type"         : "sync",
-                "is_playing"   : True,
-                "current_time" : server_time,
-                "force_seek"   : True,
-                "triggered_by" : "System (Heartbeat Sync)"
-            }, ensure_ascii=False)
-        
-        # Lock dışı gönderim (hard sync için)
-        if ws and payload:
-            try:
-                async with user.send_lock:
-                    await ws.send_text(payload)
-            except Exception:
-                # Send fail oldu - user muhtemelen kopmuş, flag at (ileride cleanup için)
-                user.last_send_failed_at = time.perf_counter()
+            # Aynı tick'teki tüm hard sync'ler aynı canlı zamanı taşır - bir kez encode
+            if hard_sync is None:
+                hard_sync = codec.dumps({
+                    "type"         : "sync",
+                    "is_playing"   : True,
+                    "current_time" : room.current_time + (now - room.updated_at),
+                    "force_seek"   : True,
+                    "triggered_by" : "System (Heartbeat Sync)"
+                })
+            corrections.append((user, hard_sync, None))
+
+        return corrections
+
+    async def _sync_room(self, room_id: str):
+        """Oda sync tick'i: tek geçişte drift hesapla, düzeltmeleri toplu olarak kuyruklara ekle"""
+        async with self._room_lock(room_id) as room:
+            if not room:
+                return
+            corrections = self._sync_room_locked(room, time.perf_counter())
+
+        for user, payload, key in corrections:
+            user.outbox.put(payload, key)
+
+    async def _sync_loop(self):
+        """Periyodik sync tick (tüm odalar, SYNC_TICK_INTERVAL'de bir)"""
+        while True:
+            await asyncio.sleep(SYNC_TICK_INTERVAL)
+            for room_id in list(self.rooms.keys()):
+                try:
+                    await self._sync_room(room_id)
+                except Exception as hata:
+                    konsol.log(f"[red]Sync tick hatası:[/] {room_id} - {hata}")
 
     async def add_chat_message(self, room_id: str, username: str, avatar: str, message: str, reply_to: dict | None = None) -> ChatMessage | None:
         """Chat mesajı ekle (lock protected)"""
-        async with self._lock:
-            room = self.rooms.get(room_id)
+        async with self._room_lock(room_id) as room:
             if not room:
                 return None
 
@@ -1086,36 +1093,22 @@ class WatchPartyManager:
             return chat_msg
 
     async def broadcast_to_room(self, room_id: str, message: dict, exclude_user_id: str | None = None) -> None:
-        """Odadaki herkese mesaj gönder (parallel safe send with per-user lock)"""
+        """Odadaki herkese mesaj gönder (bir kez encode, kullanıcı kuyruklarına paylaşılarak eklenir)"""
         users = await self.get_room_users_map(room_id)
         if not users:
             return
 
-        message_str = json.dumps(message, ensure_ascii=False)
-        
-        # Helper: Safe send with timeout + per-user lock (concurrent send protection)
-        # timeout 0.8s - 0.5s çok agresif olabilir (mobil + GC)
-        async def _safe_send(user, msg, timeout=0.8):
-            try:
-                async with user.send_lock:
-                    await asyncio.wait_for(user.websocket.send_text(msg), timeout=timeout)
-            except Exception:
-                # Send fail oldu - user muhtemelen kopmuş, flag at (ileride cleanup için)
-                user.last_send_failed_at = time.perf_counter()
+        message_str = codec.dumps(message)
+        key         = coalesce_key(message)
 
-        tasks = []
         for user_id, user in users.items():
             if exclude_user_id and user_id == exclude_user_id:
                 continue
-            tasks.append(_safe_send(user, message_str))
-            
-        if tasks:
-            await asyncio.gather(*tasks, return_exceptions=True)
+            user.outbox.put(message_str, key)
 
     async def get_playback_snapshot(self, room_id: str) -> dict | None:
         """Playback state'ini atomic olarak oku"""
-        async with self._lock:
-            room = self.rooms.get(room_id)
+        async with self._room_lock(room_id) as room:
             if not room:
                 return None
             return {
@@ -1126,8 +1119,7 @@ class WatchPartyManager:
 
     async def get_room_users(self, room_id: str) -> list[dict]:
         """Odadaki kullanıcıları getir (lock protected)"""
-        async with self._lock:
-            room = self.rooms.get(room_id)
+        async with self._room_lock(room_id) as room:
             if not room:
                 return []
 
@@ -1143,8 +1135,7 @@ class WatchPartyManager:
 
     async def get_room_state(self, room_id: str) -> dict | None:
         """Odanın mevcut durumunu getir"""
-        async with self._lock:
-            room = self.rooms.get(room_id)
+        async with self._room_lock(room_id) as room:
             if not room:
                 return None
 
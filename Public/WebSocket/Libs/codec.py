@@ -0,0 +1,71 @@
+# Bu araç @keyiflerolsun tarafından | @KekikAkademi için yazılmıştır.
+
+import json
+
+class StdlibCodec:
+    """Standart kütüphane json (her ortamda çalışır)"""
+    name        = "json"
+    DecodeError = json.JSONDecodeError
+
+    @staticmethod
+    def dumps(data) -> str:
+        return json.dumps(data, ensure_ascii=False)
+
+    @staticmethod
+    def loads(raw: str | bytes):
+        return json.loads(raw)
+
+class OrjsonCodec:
+    """orjson (kuruluysa, `pip install orjson`) - encode / decode birkaç kat hızlı"""
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+
+        self._dumps      = orjson.dumps
+        self.loads       = orjson.loads
+        self.DecodeError = orjson.JSONDecodeError
+
+    def dumps(self, data) -> str:
+        try:
+            return self._dumps(data).decode()
+        except TypeError:
+            # orjson'un desteklemediği tipler (str olmayan anahtar vb.) için stdlib'e düş
+            return StdlibCodec.dumps(data)
+
+def _select_codec():
+    try:
+        return OrjsonCodec()
+    except ImportError:
+        return StdlibCodec()
+
+# WebSocket protokolünün kullandığı codec - tüm encode / decode buradan geçer
+codec = _select_codec()
+
+def fits_payload(raw: str, max_bytes: int) -> bool:
+    """
+    UTF-8 boyutu `max_bytes`'ı aşıyor mu? - çoğu mesajda encode etmeden karar verir
+    (karakter sayısı ≤ byte sayısı ≤ 4 x karakter sayısı)
+    """
+    if len(raw) > max_bytes:
+        return False
+
+    if len(raw) * 4 <= max_bytes:
+        return True
+
+    return len(raw.encode("utf-8")) <= max_bytes
+
+def pong_payload(ping_id=None) -> str:
+    """Pong cevabı - ping_id yoksa sabit payload, varsa sadece id encode edilir"""
+    if ping_id is None:
+        return PONG_PAYLOAD
+
+    return f'{{"type":"pong","_ping_id":{codec.dumps(ping_id)}}}'
+
+# Sabit (önceden encode edilmiş) payload'lar
+PONG_PAYLOAD = codec.dumps({"type": "pong"})
+
+SYNC_CORRECTION_PAYLOADS = {
+    rate: codec.dumps({"type": "sync_correction", "rate": rate})
+        for rate in (1.0, 0.97, 1.03)
+}
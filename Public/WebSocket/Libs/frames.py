@@ -0,0 +1,51 @@
+# Bu araç @keyiflerolsun tarafından | @KekikAkademi için yazılmıştır.
+
+import struct
+
+# ============== Binary Frame Protokolü (opsiyonel) ==============
+# Client `join` mesajında {"binary": BINARY_VERSION} gönderirse server room_state'te aynı alanla onaylar;
+# bundan sonra sık mesajlar binary (little-endian) frame olarak gider, diğerleri JSON kalır.
+#
+#   PING            client → server : u8 type | u32 ping_id | f64 current_time | u8 flags (bit0: syncing)  (14 byte)
+#   PONG            server → client : u8 type | u32 ping_id                                                (5 byte)
+#   SYNC_CORRECTION server → client : u8 type | f32 rate                                                   (5 byte)
+
+BINARY_VERSION = 1
+
+PING            = 0x01
+PONG            = 0x02
+SYNC_CORRECTION = 0x03
+
+FLAG_SYNCING = 0x01
+
+_PING            = struct.Struct("<BIdB")
+_PONG            = struct.Struct("<BI")
+_SYNC_CORRECTION = struct.Struct("<Bf")
+
+MAX_PING_ID = 0xFFFFFFFF
+
+def decode_frame(data: bytes) -> dict | None:
+    """Binary frame'i JSON mesajıyla aynı şekilde dict'e çevir (bilinmeyen / bozuk frame → None)"""
+    if len(data) == _PING.size and data[0] == PING:
+        _, ping_id, current_time, flags = _PING.unpack(data)
+        return {
+            "type"         : "ping",
+            "_ping_id"     : ping_id,
+            "current_time" : current_time,
+            "syncing"      : bool(flags & FLAG_SYNCING),
+        }
+
+    return None
+
+def encode_pong(ping_id) -> bytes | None:
+    """Binary pong (ping_id u32'ye sığmıyorsa None - JSON'a düşülür)"""
+    if not isinstance(ping_id, int) or not 0 <= ping_id <= MAX_PING_ID:
+        return None
+
+    return _PONG.pack(PONG, ping_id)
+
+# Sabit sync_correction frame'leri (codec.SYNC_CORRECTION_PAYLOADS'un binary karşılığı)
+SYNC_CORRECTION_FRAMES = {
+    rate: _SYNC_CORRECTION.pack(SYNC_CORRECTION, rate)
+        for rate in (1.0, 0.97, 1.03)
+}
@@ -3,7 +3,9 @@
 from fastapi            import WebSocket
 from .WatchPartyManager import watch_party_manager, DEBOUNCE_WINDOW, MIN_BUFFER_DURATION
 from .ytdlp_service     import ytdlp_extract_video_info
-import json, time, asyncio
+from .codec             import codec, pong_payload
+from .frames            import BINARY_VERSION, encode_pong
+import time, asyncio
 
 
 class MessageHandler:
@@ -16,23 +18,19 @@ class MessageHandler:
 
     async def send_error(self, message: str):
         """Hata mesajı gönder"""
-        payload = json.dumps({
+        await self.send_json({
             "type"    : "error",
             "message" : message
-        }, ensure_ascii=False)
-
-        if self.user:
-            async with self.user.send_lock:
-                await self.websocket.send_text(payload)
-        else:
-            await self.websocket.send_text(payload)
+        })
 
     async def send_json(self, data: dict):
         """JSON mesajı gönder"""
-        payload = json.dumps(data, ensure_ascii=False)
+        await self.send_payload(codec.dumps(data))
+
+    async def send_payload(self, payload: str | bytes):
+        """Encode edilmiş mesajı / binary frame'i gönder (odaya katıldıktan sonra broadcast'lerle aynı sırada, kullanıcı kuyruğu üzerinden)"""
         if self.user:
-            async with self.user.send_lock:
-                await self.websocket.send_text(payload)
+            self.user.outbox.put(payload)
         else:
             await self.websocket.send_text(payload)
 
@@ -47,6 +45,12 @@ class MessageHandler:
 
         if self.user:
             room_state = await watch_party_manager.get_room_state(self.room_id)
+
+            # Binary frame protokolü: client istediyse room_state'te aynı sürümle onayla
+            if message.get("binary") == BINARY_VERSION:
+                self.user.binary_frames = True
+                room_state["binary"]    = BINARY_VERSION
+
             await self.send_json({"type": "room_state", **room_state})
 
             await watch_party_manager.broadcast_to_room(self.room_id, {
@@ -328,11 +332,10 @@ class MessageHandler:
         """PING mesajını işle"""
         # Client'tan gelen _ping_id'yi geri döndür (RTT hesabı için)
         ping_id = message.get("_ping_id")
-        pong_response = {"type": "pong"}
-        if ping_id is not None:
-            pong_response["_ping_id"] = ping_id
-        
-        await self.send_json(pong_response)
+
+        # Binary protokolde 5 byte'lık pong, değilse sabit / önceden encode edilmiş JSON pong
+        pong = encode_pong(ping_id) if self.user and self.user.binary_frames else None
+        await self.send_payload(pong or pong_payload(ping_id))
 
         # Her zaman current_time gönderilir (video durmuşsa bile)
         if self.user:
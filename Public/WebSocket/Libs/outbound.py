@@ -0,0 +1,102 @@
+# Bu araç @keyiflerolsun tarafından | @KekikAkademi için yazılmıştır.
+
+from collections import deque
+import asyncio, time
+
+# Kuyrukta beklerken bayatlayan mesajlar - sadece en güncel olanı anlamlı
+COALESCE_TYPES = frozenset({"sync_correction", "typing"})
+
+def coalesce_key(message: dict) -> str | None:
+    """Birleştirilebilir mesajın anahtarı (typing kullanıcı bazlı), diğerleri için None"""
+    message_type = message.get("type")
+    if message_type not in COALESCE_TYPES:
+        return None
+
+    if message_type == "typing":
+        return f"typing:{message.get('username', '')}"
+
+    return message_type
+
+class OutboundQueue:
+    """
+    Kullanıcı başına giden mesaj kuyruğu
+    - Tek writer task mesajları sırayla gönderir; yavaş istemci sadece kendi kuyruğunu bekletir
+    - Payload bir kez encode edilip (str, binary frame ise bytes) tüm kuyruklara paylaşılarak eklenir
+    - Aynı anahtarlı bekleyen sync_correction / typing mesajı yenisiyle değiştirilir
+    - Kuyruk dolarsa önce birleştirilebilir mesajlar atılır; yine yer yoksa ya da gönderim
+      `send_timeout` içinde bitmezse kullanıcı kopmuş sayılır (last_send_failed_at → cleanup)
+    """
+
+    def __init__(self, user, max_size: int = 256, send_timeout: float = 5.0):
+        self.user         = user
+        self.max_size     = max_size
+        self.send_timeout = send_timeout
+
+        self.sent    = 0
+        self.dropped = 0
+        self.closed  = False
+
+        self._items : deque[tuple[str | None, str | bytes]] = deque()
+        self._event = asyncio.Event()
+        self._task  = None
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def _drop_first(self, predicate) -> bool:
+        for index, (key, _) in enumerate(self._items):
+            if predicate(key):
+                del self._items[index]
+                self.dropped += 1
+                return True
+        return False
+
+    def put(self, payload: str | bytes, key: str | None = None) -> bool:
+        """Encode edilmiş mesajı kuyruğa ekle (beklemez)"""
+        if self.closed:
+            return False
+
+        if key is not None:
+            self._drop_first(lambda k: k == key)
+
+        if len(self._items) >= self.max_size and not self._drop_first(lambda k: k is not None):
+            self.fail()
+            return False
+
+        self._items.append((key, payload))
+        self._event.set()
+        return True
+
+    async def _writer(self):
+        # Python 3.11 wait_for'u, gönderim aynı anda biterse iptali yutabilir - kapanış bayrağıyla da çıkılır
+        while not self.closed:
+            if not self._items:
+                self._event.clear()
+                await self._event.wait()
+                continue
+
+            _, payload = self._items.popleft()
+            send       = self.user.websocket.send_bytes if isinstance(payload, bytes) else self.user.websocket.send_text
+            try:
+                await asyncio.wait_for(send(payload), timeout=self.send_timeout)
+            except Exception:
+                self.fail()
+                return
+
+            self.sent += 1
+
+    def start(self):
+        if self._task is None and not self.closed:
+            self._task = asyncio.create_task(self._writer())
+
+    def fail(self):
+        """Gönderilemeyen kullanıcıyı kopmuş işaretle, kuyruğu kapat"""
+        self.user.last_send_failed_at = time.perf_counter()
+        self.close()
+
+    def close(self):
+        self.closed = True
+        self._items.clear()
+        self._event.set()
+        if self._task and not self._task.done() and self._task is not asyncio.current_task():
+            self._task.cancel()
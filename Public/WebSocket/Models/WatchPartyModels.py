@@ -16,12 +16,19 @@ class User:
     last_client_time  : float = 0.0  # Son heartbeat'teki client time
     stall_count       : int   = 0    # Ardışık stall sayısı
     last_sync_time    : float = 0.0  # Son force sync zamanı (spam önleme)
+    # Son heartbeat (sync tick'inde işlenir)
+    hb_client_time : float = 0.0    # Heartbeat'teki client time
+    hb_received_at : float = 0.0    # Heartbeat'in geldiği an (server perf_counter)
+    hb_syncing     : bool  = False  # Client senkronizasyon modunda mı
+    hb_pending     : bool  = False  # Son tick'ten beri yeni heartbeat var mı
     # Per-user buffer spam prevention
     last_buffer_trigger_time : float = 0.0   # Son buffer pause tetikleme zamanı
     buffer_trigger_count     : int   = 0     # Ardışık buffer tetikleme sayısı
     last_rate_sent           : float = 1.0   # Son gönderilen playback rate (spam önleme)
-    # Concurrent send protection
-    send_lock : asyncio.Lock = field(default_factory=asyncio.Lock, repr=False, compare=False)
+    # Binary frame protokolü (join'de anlaşılırsa ping / pong / sync_correction binary gider)
+    binary_frames : bool = False
+    # Giden mesaj kuyruğu + writer task (OutboundQueue, join'de atanır)
+    outbox : object | None = field(default=None, repr=False, compare=False)
     # Dead user tracking (send fail olunca set edilir, cleanup için)
     last_send_failed_at : float = 0.0
 
@@ -76,3 +83,7 @@ class Room:
     seek_sync_target_time    : float    = 0.0
     pending_seek_sync_task   : object | None = None  # asyncio.Task
 
+    # Oda bazlı lock (odalar birbirini beklemez) - silinen oda closed işaretlenir
+    lock   : asyncio.Lock = field(default_factory=asyncio.Lock, repr=False, compare=False)
+    closed : bool         = False
+
@@ -1,10 +1,12 @@
 # Bu araç @keyiflerolsun tarafından | @KekikAkademi için yazılmıştır.
 
-from CLI     import konsol
-from fastapi import WebSocket, WebSocketDisconnect
-from .       import wss_router
-from ..Libs  import MessageHandler
-import json, asyncio, time
+from CLI           import konsol
+from fastapi       import WebSocket, WebSocketDisconnect
+from .             import wss_router
+from ..Libs        import MessageHandler
+from ..Libs.codec  import codec, fits_payload
+from ..Libs.frames import decode_frame
+import asyncio, time
 
 @wss_router.websocket("/watch_party/{room_id}")
 async def watch_party_websocket(websocket: WebSocket, room_id: str):
@@ -51,19 +53,29 @@ async def watch_party_websocket(websocket: WebSocket, room_id: str):
 
     try:
         while True:
-            raw = await websocket.receive_text()
-            
-            # 1. Flood Control: Payload Size
-            if len(raw.encode("utf-8")) > MAX_PAYLOAD:
-                await handler.send_error("Mesaj boyutu çok büyük")
-                # İstersen disconnect et: break
-                continue
-            
-            try:
-                msg = json.loads(raw)
-            except json.JSONDecodeError:
-                await handler.send_error("Geçersiz JSON formatı")
-                continue
+            frame = await websocket.receive()
+            if frame["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(frame.get("code", 1000))
+
+            raw = frame.get("text")
+            if raw is None:
+                # Binary frame (ping) - bilinmeyen / bozuk frame sessizce atlanır
+                msg = decode_frame(frame.get("bytes") or b"")
+                if msg is None:
+                    continue
+            else:
+                # 1. Flood Control: Payload Size
+                # (çoğu mesajda UTF-8 encode etmeden karar verilir)
+                if not fits_payload(raw, MAX_PAYLOAD):
+                    await handler.send_error("Mesaj boyutu çok büyük")
+                    # İstersen disconnect et: break
+                    continue
+
+                try:
+                    msg = codec.loads(raw)
+                except codec.DecodeError:
+                    await handler.send_error("Geçersiz JSON formatı")
+                    continue
 
             t = msg.get("type")
             if not t:
@@ -26,7 +26,24 @@ SESSION_COOKIE  = f"{PROJE.lower()}_session"
 SESSION_MAX_AGE = int(os.getenv("SESSION_MAX_AGE", "86400"))
 
 PROXY_ENABLED = os.getenv("PROXY_ENABLED", "true").lower() == "true"
-AVAILABILITY_CHECK = os.getenv("AVAILABILITY_CHECK", "true").lower() == "true"
+PROXY_CACHE_MB          = int(os.getenv("PROXY_CACHE_MB", "128"))
+PROXY_CACHE_TTL         = int(os.getenv("PROXY_CACHE_TTL", "900"))
+PROXY_PREFETCH_SEGMENTS = int(os.getenv("PROXY_PREFETCH_SEGMENTS", "0"))
+PROXY_DISK_CACHE_DIR    = os.getenv("PROXY_DISK_CACHE_DIR", "")
+PROXY_DISK_CACHE_MB     = int(os.getenv("PROXY_DISK_CACHE_MB", "1024"))
+AVAILABILITY_CHECK    = os.getenv("AVAILABILITY_CHECK", "true").lower() == "true"
+HEALTH_CHECK_INTERVAL = int(os.getenv("HEALTH_CHECK_INTERVAL", "120"))
+
+# Eklenti ana sayfa ön ısıtma
+PREWARM_INTERVAL = int(os.getenv("PREWARM_INTERVAL", "0"))
+PREWARM_PAGES    = int(os.getenv("PREWARM_PAGES", "1"))
+PREWARM_JITTER   = float(os.getenv("PREWARM_JITTER", "0.1"))
+
+# Erişim logu IP konum çözümleme
+GEOIP_DB_PATH      = os.getenv("GEOIP_DB_PATH", "")
+GEOIP_CACHE_SIZE   = int(os.getenv("GEOIP_CACHE_SIZE", "50000"))
+GEOIP_CACHE_TTL    = int(os.getenv("GEOIP_CACHE_TTL", "86400"))
+GEOIP_NEGATIVE_TTL = int(os.getenv("GEOIP_NEGATIVE_TTL", "300"))
 
 # Servis URL'leri
 API_URL   = os.getenv("API_URL", "http://kekik_api:3310")
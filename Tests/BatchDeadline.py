@@ -0,0 +1,63 @@
+# Bu araç @keyiflerolsun tarafından | @KekikAkademi için yazılmıştır.
+
+# /api/v1/batch bütçe testi - yavaş işlemler isteğin kalan süresini aşınca middleware 504'ü yerine
+# biten sonuçlar + işlem bazlı zaman aşımı kayıtları dönmeli
+# Kullanım: python -m Tests.BatchDeadline
+
+from Kekik.cli import konsol
+from asyncio   import run, sleep, wait_for
+from time      import monotonic
+from types     import SimpleNamespace
+from Libs      import request_deadline
+from Core      import kekik_FastAPI  # Router'lar Core üzerinden yüklenir (doğrudan import döngüsel)
+from Public.API.v1.Libs          import plugin_manager
+from Public.API.v1.Routers.batch import batch, BATCH_MAX_CONCURRENT
+
+# Middleware'in istek timeout'unu taklit eden kısa bütçe (sn)
+ISTEK_TIMEOUT = 3.0
+
+class Item:
+    def __init__(self, url: str):
+        self.url = url
+
+class HizliEklenti:
+    name = "Hizli"
+
+    async def search(self, query: str):
+        return [Item(f"https://hizli.invalid/{query}")]
+
+class YavasEklenti:
+    name = "Yavas"
+
+    async def search(self, query: str):
+        await sleep(60)
+        return [Item(f"https://yavas.invalid/{query}")]
+
+async def main():
+    plugin_manager.plugins = {"Hizli": HizliEklenti(), "Yavas": YavasEklenti()}
+
+    # Hızlılar biter, yavaşlar tüm slotları bütçe sonuna kadar tutar, arkadakiler hiç başlayamaz
+    operations  = [{"plugin": "Hizli", "method": "search", "args": {"query": f"h{i}"}} for i in range(10)]
+    operations += [{"plugin": "Yavas", "method": "search", "args": {"query": f"y{i}"}} for i in range(BATCH_MAX_CONCURRENT * 2)]
+    request     = SimpleNamespace(state=SimpleNamespace(veri={"operations": operations}))
+
+    baslangic = monotonic()
+    token     = request_deadline.set(baslangic + ISTEK_TIMEOUT)
+    try:
+        cevap = await wait_for(batch(request), timeout=ISTEK_TIMEOUT)
+    finally:
+        request_deadline.reset(token)
+    gecen = monotonic() - baslangic
+
+    sonuclar = cevap["result"]
+    yavas    = [kayit for kayit in sonuclar if kayit["plugin"] == "Yavas"]
+    hizli    = [kayit for kayit in sonuclar if kayit["plugin"] == "Hizli"]
+
+    assert gecen < ISTEK_TIMEOUT, gecen
+    assert all(kayit.get("hata") == "Zaman Aşımı.." for kayit in yavas), yavas
+    assert all("result" in kayit for kayit in hizli), hizli
+
+    konsol.log(f"[green]{gecen:.2f} sn'de döndü[/] » [purple]{sum('result' in kayit for kayit in sonuclar)} sonuç, {sum('hata' in kayit for kayit in sonuclar)} zaman aşımı")
+
+if __name__ == "__main__":
+    run(main())
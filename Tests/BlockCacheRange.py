@@ -0,0 +1,74 @@
+# Bu araç @keyiflerolsun tarafından | @KekikAkademi için yazılmıştır.
+
+# Blok cache aralık testi - header'lar gönderildikten sonra sonraki bloğun origin isteği başarısız olursa
+# kısa body yerine RangeIncomplete fırlatılmalı ve meta unutulmalı (sonraki istekler düz proxy'ye düşer)
+# Kullanım: python -m Tests.BlockCacheRange
+
+from Kekik.cli import konsol
+from asyncio   import run
+from Libs      import proxy_request
+from Public.Proxy.Libs.block_cache import BlockCache, RangeIncomplete
+import httpx, os
+
+BLOCK_SIZE = 64 * 1024
+DATA       = os.urandom(BLOCK_SIZE * 3 + 1000)
+URL        = "https://cdn.invalid/film.mp4"
+
+def origin(istekler: list, bozuk_blok: int):
+    """`bozuk_blok`'tan başlayan Range isteklerine 503 dönen origin"""
+    def handler(request: httpx.Request) -> httpx.Response:
+        aralik = request.headers.get("range")
+        istekler.append(aralik)
+
+        start, end = (int(deger) for deger in aralik.removeprefix("bytes=").split("-"))
+        if start // BLOCK_SIZE >= bozuk_blok:
+            return httpx.Response(503)
+
+        return httpx.Response(206, content=DATA[start : end + 1], headers={"content-range": f"bytes {start}-{end}/{len(DATA)}"})
+    return handler
+
+async def akit(cache: BlockCache, start: int, end: int) -> bytes:
+    return b"".join([parca async for parca in cache.iter_range(URL, start, end, {})])
+
+async def main():
+    istekler = []
+    proxy_request._client = httpx.AsyncClient(transport=httpx.MockTransport(origin(istekler, bozuk_blok=1)))
+
+    cache = BlockCache(max_size_mb=16, block_size=BLOCK_SIZE)
+    cache.set_meta(URL, len(DATA), "video/mp4")
+
+    # İlk blok origin'den gelir ve cache'e yazılır
+    assert await akit(cache, 0, BLOCK_SIZE - 1) == DATA[:BLOCK_SIZE]
+
+    # İkinci bloğun isteği başarısız - ilk blok gönderilmiş olsa da akış hatayla kesilmeli
+    gelen = []
+    try:
+        async for parca in cache.iter_range(URL, 0, len(DATA) - 1, {}):
+            gelen.append(parca)
+    except RangeIncomplete as hata:
+        konsol.log(f"[yellow]{hata}")
+    else:
+        raise AssertionError("Kısa body sessizce bitti")
+
+    assert b"".join(gelen) == DATA[:BLOCK_SIZE]
+    assert cache.get_meta(URL) is None, "Meta unutulmadı"
+
+    # Origin kısa döndüğünde de aynı davranış
+    proxy_request._client = httpx.AsyncClient(transport=httpx.MockTransport(
+        lambda request: httpx.Response(206, content=DATA[:100], headers={"content-range": f"bytes 0-99/{len(DATA)}"})
+    ))
+    kisa = BlockCache(max_size_mb=16, block_size=BLOCK_SIZE)
+    kisa.set_meta(URL, len(DATA), "video/mp4")
+    try:
+        await akit(kisa, 0, BLOCK_SIZE - 1)
+    except RangeIncomplete:
+        pass
+    else:
+        raise AssertionError("Kısa origin cevabı sessizce bitti")
+    assert kisa.get_meta(URL) is None, "Meta unutulmadı"
+
+    await proxy_request.stop()
+    konsol.log(f"[green]Tamamlanamayan aralıklar hatayla kesildi, meta unutuldu[/] » [purple]{istekler}")
+
+if __name__ == "__main__":
+    run(main())
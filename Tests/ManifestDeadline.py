@@ -0,0 +1,46 @@
+# Bu araç @keyiflerolsun tarafından | @KekikAkademi için yazılmıştır.
+
+# Manifest revalidation bütçe testi - revalidation'ı başlatan isteğin süre bütçesi (request_deadline) biterse
+# aynı revalidation'ı bekleyen diğer izleyiciler hata almamalı
+# Kullanım: python -m Tests.ManifestDeadline
+
+from Kekik.cli import konsol
+from asyncio   import run, sleep, gather, create_task
+from time      import monotonic
+from Libs      import proxy_request, request_deadline
+from Public.Proxy.Libs.manifest_cache import ManifestCache
+import httpx
+
+MANIFEST = b"#EXTM3U\n#EXT-X-TARGETDURATION:4\n#EXTINF:4,\nseg-1.ts\n"
+
+async def yavas_origin(request: httpx.Request) -> httpx.Response:
+    await sleep(0.5)
+    return httpx.Response(200, content=MANIFEST)
+
+async def kisa_butceli(cache: ManifestCache, url: str, key: tuple):
+    """Revalidation'ı 0.1 sn bütçeyle başlatan istek"""
+    request_deadline.set(monotonic() + 0.1)
+    return await cache.fetch(url, {}, key)
+
+async def main():
+    proxy_request._client = httpx.AsyncClient(transport=httpx.MockTransport(yavas_origin))
+
+    cache = ManifestCache()
+    url   = "https://cdn.invalid/live/index.m3u8"
+    key   = (url, None, None)
+
+    ilk = create_task(kisa_butceli(cache, url, key))
+    await sleep(0.01)
+    diger = [create_task(cache.fetch(url, {}, key)) for _ in range(5)]
+
+    sonuclar = await gather(ilk, *diger, return_exceptions=True)
+    await proxy_request.stop()
+
+    hatalar = [sonuc for sonuc in sonuclar if isinstance(sonuc, BaseException)]
+    assert not hatalar, hatalar
+    assert all(status == 200 and content == MANIFEST for status, _, content in sonuclar)
+
+    konsol.log(f"[green]Başlatan isteğin bütçesi bitse de {len(sonuclar)} bekleyen manifest'i aldı")
+
+if __name__ == "__main__":
+    run(main())
@@ -0,0 +1,133 @@
+# Bu araç @keyiflerolsun tarafından | @KekikAkademi için yazılmıştır.
+
+# WatchPartyManager yük testi - oda bazlı lock ile eski tek global lock karşılaştırması
+# Heartbeat lock almadığı için (sadece kayıt) ölçülen işlemler lock alan play / pause / seek / chat + broadcast'tir.
+# "yavaş oda" senaryosunda bir odanın lock'u 100 ms'de bir 20 ms tutulur (await içeren uzun işlem);
+# global lock'ta tüm odalar bekler, oda lock'unda sadece o oda etkilenir - fark assert edilir
+# Kullanım: python -m Tests.WatchPartyLoad [oda_sayisi] [oda_basina_kullanici] [sure_sn]
+
+from Kekik.cli  import konsol
+from asyncio    import run, gather, sleep, create_task
+from contextlib import asynccontextmanager
+from time       import perf_counter
+from Public.WebSocket.Libs.WatchPartyManager import WatchPartyManager
+import sys
+
+class FakeWebSocket:
+    """Ağ gecikmesini taklit eden sahte WebSocket"""
+    def __init__(self):
+        self.sent = 0
+
+    async def send_text(self, data: str):
+        self.sent += 1
+        await sleep(0)
+
+class GlobalLockManager(WatchPartyManager):
+    """Eski davranış: tüm odalar tek global lock'u paylaşır"""
+    @asynccontextmanager
+    async def _room_lock(self, room_id: str):
+        async with self._lock:
+            room = self.rooms.get(room_id)
+            yield None if room is None or room.closed else room
+
+async def kilitli_islem(manager: WatchPartyManager, room_id: str, user_id: str, sayac: int):
+    """Oda lock'u alan işlemlerden sıradaki (play / pause / seek / chat + broadcast)"""
+    simdi = perf_counter()
+    match sayac % 4:
+        case 0:
+            await manager.update_playback_state(room_id, True, sayac / 30, now=simdi)
+            await manager.broadcast_to_room(room_id, {"type": "play", "current_time": sayac / 30})
+        case 1:
+            zaman = await manager.pause_now(room_id, simdi)
+            await manager.broadcast_to_room(room_id, {"type": "pause", "current_time": zaman})
+        case 2:
+            await manager.mark_seek_time(room_id, simdi)
+            await manager.broadcast_to_room(room_id, {"type": "seek", "current_time": sayac / 30})
+        case 3:
+            mesaj = await manager.add_chat_message(room_id, user_id, "", "selam")
+            await manager.broadcast_to_room(room_id, {"type": "chat", "message": mesaj.message if mesaj else ""})
+
+async def kullanici(manager: WatchPartyManager, room_id: str, user_id: str, bitis: float, sureler: list[float]):
+    """Saniyede ~30 ping (lock'suz) + ~10 kilitli işlem; sadece kilitli işlemlerin süresi ölçülür"""
+    sayac = 0
+    while perf_counter() < bitis:
+        sayac += 1
+
+        await manager.handle_heartbeat(room_id, user_id, client_time=sayac / 30)
+        if sayac % 3 == 0:
+            baslangic = perf_counter()
+            await kilitli_islem(manager, room_id, user_id, sayac // 3)
+            sureler.append(perf_counter() - baslangic)
+
+        await sleep(1 / 30)
+
+async def yavas_oda(manager: WatchPartyManager, room_id: str, bitis: float):
+    while perf_counter() < bitis:
+        async with manager._room_lock(room_id):
+            await sleep(0.02)
+        await sleep(0.1)
+
+async def senaryo(manager: WatchPartyManager, oda_sayisi: int, kullanici_sayisi: int, sure: float, yavas: bool) -> dict:
+    users = []
+    for oda in range(oda_sayisi):
+        room_id = f"oda{oda}"
+        for i in range(kullanici_sayisi):
+            user = await manager.join_room(room_id, FakeWebSocket(), f"u{i}", "")
+            users.append((room_id, user.user_id))
+        await manager.update_playback_state(room_id, True, 0.0)
+
+    sureler  = []
+    bitis    = perf_counter() + sure
+    gorevler = [
+        create_task(kullanici(manager, room_id, user_id, bitis, sureler))
+            for room_id, user_id in users
+                if not (yavas and room_id == "oda0")
+    ]
+    if yavas:
+        gorevler.append(create_task(yavas_oda(manager, "oda0", bitis)))
+    await gather(*gorevler)
+
+    sureler.sort()
+    return {
+        "islem" : len(sureler),
+        "ops"   : len(sureler) / sure,
+        "p50"   : sureler[len(sureler) // 2] * 1000,
+        "p99"   : sureler[int(len(sureler) * 0.99)] * 1000,
+    }
+
+async def kapat(manager: WatchPartyManager):
+    """Senaryo sonrası arka plan task'larını ve kullanıcı kuyruklarını kapat"""
+    gorevler = [task for task in (manager._cleanup_task, manager._sync_task) if task]
+    for room in manager.rooms.values():
+        for user in room.users.values():
+            if user.outbox._task:
+                gorevler.append(user.outbox._task)
+            user.outbox.close()
+    for task in gorevler:
+        task.cancel()
+    await gather(*gorevler, return_exceptions=True)
+
+async def main():
+    oda_sayisi       = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    kullanici_sayisi = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    sure             = float(sys.argv[3]) if len(sys.argv) > 3 else 5.0
+
+    konsol.log(f"[yellow]{oda_sayisi} oda x {kullanici_sayisi} kullanıcı, {sure:g} sn (kilitli işlem süreleri)")
+    sonuclar = {}
+    for yavas in (False, True):
+        for etiket, manager in (("global lock", GlobalLockManager()), ("oda lock'u", WatchPartyManager())):
+            sonuc = sonuclar[yavas, etiket] = await senaryo(manager, oda_sayisi, kullanici_sayisi, sure, yavas)
+            konsol.log(
+                f"[red]{'yavaş oda' if yavas else 'normal':<10} {etiket:<12}[/] » [purple]{sonuc['ops']:>9.0f} işlem/sn"
+                f" | p50 {sonuc['p50']:.3f} ms | p99 {sonuc['p99']:.3f} ms"
+            )
+            await kapat(manager)
+
+    # Yavaş odanın 20 ms'lik lock'u global lock'ta diğer odaların kilitli işlemlerini de bekletir
+    global_lock, oda_lock = sonuclar[True, "global lock"], sonuclar[True, "oda lock'u"]
+    assert global_lock["p99"] >= 5, f"Global lock'ta bekleme görülmedi: p99 {global_lock['p99']:.3f} ms"
+    assert oda_lock["p99"] * 4 < global_lock["p99"], f"Oda lock'u diğer odaları korumadı: p99 {oda_lock['p99']:.3f} ms / {global_lock['p99']:.3f} ms"
+    konsol.log(f"[green]Yavaş oda p99: global lock {global_lock['p99']:.1f} ms → oda lock'u {oda_lock['p99']:.3f} ms")
+
+if __name__ == "__main__":
+    run(main())
@@ -0,0 +1,80 @@
+# Bu araç @keyiflerolsun tarafından | @KekikAkademi için yazılmıştır.
+
+# WebSocket codec mikro benchmark - eski yol (stdlib json + UTF-8 encode ile boyut kontrolü + her pong'da dumps)
+# ile yeni yol (codec + fits_payload + sabit payload'lar) karşılaştırması
+# Kullanım: python -m Tests.WebSocketCodec [mesaj_sayisi]
+
+from Kekik.cli    import konsol
+from time         import perf_counter
+from Public.WebSocket.Libs.codec import codec, fits_payload, pong_payload, SYNC_CORRECTION_PAYLOADS
+import json, sys
+
+MAX_PAYLOAD = 512 * 1024
+
+# Gerçek trafikteki dağılıma yakın: çoğunluk ping, arada chat / seek
+GELEN = [
+    json.dumps({"type": "ping", "_ping_id": 12345, "current_time": 1234.5678, "syncing": False}),
+    json.dumps({"type": "ping", "_ping_id": 12346, "current_time": 1235.0123, "syncing": False}),
+    json.dumps({"type": "ping", "_ping_id": 12347, "current_time": 1235.5123, "syncing": True}),
+    json.dumps({"type": "chat", "message": "selam millet, başlıyor muyuz? 🎬", "reply_to": None}, ensure_ascii=False),
+    json.dumps({"type": "seek", "current_time": 1500.25}),
+]
+
+BROADCAST = {
+    "type"     : "user_joined",
+    "username" : "Misafir-ABCD",
+    "avatar"   : "🎬",
+    "user_id"  : "a1b2c3d4",
+    "users"    : [{"user_id": f"u{i}", "username": f"Kullanıcı {i}", "avatar": "🍿", "is_host": i == 0} for i in range(10)],
+}
+
+def eski_yol(n: int):
+    for i in range(n):
+        raw = GELEN[i % len(GELEN)]
+        if len(raw.encode("utf-8")) > MAX_PAYLOAD:
+            continue
+        msg = json.loads(raw)
+
+        if msg["type"] == "ping":
+            json.dumps({"type": "pong", "_ping_id": msg["_ping_id"]}, ensure_ascii=False)
+            if i % 20 == 0:
+                json.dumps({"type": "sync_correction", "rate": 1.0}, ensure_ascii=False)
+        else:
+            json.dumps(BROADCAST, ensure_ascii=False)
+
+def yeni_yol(n: int):
+    for i in range(n):
+        raw = GELEN[i % len(GELEN)]
+        if not fits_payload(raw, MAX_PAYLOAD):
+            continue
+        msg = codec.loads(raw)
+
+        if msg["type"] == "ping":
+            pong_payload(msg["_ping_id"])
+            if i % 20 == 0:
+                SYNC_CORRECTION_PAYLOADS[1.0]
+        else:
+            codec.dumps(BROADCAST)
+
+def olc(fn, n: int, tekrar: int = 5) -> float:
+    """En iyi tekrarın saniyedeki mesaj sayısı"""
+    en_iyi = float("inf")
+    for _ in range(tekrar):
+        baslangic = perf_counter()
+        fn(n)
+        en_iyi = min(en_iyi, perf_counter() - baslangic)
+    return n / en_iyi
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+
+    konsol.log(f"[yellow]codec: {codec.name} | {n} mesaj")
+    eski = olc(eski_yol, n)
+    yeni = olc(yeni_yol, n)
+
+    konsol.log(f"[red]stdlib json[/] » [purple]{eski:>12,.0f} mesaj/sn | 10k mesaj: {10_000 / eski * 1000:.1f} ms CPU")
+    konsol.log(f"[red]{codec.name:<11}[/] » [purple]{yeni:>12,.0f} mesaj/sn | 10k mesaj: {10_000 / yeni * 1000:.1f} ms CPU")
+    konsol.log(f"[green]Hızlanma » {yeni / eski:.2f}x")
+
+if __name__ == "__main__":
+    main()